@@ -140,6 +140,15 @@ class Canvas(Widget):
     def rect(self, x, y, width, height, path, **kwargs):
         path.addRect(x, y, x + width, y + height, Path.Direction.CW)
 
+    def polyline(self, points, closed, path, **kwargs):
+        if points:
+            coordinates = iter(points)
+            path.moveTo(next(coordinates), next(coordinates))
+            for x, y in zip(coordinates, coordinates):
+                path.lineTo(x, y)
+            if closed:
+                path.close()
+
     # Drawing Paths
 
     def fill(self, color, fill_rule, path, canvas, **kwargs):
@@ -196,6 +205,10 @@ class Canvas(Widget):
             paint.getFontSpacing() * len(sizes),
         )
 
+    def text_ascent(self, font):
+        # paint.ascent returns a negative number.
+        return -self._text_paint(font).ascent()
+
     def write_text(self, text, x, y, font, baseline, canvas, **kwargs):
         lines = text.splitlines()
         paint = self._text_paint(font)
@@ -10,6 +10,7 @@ class TableProbe(SimpleProbe):
     native_class = ScrollView
     supports_icons = False
     supports_keyboard_shortcuts = False
+    supports_lazy_rows = False
     supports_widgets = False
 
     def __init__(self, widget):
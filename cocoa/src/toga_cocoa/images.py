@@ -50,7 +50,11 @@ class Image:
                 else:
                     self._needs_release = True
             else:
+                # A native image may be shared by several images (e.g., when an image
+                # is copied), so each image holds its own reference.
                 self.native = raw
+                self.native.retain()
+                self._needs_release = True
         finally:
             # Calling `release` here disabled Rubicon's "release on delete" automation.
             # We therefore add an explicit `release` call in __del__ if the NSImage was
@@ -1,3 +1,6 @@
+import sys
+import traceback
+
 from rubicon.objc import SEL, at, objc_method, objc_property
 from travertino.size import at_least
 
@@ -163,6 +166,10 @@ class TogaTree(NSOutlineView):
     #             self.reloadData()
 
     # OutlineViewDelegate methods
+    @objc_method
+    def outlineView_shouldExpandItem_(self, tree, item) -> bool:
+        return self.impl._should_expand(item.attrs["node"])
+
     @objc_method
     def outlineViewSelectionDidChange_(self, notification) -> None:
         self.interface.on_select()
@@ -176,6 +183,10 @@ class TogaTree(NSOutlineView):
 
 class Tree(Widget):
     def create(self):
+        # Is a programmatic expansion in progress, and which node is being expanded?
+        self._expanding = False
+        self._expand_target = None
+
         # Create a tree view, and put it in a scroll view.
         # The scroll view is the _impl, because it's the outer container.
         self.native = NSScrollView.alloc().init()
@@ -220,6 +231,33 @@ class Tree(Widget):
         # Add the layout constraints
         self.add_constraints()
 
+    def _should_expand(self, node):
+        # Load the node's children (if required) before it is expanded. When the
+        # children have been loaded, they will be inserted into the expanded node.
+        if not getattr(node, "loaded", True):
+            if self._expanding and node is not self._expand_target:
+                # Don't expand the node, rather than showing it without children.
+                return False
+
+            try:
+                task = node.load_children()
+            except Exception as e:
+                print("Error loading children:", e, file=sys.stderr)
+                traceback.print_exc()
+                return False
+
+            if task:
+                task.add_done_callback(lambda task: self._children_loaded(node))
+
+        # Allow the item to expand
+        return True
+
+    def _children_loaded(self, node):
+        # If the load failed (or was cancelled), the node is still unloaded. Collapse
+        # it; expanding the node again will retry the load.
+        if not node.loaded:
+            self.native_tree.collapseItem(node_impl(node), collapseChildren=False)
+
     def change_source(self, source):
         self.native_tree.reloadData()
 
@@ -274,10 +312,21 @@ class Tree(Widget):
                 return None
 
     def expand_node(self, node):
-        self.native_tree.expandItem(node_impl(node), expandChildren=True)
+        # The children of the node are loaded, but not those of its descendants.
+        self._expanding = True
+        self._expand_target = node
+        try:
+            self.native_tree.expandItem(node_impl(node), expandChildren=True)
+        finally:
+            self._expanding = False
+            self._expand_target = None
 
     def expand_all(self):
-        self.native_tree.expandItem(None, expandChildren=True)
+        self._expanding = True
+        try:
+            self.native_tree.expandItem(None, expandChildren=True)
+        finally:
+            self._expanding = False
 
     def collapse_node(self, node):
         self.native_tree.collapseItem(node_impl(node), collapseChildren=True)
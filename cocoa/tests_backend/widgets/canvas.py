@@ -1,5 +1,6 @@
 from io import BytesIO
 
+import pytest
 from PIL import Image, ImageCms
 from rubicon.objc import NSPoint
 
@@ -41,6 +42,16 @@ class CanvasProbe(SimpleProbe):
         except KeyError:
             return image
 
+    def get_clipped_image(self, x, y, width, height):
+        pytest.skip("Partial redraws can't be captured on this backend")
+
+    # Text layouts aren't cached on this backend.
+    cached_text_layouts = None
+
+    def cached_layer(self, context):
+        # Cached contexts are drawn directly on this backend.
+        return None
+
     async def mouse_press(self, x, y):
         await self.mouse_event(
             NSEventType.LeftMouseDown,
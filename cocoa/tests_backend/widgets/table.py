@@ -14,6 +14,7 @@ class TableProbe(SimpleProbe):
     supports_icons = 2  # All columns
     supports_keyboard_shortcuts = True
     supports_keyboard_boundary_shortcuts = False
+    supports_lazy_rows = True
     supports_widgets = True
 
     def __init__(self, widget):
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+#
+# Compare the time taken to draw a canvas by recursively traversing its drawing
+# objects (as Canvas did before drawing instructions were compiled) with the time taken
+# to compile the instructions, and to replay the compiled instructions. Also measure
+# the cost of building the canvas, with and without the check that invalidates the
+# compiled instructions when a drawing object is modified.
+#
+# Run this script with the dummy backend:
+#
+#     TOGA_BACKEND=toga_dummy python benchmarks/canvas_draw.py
+import timeit
+
+import toga
+from toga.widgets.canvas import (
+    Context,
+    DrawingObject,
+    FillContext,
+    LineTo,
+    StrokeContext,
+)
+
+
+def build():
+    canvas = toga.Canvas()
+    with canvas.batch_redraw():
+        for i in range(50):
+            with canvas.Fill(color="red") as fill:
+                with fill.Stroke(color="blue") as stroke:
+                    for j in range(40):
+                        stroke.line_to(i, j)
+    return canvas
+
+
+canvas = build()
+context = canvas.context
+impl = canvas._impl
+
+
+# A copy of the recursive traversal that was used to draw a canvas before drawing
+# instructions were compiled. Every context copies the keyword arguments it inherits,
+# and every object passes them on to the backend.
+def legacy_draw(obj, impl, **kwargs):
+    LEGACY_DRAW[type(obj)](obj, impl, **kwargs)
+
+
+def legacy_context(self, impl, **kwargs):
+    impl.push_context(**kwargs)
+    for obj in self.drawing_objects:
+        legacy_draw(obj, impl, **kwargs)
+    impl.pop_context(**kwargs)
+
+
+def legacy_fill_context(self, impl, **kwargs):
+    impl.push_context(**kwargs)
+    impl.begin_path(**kwargs)
+    if self.x is not None and self.y is not None:
+        impl.move_to(x=self.x, y=self.y, **kwargs)
+
+    sub_kwargs = kwargs.copy()
+    sub_kwargs.update(fill_color=self.color, fill_rule=self.fill_rule)
+    for obj in self.drawing_objects:
+        legacy_draw(obj, impl, **sub_kwargs)
+
+    draw_kwargs = kwargs.copy()
+    draw_kwargs.update(fill_rule=self.fill_rule)
+    impl.fill(self.color, **draw_kwargs)
+
+    impl.pop_context(**kwargs)
+
+
+def legacy_stroke_context(self, impl, **kwargs):
+    impl.push_context(**kwargs)
+    impl.begin_path(**kwargs)
+
+    if self.x is not None and self.y is not None:
+        impl.move_to(x=self.x, y=self.y, **kwargs)
+
+    sub_kwargs = kwargs.copy()
+    sub_kwargs["stroke_color"] = self.color
+    sub_kwargs["line_width"] = self.line_width
+    sub_kwargs["line_dash"] = self.line_dash
+    for obj in self.drawing_objects:
+        legacy_draw(obj, impl, **sub_kwargs)
+
+    draw_kwargs = kwargs.copy()
+    draw_kwargs["line_width"] = self.line_width
+    draw_kwargs["line_dash"] = self.line_dash
+    impl.stroke(self.color, **draw_kwargs)
+
+    impl.pop_context(**kwargs)
+
+
+def legacy_line_to(self, impl, **kwargs):
+    impl.line_to(self.x, self.y, **kwargs)
+
+
+LEGACY_DRAW = {
+    Context: legacy_context,
+    FillContext: legacy_fill_context,
+    StrokeContext: legacy_stroke_context,
+    LineTo: legacy_line_to,
+}
+
+
+def traverse():
+    legacy_draw(context, impl, draw_instructions=[])
+
+
+def recompile():
+    # Discard the compiled instructions, so every draw compiles them again.
+    context._compiled = None
+    context._draw(impl, draw_instructions=[])
+
+
+def replay():
+    context._draw(impl, draw_instructions=[])
+
+
+# The instructions produced by both approaches must be the same.
+legacy, compiled = [], []
+legacy_draw(context, impl, draw_instructions=legacy)
+context._draw(impl, draw_instructions=compiled)
+assert legacy == compiled
+
+for name, fn in [("traverse", traverse), ("compile", recompile), ("replay", replay)]:
+    best = min(timeit.repeat(fn, number=10, repeat=7))
+    print(f"{name:>8}: {best / 10 * 1000:.2f} ms per draw")
+
+best = min(timeit.repeat(build, number=10, repeat=7))
+print(f"   build: {best / 10 * 1000:.2f} ms")
+
+# Build the canvas again without invalidation, to measure what it costs.
+setattr_ = DrawingObject.__setattr__
+DrawingObject.__setattr__ = object.__setattr__
+try:
+    best = min(timeit.repeat(build, number=10, repeat=7))
+finally:
+    DrawingObject.__setattr__ = setattr_
+print(f"   build: {best / 10 * 1000:.2f} ms without invalidation")
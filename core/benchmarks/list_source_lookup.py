@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+#
+# Compare the time taken to look up rows in list sources of different sizes. Finding
+# the index of a row, or finding a row using an indexed attribute, shouldn't depend on
+# the size of the source. Finding the next match after a row, among the half of the
+# rows that have an indexed value, should grow only logarithmically.
+#
+# Then measure the cost of looking up the last row after inserting a row at the end,
+# in the middle, or at the front of the source. The positions of the rows from the
+# insertion point onwards must be recomputed, so the cost of a lookup after inserting
+# at the front (or in the middle) grows linearly with the size of the source.
+import timeit
+
+from toga.sources import ListSource
+
+for size in [1_000, 10_000, 200_000]:
+    source = ListSource(
+        accessors=["value", "parity"],
+        data=[(i, i % 2) for i in range(size)],
+    )
+    source.add_index("value")
+    source.add_index("parity")
+    last = source[-1]
+    middle = source[size // 2 + 1]
+    source.index(last)
+    source.find(dict(parity=1))
+
+    index = min(timeit.repeat(lambda: source.index(last), number=1000, repeat=5))
+    find = min(timeit.repeat(lambda: source.find(last.value), number=1000, repeat=5))
+    find_next = min(
+        timeit.repeat(
+            lambda: source.find(dict(parity=1), start=middle), number=1000, repeat=5
+        )
+    )
+    print(
+        f"{size:>7} rows: index {index * 1000:.3f} µs, find {find * 1000:.3f} µs, "
+        f"find next {find_next * 1000:.3f} µs"
+    )
+
+print()
+for size in [1_000, 10_000, 200_000]:
+    source = ListSource(accessors=["value"], data=range(size))
+    last = source[-1]
+
+    def lookup_after_insert(position):
+        source.insert(position, -1)
+        source.index(last)
+        del source[position]
+
+    results = []
+    for name, position in [("end", size), ("middle", size // 2), ("front", 0)]:
+        best = min(
+            timeit.repeat(lambda: lookup_after_insert(position), number=20, repeat=5)
+        )
+        results.append(f"{name} {best / 20 * 1_000_000:.1f} µs")
+    print(f"{size:>7} rows: insert then index at " + ", ".join(results))
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import importlib.metadata
+import os
 import sys
 import warnings
-from collections.abc import Coroutine, Iterator
+from collections.abc import Callable, Coroutine, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -16,6 +18,7 @@ from toga.icons import Icon
 from toga.paths import Paths
 from toga.platform import get_platform_factory
 from toga.statusicons import StatusIconSet
+from toga.widgets.base import _batch_refresh
 from toga.window import MainWindow, Window, WindowSet
 
 if TYPE_CHECKING:
@@ -23,6 +26,7 @@ if TYPE_CHECKING:
     from toga.hardware.camera import Camera
     from toga.hardware.location import Location
     from toga.icons import IconContentT
+    from toga.jobs import Job, OnProgressHandler
     from toga.screens import Screen
     from toga.widgets.base import Widget
 
@@ -130,6 +134,10 @@ class WidgetRegistry:
         del self._registry[id]
 
 
+# The maximum number of worker threads that will be used to run threaded handlers.
+MAX_HANDLER_WORKERS = 8
+
+
 class App:
     #: The currently running :class:`~toga.App`. Since there can only be one running
     #: Toga app in a process, this is available as a class property via
@@ -228,6 +236,17 @@ class App:
         # Initialize empty widgets registry
         self._widgets = WidgetRegistry()
 
+        # No widget refreshes are being deferred
+        self._refresh_batch = None
+
+        # The thread pool for threaded handlers, and the process pool for jobs, are
+        # created on first use.
+        self._executor = None
+        self._jobs = None
+
+        # Generator handlers release control after every iteration by default.
+        self._handler_time_budget = 0.0
+
         # Keep an accessible copy of the app singleton instance
         App.app = self
 
@@ -467,6 +486,12 @@ class App:
         This *does not* invoke the ``on_exit`` handler; the app will be immediately
         and unconditionally closed.
         """
+        # Don't start any threaded handlers or jobs that haven't started running yet.
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._jobs is not None:
+            self._jobs.shutdown()
+            self._jobs = None
         self._impl.exit()
 
     @property
@@ -476,6 +501,121 @@ class App:
         thread (read-only)."""
         return self._impl.loop
 
+    @property
+    def handler_time_budget(self) -> float:
+        """The time (in seconds) that a generator handler can run before it must
+        release control to the event loop.
+
+        Each time a generator handler yields without a delay, Toga checks how long the
+        handler has been running since it last released control. If the handler hasn't
+        used its budget, it is resumed immediately; otherwise, the event loop is given
+        an opportunity to process events and redraw the GUI before the handler is
+        resumed.
+
+        The default budget of 0 releases control every time a generator handler
+        yields. A budget of a few milliseconds (e.g., ``0.008``) allows handlers that
+        yield after every small unit of work to make much faster progress, while still
+        keeping the app responsive. A budget only affects handlers that start after it
+        has been set.
+        """
+        return self._handler_time_budget
+
+    @handler_time_budget.setter
+    def handler_time_budget(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("handler_time_budget must be a non-negative number")
+        self._handler_time_budget = float(value)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The pool of worker threads used to run :func:`threaded handlers
+        <toga.handlers.threaded_handler>` (read-only).
+
+        The pool is created the first time it is used, and will use at most 8 threads.
+        It can also be used to run other blocking operations without blocking the
+        event loop::
+
+            result = await app.loop.run_in_executor(app.executor, blocking_function)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(MAX_HANDLER_WORKERS, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="toga-handler",
+            )
+        return self._executor
+
+    def call_soon_main(self, callback: Callable[..., object], *args: object) -> Future:
+        """Invoke a callback on the app's event loop.
+
+        This method can be safely called from any thread. It is the mechanism that a
+        :func:`threaded handler <toga.handlers.threaded_handler>` (or any other worker
+        thread) should use to update the app's GUI, as widgets can only be safely
+        modified on the thread that runs the event loop.
+
+        The callback will be invoked on the next iteration of the event loop, even if
+        this method is invoked on the event loop's thread.
+
+        :param callback: The callable to invoke on the event loop.
+        :param args: Positional arguments to pass to the callback.
+        :returns: A :class:`concurrent.futures.Future` that will resolve to the value
+            returned by the callback (or the exception it raised). A worker thread can
+            wait on the future to find out when the callback has completed; the event
+            loop's thread must *not* wait on the future, as it would never complete.
+        """
+        future = Future()
+
+        def _call() -> None:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(callback(*args))
+                except Exception as e:
+                    future.set_exception(e)
+
+        self.loop.call_soon_threadsafe(_call)
+        return future
+
+    def run_job(
+        self,
+        fn: Callable[..., object],
+        /,
+        *args: object,
+        on_progress: OnProgressHandler | None = None,
+        **kwargs: object,
+    ) -> Job:
+        """Run a function in a worker process.
+
+        A CPU-intensive operation (such as processing an image, or generating a
+        report) will prevent the app from responding, even if it is run on a worker
+        thread. A job runs in a separate process, so it doesn't compete with the app
+        for the Python interpreter.
+
+        The function, its arguments and its return value must all be picklable; in
+        particular, the function must be defined at the top level of a module. The
+        function can report progress to the app by invoking
+        :func:`~toga.jobs.report_progress`.
+
+        Worker processes are started by running a new copy of the Python interpreter.
+        This isn't possible on Android, iOS or the web, or in an app that has been
+        bundled as a standalone binary (see :attr:`is_bundled`); on those platforms,
+        jobs are run on worker threads instead. A job will still run to completion,
+        and can report progress and be cancelled, but it won't run in parallel with
+        the app.
+
+        :param fn: The function to run.
+        :param args: Positional arguments to pass to the function.
+        :param on_progress: A handler that will be invoked on the app's event loop
+            each time the job reports progress.
+        :param kwargs: Keyword arguments to pass to the function.
+        :returns: The :class:`~toga.jobs.Job` that is running the function. The job
+            can be awaited to obtain the value returned by the function.
+        """
+        if self._jobs is None:
+            from toga.jobs import _JobRunner, _use_worker_processes
+
+            self._jobs = _JobRunner(self, processes=_use_worker_processes(self))
+
+        return self._jobs.submit(fn, args, kwargs, on_progress)
+
     def main_loop(self) -> None:
         """Start the application.
 
@@ -785,6 +925,15 @@ class App:
         """
         return self._widgets
 
+    def batch_refresh(self) -> Iterator[None]:
+        """Obtain a context manager that defers refreshes of all widgets in the app
+        until the end of the block.
+
+        This behaves in the same way as :meth:`toga.Widget.batch_refresh`, but applies
+        to every widget in every window of the app.
+        """
+        return _batch_refresh(self)
+
     @property
     def windows(self) -> WindowSet:
         """The windows managed by the app. Windows are automatically added to the app
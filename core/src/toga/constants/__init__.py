@@ -26,6 +26,17 @@ class FillRule(Enum):
     NONZERO = 1
 
 
+class PixelFormat(Enum):
+    """The layout of raw pixel data."""
+
+    #: 4 bytes per pixel, in red, green, blue, alpha order. Alpha is not premultiplied.
+    RGBA = auto()
+    #: 32 bits per pixel, as native-endian integers with alpha in the high byte,
+    #: followed by red, green and blue. Color values are premultiplied by alpha. This
+    #: is the native format of Cairo image surfaces.
+    ARGB32 = auto()
+
+
 ##########################################################################
 # Camera
 ##########################################################################
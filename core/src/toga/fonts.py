@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, NamedTuple
 
 # Use the Travertino font definitions as-is
 from travertino import constants
@@ -31,6 +33,66 @@ FONT_VARIANTS = {NORMAL, SMALL_CAPS}
 
 _REGISTERED_FONT_CACHE: dict[tuple[str, str, str, str], str] = {}
 
+# The maximum number of font implementations that will be retained for reuse.
+FONT_CACHE_SIZE = 256
+
+
+class FontCacheInfo(NamedTuple):
+    """Statistics describing the effectiveness of the font cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _FontCache:
+    """A bounded, least-recently-used cache of font implementations.
+
+    Fonts with the same descriptor share a single implementation (and, therefore, a
+    single native font object). As a Font can be modified, the shared implementation
+    is created from an immutable description of the font, rather than from the Font
+    that was the first to use it.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._impls: OrderedDict[_FontDescription, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def impl(self, font: Font) -> Any:
+        key = _FontDescription(
+            font.family, font.size, font.weight, font.style, font.variant
+        )
+        try:
+            impl = self._impls[key]
+        except KeyError:
+            self.misses += 1
+            impl = font.factory.Font(key)
+            self._impls[key] = impl
+            if len(self._impls) > self.maxsize:
+                self._impls.popitem(last=False)
+        else:
+            self.hits += 1
+            self._impls.move_to_end(key)
+        return impl
+
+    def discard_family(self, family: str) -> None:
+        for key in [key for key in self._impls if key.family == family]:
+            del self._impls[key]
+
+    def info(self) -> FontCacheInfo:
+        return FontCacheInfo(self.hits, self.misses, self.maxsize, len(self._impls))
+
+    def clear(self) -> None:
+        self._impls.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_FONT_CACHE = _FontCache(FONT_CACHE_SIZE)
+
 
 class Font(BaseFont):
     def __init__(
@@ -56,7 +118,7 @@ class Font(BaseFont):
         """
         super().__init__(family, size, weight=weight, style=style, variant=variant)
         self.factory = get_platform_factory()
-        self._impl = self.factory.Font(self)
+        self._impl = _FONT_CACHE.impl(self)
 
     def __str__(self) -> str:
         size = (
@@ -92,6 +154,28 @@ class Font(BaseFont):
         font_key = Font._registered_font_key(family, weight, style, variant)
         _REGISTERED_FONT_CACHE[font_key] = str(toga.App.app.paths.app / path)
 
+        # Any existing implementation of the family was created without the
+        # registered font file.
+        _FONT_CACHE.discard_family(family)
+
+    @staticmethod
+    def cache_info() -> FontCacheInfo:
+        """Report statistics about the cache of font implementations.
+
+        Fonts with the same family, size, weight, style and variant share a single
+        implementation. The cache retains a bounded number of the most recently used
+        implementations.
+
+        :returns: The number of cache hits and misses, the maximum size of the
+            cache, and the number of implementations currently in the cache.
+        """
+        return _FONT_CACHE.info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the cache of font implementations, and reset its statistics."""
+        _FONT_CACHE.clear()
+
     @staticmethod
     def _registered_font_key(
         family: str,
@@ -107,3 +191,20 @@ class Font(BaseFont):
             variant = NORMAL
 
         return family, weight, style, variant
+
+
+class _FontDescription(NamedTuple):
+    """An immutable description of a font.
+
+    This is the interface of a shared font implementation; it provides the parts of
+    the Font API that are used by backends.
+    """
+
+    family: str
+    size: int
+    weight: str
+    style: str
+    variant: str
+
+    __str__ = Font.__str__
+    _registered_font_key = staticmethod(Font._registered_font_key)
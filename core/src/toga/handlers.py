@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
 import inspect
 import sys
+import time
 import traceback
 import warnings
 from abc import ABC
@@ -39,12 +42,24 @@ async def long_running_task(
     generator: HandlerGeneratorReturnT[object],
     cleanup: HandlerSyncT | None,
 ) -> object | None:
-    """Run a generator as an asynchronous coroutine."""
+    """Run a generator as an asynchronous coroutine.
+
+    If the generator yields a delay, control is released to the event loop for that
+    duration. If the generator yields without a delay, control is released to the
+    event loop once the generator has used the app's
+    :attr:`~toga.App.handler_time_budget`.
+    """
+    from toga import App
+
+    budget = App.app.handler_time_budget if App.app else 0.0
     try:
         try:
+            resumed = time.perf_counter()
             while True:
                 delay = next(generator)
-                await asyncio.sleep(delay if delay else 0)
+                if delay or time.perf_counter() - resumed >= budget:
+                    await asyncio.sleep(delay if delay else 0)
+                    resumed = time.perf_counter()
         except StopIteration as e:
             result = e.value
     except Exception as e:
@@ -82,6 +97,304 @@ async def handler_with_cleanup(
         return result
 
 
+async def handler_in_thread(
+    handler: HandlerSyncT,
+    cleanup: HandlerSyncT | None,
+    interface: object,
+    *args: object,
+    **kwargs: object,
+) -> object | None:
+    """Run a synchronous handler on the app's thread pool."""
+    from toga import App
+
+    try:
+        result = await App.app.loop.run_in_executor(
+            App.app.executor,
+            functools.partial(handler, interface, *args, **kwargs),
+        )
+    except Exception as e:
+        print("Error in threaded handler:", e, file=sys.stderr)
+        traceback.print_exc()
+    else:
+        if cleanup:
+            try:
+                cleanup(interface, result)
+            except Exception as e:
+                print("Error in threaded handler cleanup:", e, file=sys.stderr)
+                traceback.print_exc()
+        return result
+
+
+class _HandlerWrapper:
+    def __init__(self, handler: HandlerT):
+        """A handler that has been wrapped to change how it is invoked.
+
+        The wrapper can be invoked like the original handler. When it is used to
+        decorate a method, accessing the method on an instance produces a wrapper
+        around the bound method, so the original function is never modified.
+        """
+        self.handler = handler
+        functools.update_wrapper(self, handler, updated=())
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        return self.handler(*args, **kwargs)
+
+    def __get__(self, instance: object, owner: type | None = None) -> object:
+        # Callables that aren't descriptors (e.g., a partial) can't be bound.
+        if instance is None or not hasattr(self.handler, "__get__"):
+            return self
+
+        bound = copy.copy(self)
+        bound.handler = bound.__wrapped__ = self.handler.__get__(instance, owner)
+        return bound
+
+
+def _unwrap(handler: object) -> object:
+    """Return the handler contained by any handler wrappers."""
+    while isinstance(handler, _HandlerWrapper):
+        handler = handler.handler
+    return handler
+
+
+class _ThreadedHandler(_HandlerWrapper):
+    pass
+
+
+def threaded_handler(fn: T) -> T:
+    """Mark a synchronous handler so that it is invoked on a worker thread.
+
+    A handler that performs a slow, blocking operation (such as reading a large file,
+    or querying a database) will block the app's event loop, preventing the GUI from
+    responding until the handler completes. When a handler is marked as threaded, it
+    will be invoked on the app's :attr:`~toga.App.executor`, and the value it returns
+    will be passed to the handler's cleanup method on the app's event loop.
+
+    A threaded handler *must not* modify widgets directly. Any GUI updates should be
+    passed back to the event loop with :meth:`~toga.App.call_soon_main`.
+
+    This can be used as a decorator on a function or method, or applied to an
+    existing callable (such as a bound method)::
+
+        button = toga.Button("Import", on_press=threaded_handler(self.import_data))
+
+    :param fn: The synchronous handler to run on a worker thread.
+    :returns: A wrapper around the handler, marking it to be invoked on a worker
+        thread. The original handler is not modified.
+    :raises ValueError: If the handler is a coroutine or a generator.
+    """
+    inner = _unwrap(fn)
+    if inspect.iscoroutinefunction(inner) or inspect.isgeneratorfunction(inner):
+        raise ValueError("Only synchronous handlers can be run on a worker thread")
+
+    return _ThreadedHandler(fn)
+
+
+class HandlerPolicy:
+    def __init__(
+        self,
+        name: str,
+        wrap: Callable[[Callable[..., object]], Callable[..., object]],
+    ):
+        """A policy controlling when a handler is invoked.
+
+        Policies should be applied with :func:`debounce`, :func:`throttle`,
+        :func:`coalesce` or :func:`switch_latest`, rather than being instantiated
+        directly.
+
+        :param name: A description of the policy.
+        :param wrap: A callable that accepts a function that invokes the handler, and
+            returns a function that applies the policy to each invocation. It is called
+            each time the handler is installed, so every installed copy of the handler
+            has its own state.
+
+        Policies can be combined. Each policy controls when the policy applied inside
+        it is invoked; for example, a handler that is debounced, and cancels the
+        previous invocation when it is invoked, would be declared as::
+
+            @debounce(0.3)
+            @switch_latest
+            async def on_change(widget, **kwargs):
+                ...
+        """
+        self.name = name
+        self.wrap = wrap
+
+    def __repr__(self) -> str:
+        return f"<HandlerPolicy {self.name}>"
+
+
+class _PolicyHandler(_HandlerWrapper):
+    def __init__(self, handler: HandlerT, policy: HandlerPolicy):
+        super().__init__(handler)
+        self.policy = policy
+
+
+def _apply_policy(fn: T, policy: HandlerPolicy) -> T:
+    return _PolicyHandler(fn, policy)
+
+
+def _validate_interval(name: str, value: float) -> None:
+    if value < 0:
+        raise ValueError(f"{name} must be a non-negative number")
+
+
+def debounce(delay: float) -> Callable[[T], T]:
+    """Only invoke a handler once its events have stopped arriving.
+
+    Each time the handler's event occurs, a timer is restarted. The handler is invoked
+    (with the arguments of the most recent event) when ``delay`` seconds have passed
+    without another event - for example, to perform a search once the user has
+    stopped typing::
+
+        @debounce(0.3)
+        def on_change(widget, **kwargs):
+            results.data = search(widget.value)
+
+    :param delay: The time (in seconds) that must pass without an event before the
+        handler is invoked.
+    :returns: A decorator that wraps a handler in the policy. The original handler
+        is not modified, so the decorator can also be applied to a bound method.
+    """
+    _validate_interval("delay", delay)
+
+    def _wrap(invoke: Callable[..., object]) -> Callable[..., object]:
+        timer = None
+
+        def _handler(*args: object, **kwargs: object) -> None:
+            nonlocal timer
+            if timer:
+                timer.cancel()
+            timer = asyncio.get_event_loop().call_later(
+                delay, functools.partial(invoke, *args, **kwargs)
+            )
+
+        return _handler
+
+    return functools.partial(_apply_policy, policy=HandlerPolicy("debounce", _wrap))
+
+
+def throttle(interval: float) -> Callable[[T], T]:
+    """Invoke a handler at most once every ``interval`` seconds.
+
+    The first event invokes the handler immediately. Any events that occur in the
+    following ``interval`` seconds are combined into a single invocation (with the
+    arguments of the most recent event) at the end of the interval. This guarantees
+    that the handler sees the final event, while capping the rate at which the
+    handler is invoked::
+
+        @throttle(0.1)
+        def on_change(slider, **kwargs):
+            preview.image = render(slider.value)
+
+    :param interval: The minimum time (in seconds) between invocations of the handler.
+    :returns: A decorator that wraps a handler in the policy. The original handler
+        is not modified, so the decorator can also be applied to a bound method.
+    """
+    _validate_interval("interval", interval)
+
+    def _wrap(invoke: Callable[..., object]) -> Callable[..., object]:
+        last = None
+        pending = None
+        latest: tuple[tuple, dict] = ((), {})
+
+        def _fire() -> None:
+            nonlocal last, pending
+            pending = None
+            last = asyncio.get_event_loop().time()
+            args, kwargs = latest
+            invoke(*args, **kwargs)
+
+        def _handler(*args: object, **kwargs: object) -> object:
+            nonlocal last, pending, latest
+            latest = (args, kwargs)
+            if pending is None:
+                loop = asyncio.get_event_loop()
+                if last is None or loop.time() - last >= interval:
+                    last = loop.time()
+                    return invoke(*args, **kwargs)
+                pending = loop.call_at(last + interval, _fire)
+            return None
+
+        return _handler
+
+    return functools.partial(_apply_policy, policy=HandlerPolicy("throttle", _wrap))
+
+
+def coalesce(fn: T) -> T:
+    """Combine all the events that occur in one iteration of the event loop into a
+    single invocation of a handler.
+
+    The handler is invoked on the next iteration of the event loop, with the arguments
+    of the most recent event. This avoids repeating work when a single change causes
+    several events - for example, when a program updates several widgets that share a
+    handler.
+
+    :param fn: The handler to apply the policy to.
+    :returns: A wrapper around the handler that applies the policy. The original
+        handler is not modified.
+    """
+
+    def _wrap(invoke: Callable[..., object]) -> Callable[..., object]:
+        pending = None
+        latest: tuple[tuple, dict] = ((), {})
+
+        def _fire() -> None:
+            nonlocal pending
+            pending = None
+            args, kwargs = latest
+            invoke(*args, **kwargs)
+
+        def _handler(*args: object, **kwargs: object) -> None:
+            nonlocal pending, latest
+            latest = (args, kwargs)
+            if pending is None:
+                pending = asyncio.get_event_loop().call_soon(_fire)
+
+        return _handler
+
+    return _apply_policy(fn, HandlerPolicy("coalesce", _wrap))
+
+
+def switch_latest(fn: T) -> T:
+    """Cancel the previous invocation of an asynchronous handler when the handler is
+    invoked again.
+
+    Normally, if an event occurs while the coroutine (or generator) handling the
+    previous event is still running, both invocations continue to run, and their
+    results can be applied in any order. With this policy, only the most recent
+    invocation is allowed to continue; any invocation that is still running is
+    cancelled, so it won't apply a stale result::
+
+        @switch_latest
+        async def on_change(widget, **kwargs):
+            results.data = await search_server(widget.value)
+
+    A cancelled invocation doesn't invoke the handler's cleanup method. A
+    :func:`threaded handler <threaded_handler>` that has started running on a worker
+    thread can't be interrupted, but its result will be discarded.
+
+    :param fn: The handler to apply the policy to.
+    :returns: A wrapper around the handler that applies the policy. The original
+        handler is not modified.
+    """
+
+    def _wrap(invoke: Callable[..., object]) -> Callable[..., object]:
+        current = None
+
+        def _handler(*args: object, **kwargs: object) -> object:
+            nonlocal current
+            if current is not None:
+                current.cancel()
+
+            result = invoke(*args, **kwargs)
+            current = result if isinstance(result, asyncio.Future) else None
+            return result
+
+        return _handler
+
+    return _apply_policy(fn, HandlerPolicy("switch latest", _wrap))
+
+
 def simple_handler(fn: T, *args: object, **kwargs: object) -> T:
     """Wrap a function (with args and kwargs) so it can be used as a command handler.
 
@@ -132,6 +445,13 @@ def wrapped_handler(
 
     If the handler is a coroutine, install it on the asynchronous event loop.
 
+    If the handler has been marked with :func:`threaded_handler`, invoke it on the
+    app's thread pool, and return a future that resolves to the result.
+
+    If the handler has been wrapped in one or more :class:`HandlerPolicy` (such as
+    :func:`debounce`), the policies decide when the handler is invoked. An invocation
+    that is deferred by a policy returns ``None``.
+
     Returns either the native handler, or a wrapped function that will invoke the
     handler, using the interface as context. If a non-native handler, the wrapper
     function is annotated with the original handler function on the `_raw` attribute.
@@ -140,14 +460,30 @@ def wrapped_handler(
         if isinstance(handler, NativeHandler):
             return handler.native
 
+        # Remove any wrappers that change how the handler is invoked. Policies are
+        # collected from the outermost to the innermost.
+        fn = handler
+        threaded = False
+        policies = []
+        while isinstance(fn, _HandlerWrapper):
+            if isinstance(fn, _PolicyHandler):
+                policies.append(fn.policy)
+            else:
+                threaded = True
+            fn = fn.handler
+
         def _handler(*args: object, **kwargs: object) -> object:
-            if asyncio.iscoroutinefunction(handler):
+            if asyncio.iscoroutinefunction(fn):
                 return asyncio.ensure_future(
-                    handler_with_cleanup(handler, cleanup, interface, *args, **kwargs)
+                    handler_with_cleanup(fn, cleanup, interface, *args, **kwargs)
+                )
+            elif threaded:
+                return asyncio.ensure_future(
+                    handler_in_thread(fn, cleanup, interface, *args, **kwargs)
                 )
             else:
                 try:
-                    result = handler(interface, *args, **kwargs)
+                    result = fn(interface, *args, **kwargs)
                 except Exception as e:
                     print("Error in handler:", e, file=sys.stderr)
                     traceback.print_exc()
@@ -166,6 +502,9 @@ def wrapped_handler(
                             traceback.print_exc()
                     return result
 
+        for policy in reversed(policies):
+            _handler = policy.wrap(_handler)
+
         _handler._raw = handler
 
     else:
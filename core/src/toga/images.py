@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import os
 import sys
 import warnings
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 from warnings import warn
 
 import toga
+from toga.constants import PixelFormat
 from toga.platform import entry_points, get_platform_factory
 
 # Make sure deprecation warnings are shown by default
@@ -70,9 +74,177 @@ class ImageConverter(Protocol):
         :returns: The image, as an instance of the image class specified.
         """
 
+    @staticmethod
+    def convert_to_pixels(image_in_format: ExternalImageT) -> PixelBuffer | None:
+        """Convert from :any:`image_class` to raw pixels.
+
+        This method is optional. If it is provided (and the backend supports raw pixel
+        data), it will be used in preference to :meth:`convert_from_format`, avoiding
+        the cost of encoding the image in a known image format.
+
+        :param image_in_format: An instance of :any:`image_class` (or a subclass).
+        :returns: The pixels of the image; or ``None`` if this image can't be
+            represented as raw pixels, in which case :meth:`convert_from_format` will
+            be used.
+        """
+
+    @staticmethod
+    def convert_from_pixels(
+        pixels: PixelBuffer,
+        image_class: type[ExternalImageT],
+    ) -> ExternalImageT:
+        """Convert from raw pixels to :any:`image_class` or specified subclass.
+
+        This method is optional. If it is provided (and the backend supports raw pixel
+        data), it will be used in preference to :meth:`convert_to_format`, avoiding the
+        cost of decoding the image from a known image format.
+
+        :param pixels: The pixels of the image.
+        :param image_class: The class of image to return.
+        :returns: The image, as an instance of the image class specified.
+        """
+
 
 NOT_PROVIDED = object()
 
+# The maximum number of images that will be decoded at the same time by Image.load().
+MAX_LOAD_WORKERS = 4
+
+
+@cache
+def _load_executor() -> ThreadPoolExecutor:
+    """Return the pool of threads used to load images. Only created once."""
+    return ThreadPoolExecutor(
+        max_workers=min(MAX_LOAD_WORKERS, os.cpu_count() or 1),
+        thread_name_prefix="toga-image",
+    )
+
+
+def _decode(src: ImageContentT) -> tuple[ImageContentT, Path | None]:
+    """Read and decode image content on a background thread.
+
+    Returns the content in the form that is cheapest to convert into a native image
+    (raw pixels, if possible), and the path the content was read from (if any).
+    """
+    path = None
+    if isinstance(src, (str, Path)):
+        path = toga.App.app.paths.app / src
+        if not path.is_file():
+            raise FileNotFoundError(f"Image file {path} does not exist")
+        src = path.read_bytes()
+
+    # Not every backend can construct an image from raw pixels.
+    if not hasattr(get_platform_factory().Image, "get_pixels"):
+        return src, path
+
+    for converter in Image._converters():
+        if not hasattr(converter, "convert_to_pixels"):
+            continue
+
+        if isinstance(src, (bytes, bytearray, memoryview)):
+            try:
+                image = converter.convert_to_format(src, converter.image_class)
+            except Exception:
+                # The converter can't decode this data; the backend may be able to.
+                continue
+        elif isinstance(src, converter.image_class):
+            image = src
+        else:
+            continue
+
+        pixels = converter.convert_to_pixels(image)
+        if pixels is not None:
+            return pixels, path
+
+    return src, path
+
+
+class PixelBuffer:
+    def __init__(
+        self,
+        data: BytesLikeT,
+        width: int,
+        height: int,
+        stride: int | None = None,
+        format: PixelFormat = PixelFormat.RGBA,
+    ):
+        """Uncompressed pixel data, with no image encoding.
+
+        A pixel buffer wraps the memory it is given, rather than copying it; the data
+        is exposed through the buffer protocol, so it can be passed directly to any
+        library that consumes buffers (such as NumPy or Pillow).
+
+        :param data: A contiguous bytes-like object containing the pixels, row by row,
+            from the top of the image.
+        :param width: The width of the image, in pixels.
+        :param height: The height of the image, in pixels.
+        :param stride: The number of bytes between the start of one row and the start
+            of the next. Defaults to 4 bytes per pixel, with no padding between rows.
+        :param format: The layout of each pixel.
+        :raises ValueError: If the size of the image is invalid, or the data isn't
+            large enough to contain an image of that size.
+        """
+        if width < 0 or height < 0:
+            raise ValueError("width and height must be non-negative")
+        if stride is None:
+            stride = width * 4
+        elif stride < width * 4:
+            raise ValueError(f"stride must be at least {width * 4} bytes")
+
+        self._data = memoryview(data).cast("B")
+        required = stride * (height - 1) + width * 4 if height else 0
+        if self._data.nbytes < required:
+            raise ValueError(
+                f"A {width}x{height} image with a stride of {stride} requires at "
+                f"least {required} bytes; got {self._data.nbytes}"
+            )
+
+        self._width = width
+        self._height = height
+        self._stride = stride
+        self._format = PixelFormat(format)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PixelBuffer {self._width}x{self._height} "
+            f"stride={self._stride} format={self._format.name}>"
+        )
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._data
+
+    @property
+    def data(self) -> memoryview:
+        """The pixel data. On Python 3.12 and later, ``memoryview(pixels)`` can also be
+        used."""
+        return self._data
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """The size of the image, as a (width, height) tuple."""
+        return self._width, self._height
+
+    @property
+    def width(self) -> int:
+        """The width of the image, in pixels."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """The height of the image, in pixels."""
+        return self._height
+
+    @property
+    def stride(self) -> int:
+        """The number of bytes between the start of one row and the start of the
+        next."""
+        return self._stride
+
+    @property
+    def format(self) -> PixelFormat:
+        """The layout of each pixel."""
+        return self._format
+
 
 class Image:
     def __init__(
@@ -133,7 +305,13 @@ class Image:
             self._impl = self.factory.Image(interface=self, path=self._path)
 
         elif isinstance(src, Image):
-            self._impl = self.factory.Image(interface=self, data=src.data)
+            # The content of an image can't be modified, so a copy can safely share
+            # the native image of the original, rather than encoding and decoding it.
+            self._impl = self.factory.Image(interface=self, raw=src._impl.native)
+
+        # Not every backend can construct an image from raw pixels.
+        elif isinstance(src, PixelBuffer) and hasattr(self.factory.Image, "get_pixels"):
+            self._impl = self.factory.Image(interface=self, pixels=src)
 
         elif isinstance(src, self.factory.Image.RAW_TYPE):
             self._impl = self.factory.Image(interface=self, raw=src)
@@ -141,6 +319,18 @@ class Image:
         else:
             for converter in self._converters():
                 if isinstance(src, converter.image_class):
+                    # If both the converter and the backend support raw pixels, the
+                    # image doesn't need to be encoded.
+                    if hasattr(converter, "convert_to_pixels") and hasattr(
+                        self.factory.Image, "get_pixels"
+                    ):
+                        pixels = converter.convert_to_pixels(src)
+                        if pixels is not None:
+                            self._impl = self.factory.Image(
+                                interface=self, pixels=pixels
+                            )
+                            return
+
                     data = converter.convert_from_format(src)
                     self._impl = self.factory.Image(interface=self, data=data)
                     return
@@ -163,6 +353,46 @@ class Image:
 
         return converters
 
+    @classmethod
+    async def load(cls, src: ImageContentT) -> Image:
+        """Load an image without blocking the app.
+
+        The image is read and decoded on a background thread; a limited number of
+        images are decoded at the same time, so loading a large number of images won't
+        starve the rest of the app of resources. Native images can't safely be created
+        on a background thread, so the decoded image is converted into a native image
+        on the app's event loop.
+
+        Images are decoded into raw pixels using an :doc:`image format plugin
+        </reference/plugins/image_formats>` that supports them (such as Pillow), if
+        the backend supports raw pixel data. Otherwise, only reading the image's file
+        is performed in the background.
+
+        :param src: The source from which to load the image. Can be any valid
+            :any:`image content <ImageContentT>` type.
+        :returns: The loaded image.
+        :raises FileNotFoundError: If a path is provided, but that path does not exist.
+        :raises ValueError: If the source cannot be loaded as an image.
+        """
+        loop = asyncio.get_running_loop()
+        content, path = await loop.run_in_executor(_load_executor(), _decode, src)
+        image = cls(content)
+        image._path = path
+        return image
+
+    @classmethod
+    async def load_many(cls, srcs: Iterable[ImageContentT]) -> list[Image]:
+        """Load several images without blocking the app.
+
+        The images are decoded in parallel, as described in :meth:`load`.
+
+        :param srcs: The sources from which to load the images.
+        :returns: The loaded images, in the same order as the sources.
+        :raises FileNotFoundError: If a path is provided, but that path does not exist.
+        :raises ValueError: If a source cannot be loaded as an image.
+        """
+        return list(await asyncio.gather(*(cls.load(src) for src in srcs)))
+
     @property
     def size(self) -> tuple[int, int]:
         """The size of the image, as a (width, height) tuple."""
@@ -202,18 +432,50 @@ class Image:
         """Return the image, converted to the image format specified.
 
         :param format: Format to provide. Defaults to :class:`~toga.images.Image`; also
-             supports :any:`PIL.Image.Image` if Pillow is installed, as well as any
-             image types defined by installed :doc:`image format plugins
-             </reference/plugins/image_formats>`.
+             supports :any:`PIL.Image.Image` if Pillow is installed,
+             :class:`~toga.images.PixelBuffer` (on backends that support raw pixel
+             access), as well as any image types defined by installed
+             :doc:`image format plugins </reference/plugins/image_formats>`.
+             On backends that support raw pixel access, a :any:`PIL.Image.Image` is
+             always returned in ``RGBA`` mode, regardless of the mode of the image
+             that was used to create this image.
         :returns: The image in the requested format
         :raises TypeError: If the format supplied is not recognized.
         """
         if isinstance(format, type):
             if issubclass(format, Image):
-                return format(self.data)
+                return format(self)
+
+            if issubclass(format, PixelBuffer) and hasattr(self._impl, "get_pixels"):
+                return self._impl.get_pixels()
 
             for converter in self._converters():
                 if issubclass(format, converter.image_class):
+                    if hasattr(converter, "convert_from_pixels") and hasattr(
+                        self._impl, "get_pixels"
+                    ):
+                        return converter.convert_from_pixels(
+                            self._impl.get_pixels(), format
+                        )
                     return converter.convert_to_format(self.data, format)
 
         raise TypeError(f"Unknown conversion format for Image: {format}")
+
+
+def _capture_image(impl: Any, format: type[ImageT]) -> ImageT:
+    """Capture an image from a backend that can render its content.
+
+    If the backend can provide raw pixels, they are used directly, rather than being
+    encoded and decoded as PNG data.
+
+    :param impl: The backend implementation; it must provide ``get_image_data()``, and
+        may provide ``get_image_pixels()``.
+    :param format: The format of image to return.
+    """
+    if hasattr(impl, "get_image_pixels"):
+        pixels = impl.get_image_pixels()
+        if isinstance(format, type) and issubclass(format, PixelBuffer):
+            return pixels
+        return Image(pixels).as_format(format)
+
+    return Image(impl.get_image_data()).as_format(format)
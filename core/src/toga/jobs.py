@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count
+from typing import TYPE_CHECKING, Any, Protocol
+
+from toga.handlers import wrapped_handler
+from toga.platform import current_platform
+
+if TYPE_CHECKING:
+    from toga.app import App
+
+# Messages sent from a job to the app.
+PROGRESS = "progress"
+RESULT = "result"
+ERROR = "error"
+
+# Platforms that can't start a new Python process.
+NO_PROCESS_PLATFORMS = {"android", "iOS", "web"}
+
+# The job that is running in the current worker, as a tuple of (job ID, message
+# queue, cancellation event). A worker thread can run a job while other threads are
+# running jobs of their own, so this is stored per-thread.
+_worker = threading.local()
+
+
+def _current_job() -> tuple[int, queue.Queue, threading.Event] | None:
+    return getattr(_worker, "job", None)
+
+
+def report_progress(value: object) -> None:
+    """Report progress from the job that is currently running.
+
+    The value will be passed to the job's :attr:`~toga.jobs.Job.on_progress` handler
+    on the app's event loop. The value must be picklable.
+
+    If this function is invoked when a job isn't running (for example, if the job's
+    function is invoked directly), the progress report will be ignored.
+
+    :param value: The progress to report. This can be any picklable value - for
+        example, a percentage, or a partial result.
+    """
+    if job := _current_job():
+        job_id, messages, _ = job
+        messages.put((job_id, PROGRESS, value))
+
+
+def cancel_requested() -> bool:
+    """Has the job that is currently running been cancelled?
+
+    A job that has started running can't be interrupted; a long running job should
+    check this value periodically, and return early if it is ``True``.
+
+    :returns: ``True`` if :meth:`~toga.jobs.Job.cancel` has been invoked on the
+        current job; ``False`` otherwise, or if a job isn't running.
+    """
+    if job := _current_job():
+        return job[2].is_set()
+    return False
+
+
+def _run_job(
+    job_id: int,
+    messages: queue.Queue,
+    cancelled: threading.Event,
+    fn: Callable[..., object],
+    args: tuple,
+    kwargs: dict[str, object],
+) -> None:
+    """Invoke a job's function in a worker.
+
+    The result is returned through the message queue (rather than the job's future),
+    so that it is guaranteed to arrive after any progress the job has reported.
+    """
+    _worker.job = (job_id, messages, cancelled)
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as e:
+        messages.put((job_id, ERROR, e))
+    else:
+        messages.put((job_id, RESULT, result))
+    finally:
+        _worker.job = None
+
+
+def _use_worker_processes(app: App) -> bool:
+    """Can jobs for the app be run in worker processes?
+
+    A worker process is spawned by running ``sys.executable``. That isn't possible
+    on mobile and web platforms; and in a bundled app, ``sys.executable`` is the app
+    itself, rather than a Python interpreter.
+    """
+    return current_platform not in NO_PROCESS_PLATFORMS and not app.is_bundled
+
+
+class OnProgressHandler(Protocol):
+    def __call__(self, job: Job, value: Any, **kwargs: Any) -> object:
+        """A handler to invoke when a job reports progress.
+
+        :param job: The job reporting progress.
+        :param value: The value passed to :func:`~toga.jobs.report_progress`.
+        :param kwargs: Ensures compatibility with additional arguments introduced in
+            future versions.
+        """
+
+
+class Job:
+    def __init__(
+        self,
+        runner: _JobRunner,
+        id: int,
+        cancelled: threading.Event,
+        on_progress: OnProgressHandler | None = None,
+    ):
+        """A function that is running in a worker process (or thread).
+
+        Jobs should be created with :meth:`toga.App.run_job`, rather than being
+        instantiated directly.
+
+        A job can be awaited to obtain the value returned by the job's function. If the
+        function raises an exception, awaiting the job will raise the same exception;
+        if the job has been cancelled, awaiting the job will raise
+        :any:`asyncio.CancelledError`.
+        """
+        self._runner = runner
+        self._id = id
+        self._cancelled = cancelled
+        self._future: asyncio.Future | None = None
+        self.future = runner.app.loop.create_future()
+        self.on_progress = on_progress
+
+    def __repr__(self) -> str:
+        if self.future.cancelled():
+            state = "cancelled"
+        elif self.future.done():
+            state = "done"
+        else:
+            state = "running"
+        return f"<Job {self._id} {state}>"
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self.future.__await__()
+
+    @property
+    def on_progress(self) -> OnProgressHandler:
+        """The handler to invoke when the job reports progress.
+
+        The handler is invoked on the app's event loop, so it can safely update
+        widgets (such as a :class:`~toga.ProgressBar`) or data sources.
+        """
+        return self._on_progress
+
+    @on_progress.setter
+    def on_progress(self, handler: OnProgressHandler | None) -> None:
+        self._on_progress = wrapped_handler(self, handler)
+
+    @property
+    def done(self) -> bool:
+        """Has the job completed, failed, or been cancelled? (read-only)"""
+        return self.future.done()
+
+    @property
+    def cancelled(self) -> bool:
+        """Has the job been cancelled? (read-only)"""
+        return self.future.cancelled()
+
+    def cancel(self) -> bool:
+        """Cancel the job.
+
+        If the job hasn't started running, it will not be started. If the job is
+        already running, :func:`~toga.jobs.cancel_requested` will return ``True`` in
+        the worker, so the job can stop early. In either case, the job is
+        cancelled immediately; no further progress will be reported, and any result
+        will be discarded.
+
+        :returns: ``True`` if the job was cancelled; ``False`` if the job had already
+            completed.
+        """
+        if self.future.done():
+            return False
+
+        self._cancelled.set()
+        self._future.cancel()
+        self._runner._finish(self)
+        self.future.cancel()
+        return True
+
+    def _job_done(self, future: asyncio.Future) -> None:
+        # Invoked when the worker has finished with the job.
+        # A successful job delivers its result through the message queue; this only
+        # needs to handle jobs that couldn't be run (e.g., the function couldn't be
+        # pickled, or the worker process died).
+        if not self.future.done():
+            try:
+                future.result()
+            except Exception as e:
+                self._runner._finish(self)
+                self.future.set_exception(e)
+
+    def _message(self, kind: str, value: object) -> None:
+        if kind == PROGRESS:
+            self.on_progress(value)
+        else:
+            self._runner._finish(self)
+            if kind == RESULT:
+                self.future.set_result(value)
+            else:
+                self.future.set_exception(value)
+
+
+class _JobRunner:
+    def __init__(self, app: App, processes: bool = True):
+        """The pool of workers used by :meth:`toga.App.run_job`.
+
+        Messages from jobs are passed through a single queue, which is read by a
+        background thread; any messages that are waiting are then handled as a batch
+        on the app's event loop.
+
+        :param app: The app that is running the jobs.
+        :param processes: Should jobs be run in worker processes? If ``False``, jobs
+            are run in worker threads.
+        """
+        self.app = app
+        if processes:
+            # Worker processes are spawned, rather than forked, as it isn't safe to
+            # fork a process that is running a GUI event loop.
+            context = multiprocessing.get_context("spawn")
+            self.manager = context.Manager()
+            self.messages = self.manager.Queue()
+            self.executor = ProcessPoolExecutor(mp_context=context)
+            self._event = self.manager.Event
+        else:
+            self.manager = None
+            self.messages = queue.Queue()
+            self.executor = ThreadPoolExecutor(thread_name_prefix="toga-job")
+            self._event = threading.Event
+        self.jobs: dict[int, Job] = {}
+        self._ids = count()
+
+        self._reader = threading.Thread(
+            target=self._read_messages,
+            name="toga-jobs",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def submit(
+        self,
+        fn: Callable[..., object],
+        args: tuple,
+        kwargs: dict[str, object],
+        on_progress: OnProgressHandler | None,
+    ) -> Job:
+        job_id = next(self._ids)
+        cancelled = self._event()
+        job = Job(self, job_id, cancelled, on_progress=on_progress)
+        self.jobs[job_id] = job
+
+        # Wrapping the future ensures that completion is handled on the event loop,
+        # and that cancelling the job cancels the call if it hasn't started.
+        job._future = asyncio.wrap_future(
+            self.executor.submit(
+                _run_job, job_id, self.messages, cancelled, fn, args, kwargs
+            ),
+            loop=self.app.loop,
+        )
+        job._future.add_done_callback(job._job_done)
+        return job
+
+    def _finish(self, job: Job) -> None:
+        self.jobs.pop(job._id, None)
+
+    def _read_messages(self) -> None:
+        while True:
+            batch = [self.messages.get()]
+            while True:
+                try:
+                    batch.append(self.messages.get_nowait())
+                except queue.Empty:
+                    break
+
+            # A `None` message indicates the runner is shutting down.
+            if None in batch:
+                return
+
+            try:
+                self.app.loop.call_soon_threadsafe(self._dispatch, batch)
+            except RuntimeError:
+                # The event loop has been closed.
+                return
+
+    def _dispatch(self, batch: list[tuple[int, str, object]]) -> None:
+        # Handle all the messages in the batch before any widget is refreshed.
+        with self.app.batch_refresh():
+            for job_id, kind, value in batch:
+                # Messages for jobs that have been cancelled are ignored.
+                if job := self.jobs.get(job_id):
+                    job._message(kind, value)
+
+    def shutdown(self) -> None:
+        for job in list(self.jobs.values()):
+            job.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.messages.put(None)
+        self._reader.join()
+        if self.manager:
+            self.manager.shutdown()
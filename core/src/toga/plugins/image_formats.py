@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import sys
 from io import BytesIO
 from typing import TYPE_CHECKING
 
+from toga.constants import PixelFormat
+from toga.images import PixelBuffer
+
 if TYPE_CHECKING:
     from toga.images import BytesLikeT
 
@@ -18,6 +22,13 @@ except ImportError:  # pragma: no-cover-if-PIL-installed
     PIL_imported = False
 
 
+# The Pillow raw modes that decode each pixel format into an RGBA image.
+RAW_MODES = {
+    PixelFormat.RGBA: "RGBA",
+    PixelFormat.ARGB32: "BGRa" if sys.byteorder == "little" else "aRGB",
+}
+
+
 class PILConverter:
     image_class = PIL.Image.Image if PIL_imported else None
 
@@ -38,3 +49,32 @@ class PILConverter:
         with PIL.Image.open(buffer) as pil_image:
             pil_image.load()
         return pil_image
+
+    @staticmethod
+    def convert_to_pixels(image_in_format: PIL.Image.Image) -> PixelBuffer | None:
+        if image_in_format.mode == "RGBA":
+            image = image_in_format
+        else:
+            try:
+                image = image_in_format.convert("RGBA")
+            except ValueError:
+                # Some modes can't be converted directly; fall back to PNG.
+                return None
+        return PixelBuffer(image.tobytes(), *image.size)
+
+    @staticmethod
+    def convert_from_pixels(
+        pixels: PixelBuffer,
+        image_class: type[PIL.Image.Image],
+    ) -> PIL.Image.Image:
+        # For RGBA data, the image shares memory with the pixel buffer, rather than
+        # copying it.
+        return PIL.Image.frombuffer(
+            "RGBA",
+            pixels.size,
+            pixels.data,
+            "raw",
+            RAW_MODES[pixels.format],
+            pixels.stride,
+            1,
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from toga.images import Image
+from toga.images import Image, _capture_image
 from toga.platform import get_platform_factory
 from toga.types import Position, Size
 
@@ -35,9 +35,10 @@ class Screen:
         """Render the current contents of the screen as an image.
 
         :param format: Format to provide. Defaults to :class:`~toga.images.Image`; also
-            supports :any:`PIL.Image.Image` if Pillow is installed, as well as any image
-            types defined by installed :doc:`image format plugins
-            </reference/plugins/image_formats>`.
+            supports :any:`PIL.Image.Image` if Pillow is installed,
+            :class:`~toga.images.PixelBuffer` (to obtain the raw pixels, without any
+            image encoding), as well as any image types defined by installed
+            :doc:`image format plugins </reference/plugins/image_formats>`.
         :returns: An image containing the screen content, in the format requested.
         """
-        return Image(self._impl.get_image_data()).as_format(format)
+        return _capture_image(self._impl, format)
@@ -1,10 +1,13 @@
 from .accessors import to_accessor  # noqa: F401
 from .base import Listener, Source  # noqa: F401
+from .lazy_list_source import LazyListSource  # noqa: F401
 from .list_source import ListSource, Row  # noqa: F401
-from .tree_source import Node, TreeSource  # noqa: F401
+from .tree_source import LazyChildren, Node, TreeSource  # noqa: F401
 from .value_source import ValueSource  # noqa: F401
 
 __all__ = [
+    "LazyChildren",
+    "LazyListSource",
     "ListSource",
     "Listener",
     "Node",
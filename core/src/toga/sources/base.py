@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Protocol
 
 
@@ -21,6 +22,14 @@ class Listener(Protocol):
         :param item: The data object that was added.
         """
 
+    def insert_range(self, index: int, items: list) -> object:
+        """A contiguous range of items has been added to the data source.
+
+        :param index: The 0-index position in the data of the first item that was
+            added.
+        :param items: The data objects that were added, in order.
+        """
+
     def remove(self, index: int, item: object) -> object:
         """An item has been removed from the data source.
 
@@ -31,6 +40,10 @@ class Listener(Protocol):
     def clear(self) -> object:
         """All items have been removed from the data source."""
 
+    def reset(self) -> object:
+        """The content of the data source has been replaced or reordered; any
+        representation of the data source should be reloaded."""
+
 
 class Source:
     """A base class for data sources, providing an implementation of data
@@ -38,6 +51,10 @@ class Source:
 
     def __init__(self) -> None:
         self._listeners: list[Listener] = []
+        self._coalesce_changes = False
+        # Items with a deferred change notification. A dictionary is used as an
+        # ordered set.
+        self._pending_changes: dict[object, None] = {}
 
     @property
     def listeners(self) -> list[Listener]:
@@ -65,12 +82,61 @@ class Source:
         """
         self._listeners.remove(listener)
 
+    @property
+    def coalesce_changes(self) -> bool:
+        """Should change notifications be coalesced?
+
+        If :any:`True`, ``change`` notifications are deferred until the next iteration
+        of the event loop; an item that changes several times before then will only
+        generate a single notification. Any other notification (such as an insertion
+        or removal) causes pending changes to be delivered first, so listeners always
+        observe notifications in order. Pending changes to items that have been
+        removed (or replaced) are discarded, as the items are no longer part of the
+        source.
+
+        Defaults to :any:`False`, so every change is delivered immediately.
+        """
+        return self._coalesce_changes
+
+    @coalesce_changes.setter
+    def coalesce_changes(self, value: bool) -> None:
+        self._coalesce_changes = bool(value)
+        if not self._coalesce_changes:
+            self._flush_changes()
+
     def notify(self, notification: str, **kwargs: object) -> None:
         """Notify all listeners an event has occurred.
 
         :param notification: The notification to emit.
         :param kwargs: The data associated with the notification.
         """
+        if notification == "change" and self._coalesce_changes:
+            if not self._pending_changes:
+                asyncio.get_event_loop().call_soon(self._flush_changes)
+            self._pending_changes[kwargs["item"]] = None
+            return
+
+        if self._pending_changes:
+            if notification == "remove":
+                self._discard_changes(kwargs["item"])
+            elif notification in {"clear", "reset"}:
+                # Every item will be reloaded, or is no longer part of the source.
+                self._pending_changes.clear()
+        self._flush_changes()
+        self._notify_listeners(notification, **kwargs)
+
+    def _flush_changes(self) -> None:
+        # Deliver any deferred change notifications.
+        if self._pending_changes:
+            pending, self._pending_changes = self._pending_changes, {}
+            for item in pending:
+                self._notify_listeners("change", item=item)
+
+    def _discard_changes(self, item: object) -> None:
+        # Discard any deferred change to an item that is no longer part of the source.
+        self._pending_changes.pop(item, None)
+
+    def _notify_listeners(self, notification: str, **kwargs: object) -> None:
         for listener in self._listeners:
             try:
                 method = getattr(listener, notification)
@@ -79,3 +145,15 @@ class Source:
 
             if method:
                 method(**kwargs)
+            else:
+                self._notify_fallback(listener, notification, **kwargs)
+
+    def _notify_fallback(
+        self,
+        listener: Listener,
+        notification: str,
+        **kwargs: object,
+    ) -> None:
+        # A listener doesn't implement a notification. By default, the notification
+        # is ignored; subclasses can deliver an equivalent notification instead.
+        pass
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from .base import Source
+from .list_source import ListSource, Row, _item_matches
+
+
+class LazyListSource(Source):
+    _blocks: OrderedDict[int, list[Row]]
+
+    def __init__(
+        self,
+        accessors: Iterable[str],
+        length: int,
+        fetch: Callable[[int, int], Iterable],
+        block_size: int = 256,
+        cache_size: int = 64,
+    ):
+        """A read-only data source that retrieves items from a larger data set on
+        demand.
+
+        :param accessors: A list of attribute names for accessing the value
+            in each column of the row.
+        :param length: The number of items in the source.
+        :param fetch: A callable that accepts a ``start`` and ``stop`` index, and
+            returns an iterable containing the ``stop - start`` items in that range.
+            Items are converted as shown :ref:`here <listsource-item>`.
+        :param block_size: The number of items that will be requested from ``fetch``
+            in a single call.
+        :param cache_size: The maximum number of blocks of items that will be
+            retained. When this limit is exceeded, the least recently used block is
+            discarded.
+        """
+        super().__init__()
+        if isinstance(accessors, str) or not hasattr(accessors, "__iter__"):
+            raise ValueError("accessors should be a list of attribute names")
+
+        # Copy the list of accessors
+        self._accessors = [a for a in accessors]
+        if len(self._accessors) == 0:
+            raise ValueError("LazyListSource must be provided a list of accessors")
+
+        if length < 0:
+            raise ValueError("length must be a non-negative integer")
+        if block_size < 1:
+            raise ValueError("block_size must be a positive integer")
+        if cache_size < 1:
+            raise ValueError("cache_size must be a positive integer")
+
+        self._length = length
+        self._fetch = fetch
+        self._block_size = block_size
+        self._cache_size = cache_size
+
+        # Blocks of rows that have been fetched, in least-recently-used order.
+        self._blocks = OrderedDict()
+        # Rows that have been modified since they were fetched. These rows are
+        # retained even if the block that contains them is discarded, so that the
+        # modification isn't lost.
+        self._modified: dict[int, Row] = {}
+
+    ######################################################################
+    # Methods required by the ListSource interface
+    ######################################################################
+
+    def __len__(self) -> int:
+        """Returns the number of items in the list."""
+        return self._length
+
+    def __getitem__(self, index: int) -> Row:
+        """Returns the item at position ``index`` of the list.
+
+        If the item hasn't been retrieved (or has been discarded from the cache), the
+        block of items containing ``index`` will be retrieved.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("list index out of range")
+
+        try:
+            return self._modified[index]
+        except KeyError:
+            pass
+
+        block_index, offset = divmod(index, self._block_size)
+        try:
+            block = self._blocks[block_index]
+            self._blocks.move_to_end(block_index)
+        except KeyError:
+            block = self._fetch_block(block_index)
+        return block[offset]
+
+    def _fetch_block(self, block_index: int) -> list[Row]:
+        start = block_index * self._block_size
+        stop = min(start + self._block_size, self._length)
+
+        block = [self._create_row(value) for value in self._fetch(start, stop)]
+        if len(block) != stop - start:
+            raise ValueError(
+                f"Expected {stop - start} items for range {start}:{stop}; "
+                f"fetch returned {len(block)}"
+            )
+        for index, row in enumerate(block, start=start):
+            row._index = index
+
+        self._blocks[block_index] = block
+        if len(self._blocks) > self._cache_size:
+            self._blocks.popitem(last=False)
+        return block
+
+    ######################################################################
+    # Factory methods for new rows
+    ######################################################################
+
+    # Rows are constructed using the same rules as ListSource.
+    _create_row = ListSource._create_row
+
+    def notify(self, notification: str, **kwargs: object) -> None:
+        if notification == "change":
+            row = kwargs["item"]
+            self._modified[row._index] = row
+        super().notify(notification, **kwargs)
+
+    ######################################################################
+    # Utility methods to make LazyListSources more list-like
+    ######################################################################
+
+    def index(self, row: Row) -> int:
+        """The index of a specific row in the data source.
+
+        This search uses Row instances, and searches for an *instance* match. Rows
+        record their own position, so this doesn't require any other items to be
+        retrieved.
+
+        :param row: The row to find in the data source.
+        :returns: The index of the row in the data source.
+        :raises ValueError: If the row is not part of the data source.
+        """
+        if getattr(row, "_source", None) is not self:
+            raise ValueError(f"{row!r} is not in data source")
+        return row._index
+
+    def find(self, data: object, start: Row | None = None) -> Row:
+        """Find the first item in the data that matches all the provided
+        attributes.
+
+        This is a value based search; every item from ``start`` up to the first match
+        will be retrieved.
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the row contains additional data attributes,
+            they won't be considered as part of the match.
+        :param start: The instance from which to start the search. Defaults to ``None``,
+            indicating that the first match should be returned.
+        :return: The matching Row object
+        :raises ValueError: If no match is found.
+        """
+        start_index = 0 if start is None else self.index(start) + 1
+        for index in range(start_index, self._length):
+            row = self[index]
+            if _item_matches(row, data, self._accessors):
+                return row
+
+        raise ValueError(f"No row matching {data!r} in data")
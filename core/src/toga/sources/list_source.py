@@ -1,13 +1,55 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Generic, TypeVar
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import Any, Generic, TypeVar
 
-from .base import Source
+from .base import Listener, Source
 
 T = TypeVar("T")
 
 
+def _item_matches(item: object, data: object, accessors: Sequence[str]) -> bool:
+    """Does ``item`` match the find-by-value criteria in ``data``?"""
+    try:
+        if isinstance(data, Mapping):
+            return all(getattr(item, attr) == value for attr, value in data.items())
+        elif hasattr(data, "__iter__") and not isinstance(data, str):
+            return all(
+                getattr(item, attr) == value for value, attr in zip(data, accessors)
+            )
+        else:
+            return getattr(item, accessors[0]) == data
+    except AttributeError:
+        # Attribute didn't exist, so it's not a match
+        return False
+
+
+def _criteria(data: object, accessors: Sequence[str]) -> Iterable[tuple[str, object]]:
+    """The (attribute, value) pairs described by find-by-value criteria ``data``."""
+    if isinstance(data, Mapping):
+        return data.items()
+    elif hasattr(data, "__iter__") and not isinstance(data, str):
+        return zip(accessors, data)
+    else:
+        return [(accessors[0], data)]
+
+
+def _iter_matches(
+    candidates: Sequence[T],
+    data: object,
+    accessors: Sequence[str],
+    start_index: int,
+) -> Iterator[T]:
+    """Iterate over the items in ``candidates`` that match ``data``, starting at
+    ``start_index``."""
+    for index in range(start_index, len(candidates)):
+        item = candidates[index]
+        if _item_matches(item, data, accessors):
+            yield item
+
+
 def _find_item(
     candidates: Sequence[T],
     data: object,
@@ -22,28 +64,60 @@ def _find_item(
     else:
         start_index = 0
 
-    for item in candidates[start_index:]:
-        try:
-            if isinstance(data, Mapping):
-                found = all(
-                    getattr(item, attr) == value for attr, value in data.items()
-                )
-            elif hasattr(data, "__iter__") and not isinstance(data, str):
-                found = all(
-                    getattr(item, attr) == value for value, attr in zip(data, accessors)
-                )
-            else:
-                found = getattr(item, accessors[0]) == data
-
-            if found:
-                return item
-        except AttributeError:
-            # Attribute didn't exist, so it's not a match
-            pass
+    for item in _iter_matches(candidates, data, accessors, start_index):
+        return item
 
     raise ValueError(error)
 
 
+_MISSING = object()
+
+
+class _ValueIndex:
+    """A hash index of the rows of a source, keyed on the value of one attribute."""
+
+    def __init__(self, attr: str, rows: Iterable[Row]):
+        self.attr = attr
+        # The rows with each value. A dictionary is used as an ordered set.
+        self.rows: dict[object, dict[Row, None]] = {}
+        # The value under which each row has been indexed.
+        self.values: dict[Row, object] = {}
+        # A cache of the rows with each value, sorted by position. Each entry is a
+        # tuple of the layout version of the source when the entry was built, the
+        # sorted positions, and the rows at those positions.
+        self.ordered: dict[object, tuple[int, list[int], list[Row]]] = {}
+        for row in rows:
+            self.add(row)
+
+    def add(self, row: Row) -> None:
+        value = getattr(row, self.attr, _MISSING)
+        if value is _MISSING:
+            return
+        try:
+            self.rows.setdefault(value, {})[row] = None
+        except TypeError:
+            # Unhashable values can't be indexed; they can only be found by a search
+            # for an (equally unhashable) value, which doesn't use the index.
+            return
+        self.values[row] = value
+        self.ordered.pop(value, None)
+
+    def discard(self, row: Row) -> None:
+        try:
+            value = self.values.pop(row)
+        except KeyError:
+            return
+        rows = self.rows[value]
+        del rows[row]
+        if not rows:
+            del self.rows[value]
+        self.ordered.pop(value, None)
+
+    def update(self, row: Row) -> None:
+        self.discard(row)
+        self.add(row)
+
+
 class Row(Generic[T]):
     def __init__(self, **data: T):
         """Create a new Row object.
@@ -56,6 +130,10 @@ class Row(Generic[T]):
         notified.
         """
         self._source: Source | None = None
+        # The number of batch updates that are currently open, and whether the row
+        # has changed during those updates.
+        self._update_depth = 0
+        self._changed = False
         for name, value in data.items():
             setattr(self, name, value)
 
@@ -71,6 +149,47 @@ class Row(Generic[T]):
     # Utility wrappers
     ######################################################################
 
+    def _notify_change(self) -> None:
+        if self._update_depth:
+            # Notify the source when the batch update ends.
+            self._changed = True
+        elif self._source is not None:
+            self._source.notify("change", item=self)
+
+    def update(self, **data: T) -> None:
+        """Set multiple attributes on the Row, notifying the source of the change once.
+
+        :param data: The attribute names and values to set.
+        """
+        with self.batch_update():
+            for name, value in data.items():
+                setattr(self, name, value)
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Obtain a context manager that defers change notifications for this Row until
+        the end of the block.
+
+        However many attributes are modified inside the block, the source to which the
+        row belongs will receive at most one change notification when the block exits::
+
+            with row.batch_update():
+                row.price = 42.0
+                row.volume = 1500
+                row.change = -0.3
+
+        Batch updates can be nested; the notification is sent when the outermost
+        block exits.
+        """
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and self._changed:
+                self._changed = False
+                self._notify_change()
+
     def __setattr__(self, attr: str, value: T) -> None:
         """Set an attribute on the Row object, notifying the source of the change.
 
@@ -79,8 +198,7 @@ class Row(Generic[T]):
         """
         super().__setattr__(attr, value)
         if not attr.startswith("_"):
-            if self._source is not None:
-                self._source.notify("change", item=self)
+            self._notify_change()
 
     def __getattr__(self, attr: str) -> T:
         return super().__getattr__(attr)
@@ -92,8 +210,7 @@ class Row(Generic[T]):
         """
         super().__delattr__(attr)
         if not attr.startswith("_"):
-            if self._source is not None:
-                self._source.notify("change", item=self)
+            self._notify_change()
 
 
 class ListSource(Source):
@@ -122,6 +239,17 @@ class ListSource(Source):
         else:
             self._data = []
 
+        # Secondary indexes used by find(), keyed by attribute name.
+        self._indexes: dict[str, _ValueIndex] = {}
+
+        # A cache of the position of each row in the data. Positions at or after
+        # _positions_valid may be out of date, and are recomputed when needed.
+        self._positions: dict[Row, int] = {}
+        self._positions_valid = 0
+        # A counter that is incremented whenever rows are about to move, so cached
+        # orderings of the rows can be recognized as out of date.
+        self._layout_version = 0
+
     ######################################################################
     # Methods required by the ListSource interface
     ######################################################################
@@ -137,7 +265,10 @@ class ListSource(Source):
     def __delitem__(self, index: int) -> None:
         """Deletes the item at position ``index`` of the list."""
         row = self._data[index]
+        self._invalidate_positions(index)
         del self._data[index]
+        self._positions.pop(row, None)
+        self._unindex(row)
         self.notify("remove", index=index, item=row)
 
     ######################################################################
@@ -155,6 +286,64 @@ class ListSource(Source):
         row._source = self
         return row
 
+    def notify(self, notification: str, **kwargs: object) -> None:
+        if notification == "change":
+            # Indexes are updated immediately, even if the notification is deferred.
+            row = kwargs["item"]
+            if self._indexes and self._contains(row):
+                for index in self._indexes.values():
+                    index.update(row)
+        super().notify(notification, **kwargs)
+
+    # Listeners that don't implement the range-level ``insert_range`` and ``reset``
+    # notifications receive the equivalent sequence of item-level notifications.
+    def _notify_fallback(
+        self,
+        listener: Listener,
+        notification: str,
+        **kwargs: object,
+    ) -> None:
+        if notification == "insert_range":
+            index = kwargs["index"]
+            items = kwargs["items"]
+        elif notification == "reset":
+            if clear := getattr(listener, "clear", None):
+                clear()
+            index = 0
+            items = self._data
+        else:
+            return
+
+        if insert := getattr(listener, "insert", None):
+            for offset, item in enumerate(items):
+                insert(index=index + offset, item=item)
+
+    def _contains(self, row: Row) -> bool:
+        try:
+            self.index(row)
+            return True
+        except ValueError:
+            return False
+
+    def _index(self, rows: Iterable[Row]) -> None:
+        for index in self._indexes.values():
+            for row in rows:
+                index.add(row)
+
+    def _unindex(self, *rows: Row) -> None:
+        for index in self._indexes.values():
+            for row in rows:
+                index.discard(row)
+
+    def _invalidate_positions(self, index: int) -> None:
+        # The rows at or after ``index`` are about to move. This must be called
+        # *before* the data is modified, so that negative indices are interpreted
+        # correctly.
+        if index < 0:
+            index = max(index + len(self._data), 0)
+        self._positions_valid = min(self._positions_valid, index)
+        self._layout_version += 1
+
     ######################################################################
     # Utility methods to make ListSources more list-like
     ######################################################################
@@ -167,12 +356,21 @@ class ListSource(Source):
             into a Row object.
         """
         row = self._create_row(value)
+        old_row = self._data[index]
+        self._invalidate_positions(index)
         self._data[index] = row
+        self._positions.pop(old_row, None)
+        self._unindex(old_row)
+        self._index([row])
+        self._discard_changes(old_row)
         self.notify("insert", index=index, item=row)
 
     def clear(self) -> None:
         """Clear all data from the data source."""
         self._data = []
+        self._positions = {}
+        self._positions_valid = 0
+        self._indexes = {attr: _ValueIndex(attr, []) for attr in self._indexes}
         self.notify("clear")
 
     def insert(self, index: int, data: object) -> Row:
@@ -184,10 +382,92 @@ class ListSource(Source):
         :returns: The newly constructed Row object.
         """
         row = self._create_row(data)
+        self._invalidate_positions(index)
         self._data.insert(index, row)
+        self._index([row])
         self.notify("insert", index=index, item=row)
         return row
 
+    def insert_many(self, index: int, data: Iterable) -> list[Row]:
+        """Insert multiple rows into the data source at a specific index.
+
+        Listeners are notified of the insertion of all the rows at once.
+
+        :param index: The index at which to insert the first item.
+        :param data: The data to insert into the ListSource. Each item will be
+            converted into a Row object.
+        :returns: The newly constructed Row objects.
+        """
+        # Normalize the index in the same way as list.insert().
+        index = slice(index, None).indices(len(self._data))[0]
+        rows = [self._create_row(value) for value in data]
+        self._invalidate_positions(index)
+        self._data[index:index] = rows
+        self._index(rows)
+        if rows:
+            self.notify("insert_range", index=index, items=rows)
+        return rows
+
+    def extend(self, data: Iterable) -> list[Row]:
+        """Insert multiple rows at the end of the data source.
+
+        Listeners are notified of the insertion of all the rows at once.
+
+        :param data: The data to append to the ListSource. Each item will be
+            converted into a Row object.
+        :returns: The newly constructed Row objects.
+        """
+        return self.insert_many(len(self), data)
+
+    def replace_range(self, start: int, stop: int, data: Iterable) -> list[Row]:
+        """Replace a range of rows in the data source.
+
+        The rows from ``start`` up to (but not including) ``stop`` are removed, and
+        replaced with rows constructed from ``data``. The number of new rows doesn't
+        need to match the number of rows that are removed. Listeners are notified with
+        a single ``reset`` notification.
+
+        :param start: The index of the first row to replace.
+        :param stop: The index after the last row to replace.
+        :param data: The data for the replacement rows. Each item will be converted
+            into a Row object.
+        :returns: The newly constructed Row objects.
+        """
+        rows = [self._create_row(value) for value in data]
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        old_rows = self._data[start:stop]
+        for old_row in old_rows:
+            self._positions.pop(old_row, None)
+        self._unindex(*old_rows)
+        self._data[start:stop] = rows
+        self._invalidate_positions(start)
+        self._index(rows)
+        self.notify("reset")
+        return rows
+
+    def sort(
+        self,
+        key: Callable[[Row], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        """Sort the rows of the data source in place.
+
+        Listeners are notified with a single ``reset`` notification.
+
+        :param key: A function that is passed each Row, and returns the value that
+            should be used to sort that row. Defaults to sorting on the values of the
+            source's accessors, in order.
+        :param reverse: Should the rows be sorted in descending order?
+        """
+        if key is None:
+
+            def key(row: Row) -> tuple:
+                return tuple(getattr(row, accessor) for accessor in self._accessors)
+
+        self._data.sort(key=key, reverse=reverse)
+        self._invalidate_positions(0)
+        self.notify("reset")
+
     def append(self, data: object) -> Row:
         """Insert a row at the end of the data source.
 
@@ -202,7 +482,7 @@ class ListSource(Source):
 
         :param row: The row to remove from the data source.
         """
-        del self[self._data.index(row)]
+        del self[self.index(row)]
 
     def index(self, row: Row) -> int:
         """The index of a specific row in the data source.
@@ -212,11 +492,84 @@ class ListSource(Source):
         same Python instance will match. To search for values based on equality,
         use :meth:`~toga.sources.ListSource.find`.
 
+        The position of each row is cached, so this is a constant-time operation
+        unless rows have been inserted or removed before ``row`` since the last
+        lookup. If they have, the positions of every row from the earliest insertion
+        or removal onwards are recomputed, which takes time proportional to the number
+        of those rows. Appending rows doesn't affect the cost of looking up existing
+        rows; but a lookup after each insertion at the front of the source takes time
+        proportional to the size of the source.
+
         :param row: The row to find in the data source.
         :returns: The index of the row in the data source.
         :raises ValueError: If the row cannot be found in the data source.
         """
-        return self._data.index(row)
+        try:
+            position = self._positions[row]
+        except (KeyError, TypeError):
+            position = None
+
+        if position is None or position >= self._positions_valid:
+            # Recompute the positions of every row after the earliest modification.
+            for position in range(self._positions_valid, len(self._data)):
+                self._positions[self._data[position]] = position
+            self._positions_valid = len(self._data)
+
+            try:
+                position = self._positions[row]
+            except (KeyError, TypeError):
+                raise ValueError(f"{row!r} is not in list") from None
+
+        return position
+
+    def add_index(self, accessor: str) -> None:
+        """Maintain an index of the values of an attribute, to speed up searches.
+
+        Once an attribute has been indexed, :meth:`find` and :meth:`find_all` only
+        need to examine the rows that have the requested value for that attribute,
+        rather than every row in the source. The index is updated as rows are added,
+        removed and modified; modifications made inside a
+        :meth:`~toga.sources.Row.batch_update` block are indexed when the block exits.
+
+        Only hashable values can be indexed.
+
+        :param accessor: The name of the attribute to index. This doesn't need to be
+            one of the source's accessors.
+        """
+        if accessor not in self._indexes:
+            self._indexes[accessor] = _ValueIndex(accessor, self._data)
+
+    def _indexed_candidates(self, data: object) -> tuple[list[int], list[Row]] | None:
+        # Find the smallest set of rows that could match the criteria, using the
+        # indexes. Returns the positions of those rows and the rows themselves, in
+        # order; or None if none of the criteria are indexed.
+        candidates = None
+        for attr, value in _criteria(data, self._accessors):
+            if index := self._indexes.get(attr):
+                try:
+                    rows = index.rows.get(value, {})
+                except TypeError:
+                    # Unhashable values aren't indexed
+                    continue
+                if candidates is None or len(rows) < len(candidates[2]):
+                    candidates = (index, value, rows)
+
+        if candidates is None:
+            return None
+
+        # Sorting the rows requires their positions; the result is cached until the
+        # rows with the value, or the positions of any rows, change.
+        index, value, rows = candidates
+        try:
+            version, positions, ordered = index.ordered[value]
+        except KeyError:
+            version = None
+        if version != self._layout_version:
+            positions = sorted(self.index(row) for row in rows)
+            ordered = [self._data[position] for position in positions]
+            if rows:
+                index.ordered[value] = (self._layout_version, positions, ordered)
+        return positions, ordered
 
     def find(self, data: object, start: Row | None = None) -> Row:
         """Find the first item in the data that matches all the provided
@@ -228,6 +581,12 @@ class ListSource(Source):
         as the ``start`` argument. To search for a specific Row instance, use the
         :meth:`~toga.sources.ListSource.index`.
 
+        If any of the attributes in the search have been indexed with
+        :meth:`add_index`, only the rows with matching values for that attribute
+        are examined. The order of those rows is cached, so the rows before ``start``
+        are skipped with a binary search, rather than being examined again. To
+        iterate over every match, :meth:`find_all` is simpler.
+
         :param data: The data to search for. Only the values specified in data will be
             used as matching criteria; if the row contains additional data attributes,
             they won't be considered as part of the match.
@@ -236,10 +595,34 @@ class ListSource(Source):
         :return: The matching Row object
         :raises ValueError: If no match is found.
         """
-        return _find_item(
-            candidates=self._data,
-            data=data,
-            accessors=self._accessors,
-            start=start,
-            error=f"No row matching {data!r} in data",
-        )
+        start_index = 0 if start is None else self.index(start) + 1
+
+        candidates = self._indexed_candidates(data)
+        if candidates is None:
+            rows = self._data
+        else:
+            # Skip the candidates before the start position.
+            positions, rows = candidates
+            start_index = bisect_left(positions, start_index)
+
+        for row in _iter_matches(rows, data, self._accessors, start_index):
+            return row
+
+        raise ValueError(f"No row matching {data!r} in data")
+
+    def find_all(self, data: object) -> Iterator[Row]:
+        """Iterate over all the items in the data that match all the provided
+        attributes, in order.
+
+        If any of the attributes in the search have been indexed with
+        :meth:`add_index`, only the rows with matching values for that attribute
+        are examined.
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the row contains additional data attributes,
+            they won't be considered as part of the match.
+        :returns: An iterator over the matching Row objects.
+        """
+        candidates = self._indexed_candidates(data)
+        rows = self._data if candidates is None else candidates[1]
+        return _iter_matches(rows, data, self._accessors, 0)
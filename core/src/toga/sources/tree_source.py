@@ -1,13 +1,46 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator, Mapping
-from typing import TypeVar
+import asyncio
+import inspect
+import sys
+import traceback
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from typing import TypeVar, Union
 
 from .base import Source
-from .list_source import Row, _find_item
+from .list_source import Row, _find_item, _iter_matches
 
 T = TypeVar("T")
 
+#: A callable that produces the data for the children of a lazy node. It is passed
+#: the node, and returns the child data (or an awaitable that produces the child
+#: data).
+ChildLoader = Callable[["Node"], Union[object, Awaitable[object]]]
+
+
+class LazyChildren:
+    def __init__(self, loader: ChildLoader):
+        """A marker for the children of a node that will be loaded on demand.
+
+        When used as the child data for a node, the node is created without any
+        children; the children are produced by the loader when
+        :meth:`~toga.sources.Node.load_children` is invoked.
+
+        :param loader: The callable that produces the data for the children of the
+            node.
+        """
+        self.loader = loader
+
+    def __repr__(self) -> str:
+        return f"<LazyChildren {self.loader!r}>"
+
+
+def _report_load_error(task: asyncio.Task) -> None:
+    # Nothing may be waiting for the load to complete, so report any error here.
+    if not task.cancelled() and (e := task.exception()):
+        print("Error loading children:", e, file=sys.stderr)
+        traceback.print_exception(type(e), e, e.__traceback__)
+
 
 class Node(Row[T]):
     _source: TreeSource
@@ -28,6 +61,10 @@ class Node(Row[T]):
         super().__init__(**data)
         self._children: list[Node[T]] | None = None
         self._parent: Node[T] | None = None
+        # The loader for children that haven't been loaded yet, and the task that is
+        # loading them (if the loader is asynchronous).
+        self._loader: ChildLoader | None = None
+        self._loading: asyncio.Task | None = None
 
     def __repr__(self) -> str:
         descriptor = " ".join(
@@ -83,6 +120,72 @@ class Node(Row[T]):
         """
         return self._children is not None
 
+    @property
+    def loaded(self) -> bool:
+        """Have the children of the node been loaded?
+
+        This is only :any:`False` for a node whose children are provided by a loader
+        that hasn't been invoked yet (or whose asynchronous load hasn't completed).
+        """
+        return self._loader is None
+
+    def load_children(self) -> asyncio.Task | None:
+        """Load the children of the node, if they haven't already been loaded.
+
+        If the node's children are provided by a synchronous loader, the children are
+        created and added to the node before this method returns. If the loader is
+        asynchronous, the children are added when it completes; the task performing
+        the load is returned. Calling this method while a load is in progress returns
+        the task that is already performing the load.
+
+        If the loader raises an exception, the node remains unloaded, so the load can
+        be retried. An exception raised by an asynchronous loader is reported on the
+        console, and is raised by the task if it is awaited.
+
+        This is a no-op for nodes that don't have a loader.
+
+        :returns: The task loading the children, or :any:`None` if no asynchronous
+            load is in progress.
+        """
+        if self._loader is None or self._loading is not None or self._source is None:
+            return self._loading
+
+        result = self._loader(self)
+        if inspect.isawaitable(result):
+            self._loading = asyncio.get_event_loop().create_task(
+                self._load_async(result)
+            )
+            self._loading.add_done_callback(_report_load_error)
+            return self._loading
+
+        self._add_loaded_children(result)
+        return None
+
+    async def _load_async(self, result: Awaitable[object]) -> None:
+        try:
+            children = await result
+        finally:
+            self._loading = None
+
+        # If the node was removed from its source while loading, discard the result.
+        if self._source is not None:
+            self._add_loaded_children(children)
+
+    def _add_loaded_children(self, children: object) -> None:
+        self._loader = None
+        if children is not None:
+            for node in self._source._create_nodes(parent=self, value=children):
+                self._children.append(node)
+                self._source.notify(
+                    "insert",
+                    parent=self,
+                    index=len(self._children) - 1,
+                    item=node,
+                )
+
+        # The node itself has changed, as it is now loaded.
+        self._source.notify("change", item=self)
+
     ######################################################################
     # Utility methods to make TreeSource more list-like
     ######################################################################
@@ -114,7 +217,9 @@ class Node(Row[T]):
         :param index: The index at which to insert the new child.
         :param data: The data to insert into the Node as a child. This data will be
             converted into a Node object.
-        :param children: The data for the children of the new child node.
+        :param children: The data for the children of the new child node, or a
+            :class:`~toga.sources.LazyChildren` marker for children that will be
+            loaded on demand.
         :returns: The new added child Node object.
         """
         if self._children is None:
@@ -135,7 +240,9 @@ class Node(Row[T]):
 
         :param data: The data to append as a child of this node. This data will be
             converted into a Node object.
-        :param children: The data for the children of the new child node.
+        :param children: The data for the children of the new child node, or a
+            :class:`~toga.sources.LazyChildren` marker for children that will be
+            loaded on demand.
         :returns: The new added child Node object.
         """
         return self.insert(len(self), data=data, children=children)
@@ -195,6 +302,21 @@ class Node(Row[T]):
             error=f"No child matching {data!r} in {self}",
         )
 
+    def find_all(self, data: object) -> Iterator[Node[T]]:
+        """Iterate over all the child nodes of this node that match all the provided
+        attributes, in order.
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the node contains additional data attributes,
+            they won't be considered as part of the match.
+        :returns: An iterator over the matching Node objects.
+        :raises ValueError: If the node is a leaf node.
+        """
+        if self._children is None:
+            raise ValueError(f"{self} is a leaf node")
+
+        return _iter_matches(self._children, data, self._source._accessors, 0)
+
 
 class TreeSource(Source):
     _roots: list[Node]
@@ -230,6 +352,12 @@ class TreeSource(Source):
         node._source = None
         self.notify("remove", parent=None, index=index, item=node)
 
+    def _discard_changes(self, item: Node) -> None:
+        # The descendants of a removed node are also no longer part of the source.
+        super()._discard_changes(item)
+        for child in item._children or ():
+            self._discard_changes(child)
+
     ######################################################################
     # Factory methods for new nodes
     ######################################################################
@@ -250,7 +378,11 @@ class TreeSource(Source):
         node._parent = parent
         node._source = self
 
-        if children is not None:
+        if isinstance(children, LazyChildren):
+            # The children will be loaded on demand.
+            node._children = []
+            node._loader = children.loader
+        elif children is not None:
             node._children = self._create_nodes(parent=node, value=children)
 
         return node
@@ -301,7 +433,9 @@ class TreeSource(Source):
         :param index: The index into the list of children at which to insert the item.
         :param data: The data to insert into the TreeSource. This data will be converted
             into a Node object.
-        :param children: The data for the children to insert into the TreeSource.
+        :param children: The data for the children to insert into the TreeSource, or
+            a :class:`~toga.sources.LazyChildren` marker for children that will be
+            loaded on demand.
         :returns: The newly constructed Node object.
         :raises ValueError: If the provided parent is not part of this TreeSource.
         """
@@ -324,7 +458,9 @@ class TreeSource(Source):
 
         :param data: The data to append onto the list of children of the given parent.
             This data will be converted into a Node object.
-        :param children: The data for the children to insert into the TreeSource.
+        :param children: The data for the children to insert into the TreeSource, or
+            a :class:`~toga.sources.LazyChildren` marker for children that will be
+            loaded on demand.
         :returns: The newly constructed Node object.
         :raises ValueError: If the provided parent is not part of this TreeSource.
         """
@@ -385,3 +521,14 @@ class TreeSource(Source):
             start=start,
             error=f"No root node matching {data!r} in {self}",
         )
+
+    def find_all(self, data: object) -> Iterator[Node]:
+        """Iterate over all the root nodes of the data source that match all the
+        provided attributes, in order.
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the node contains additional data attributes,
+            they won't be considered as part of the match.
+        :returns: An iterator over the matching Node objects.
+        """
+        return _iter_matches(self._roots, data, self._accessors, 0)
@@ -22,6 +22,9 @@ class TogaApplicator:
                 stacklevel=2,
             )
 
+        # The bounds that were most recently applied to the widget.
+        self._bounds = None
+
     @property
     def widget(self) -> Widget:
         """The widget to which this applicator is assigned.
@@ -36,12 +39,23 @@ class TogaApplicator:
 
     def set_bounds(self) -> None:
         # print("  APPLY LAYOUT", self.widget, self.widget.layout)
-        self.widget._impl.set_bounds(
-            self.widget.layout.absolute_content_left,
-            self.widget.layout.absolute_content_top,
-            self.widget.layout.content_width,
-            self.widget.layout.content_height,
+        layout = self.widget.layout
+        bounds = (
+            layout.absolute_content_left,
+            layout.absolute_content_top,
+            layout.content_width,
+            layout.content_height,
         )
+        if bounds == self._bounds:
+            # If the widget hasn't been laid out since its bounds were last applied,
+            # none of its descendants have been either, so there's nothing to update.
+            if layout._applied:
+                return
+        else:
+            self.widget._impl.set_bounds(*bounds)
+            self._bounds = bounds
+
+        layout._applied = True
         for child in self.widget.children:
             child.applicator.set_bounds()
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from travertino.constants import (  # noqa: F401
@@ -89,16 +91,63 @@ FONT_VARIANT_CHOICES = Choices(*FONT_VARIANTS)
 FONT_WEIGHT_CHOICES = Choices(*FONT_WEIGHTS)
 FONT_SIZE_CHOICES = Choices(integer=True)
 
+# The properties that contribute to the font of a widget
+FONT_PROPERTIES = {
+    "font_family",
+    "font_size",
+    "font_style",
+    "font_variant",
+    "font_weight",
+}
+# The properties that are applied directly to a widget, without affecting its
+# geometry. All other properties (other than font properties) affect the layout.
+NON_LAYOUT_PROPERTIES = {
+    "text_align",
+    "text_direction",
+    "color",
+    "background_color",
+    "visibility",
+}
+
 
 class Pack(BaseStyle):
     class Box(BaseBox):
-        pass
+        def __init__(self, node: Node):
+            super().__init__(node)
+            # The layout of a node is cached, keyed by the allocation it was computed
+            # for. A dirty node (or one given a different allocation) must be laid out
+            # again; a clean node can reuse the layout of its entire subtree.
+            self._dirty = True
+            self._layout_key = None
+            # Has the current layout been applied to the widget?
+            self._applied = False
+
+            # Register to be notified when the intrinsic size of the node changes.
+            node.intrinsic._layout = self
+
+        def dirty(self, **changes: Any) -> None:
+            """Mark the layout of this node as needing to be recomputed.
+
+            The size of a node contributes to the layout of its parent, so all the
+            ancestors of the node are also marked as dirty.
+
+            :param changes: The changes that caused the layout to become dirty. Provided
+                by the intrinsic size of the node; not used.
+            """
+            node = self.node
+            while node is not None:
+                node.layout._dirty = True
+                node = node.parent
 
     class IntrinsicSize(BaseIntrinsicSize):
         pass
 
     _depth = -1
 
+    # The properties that have changed during the current batch. None if no batch is
+    # in progress.
+    _batched_properties = None
+
     def _debug(self, *args: str) -> None:  # pragma: no cover
         print("    " * self.__class__._depth, *args)
 
@@ -116,14 +165,16 @@ class Pack(BaseStyle):
             self._update_property_name(name.replace("-", "_")): value
             for name, value in properties.items()
         }
-        super().update(**properties)
+        with self._batch_apply():
+            super().update(**properties)
 
     # Pack.alignment is still an actual property, despite being deprecated, so we need
     # to suppress deprecation warnings when reapply is called.
     def reapply(self, *args, **kwargs):
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=DeprecationWarning)
-            super().reapply(*args, **kwargs)
+            with self._batch_apply():
+                super().reapply(*args, **kwargs)
 
     DEPRECATED_PROPERTIES = {
         # Map each deprecated property name to its replacement.
@@ -247,9 +298,65 @@ class Pack(BaseStyle):
     # End backwards compatibility
     #######################################################
 
+    @contextmanager
+    def _batch_apply(self) -> Iterator[None]:
+        """Collect the properties that change within the block, and apply them to the
+        widget when the block exits.
+
+        However many properties change, the font is applied at most once, and the layout
+        is refreshed at most once.
+        """
+        if self._batched_properties is not None:
+            # A batch is already in progress; it will apply the changes.
+            yield
+            return
+
+        self._batched_properties = {}
+        try:
+            yield
+        finally:
+            properties = self._batched_properties
+            self._batched_properties = None
+            self._apply_batch(properties)
+
+    def _apply_batch(self, properties: dict[str, None]) -> None:
+        font_changed = False
+        layout_changed = False
+        for prop in properties:
+            if prop in FONT_PROPERTIES:
+                font_changed = True
+            elif prop in NON_LAYOUT_PROPERTIES:
+                self.apply(prop, getattr(self, prop))
+            else:
+                layout_changed = True
+
+        if layout_changed:
+            self._applicator.widget.layout.dirty()
+
+        if font_changed:
+            # Applying a font refreshes the widget; that also takes care of any
+            # change in layout geometry.
+            self._apply_font()
+        elif layout_changed:
+            self._applicator.refresh()
+
+    def _apply_font(self) -> None:
+        self._applicator.set_font(
+            Font(
+                self.font_family,
+                self.font_size,
+                style=self.font_style,
+                variant=self.font_variant,
+                weight=self.font_weight,
+            )
+        )
+
     def apply(self, prop: str, value: object) -> None:
         if self._applicator:
-            if prop == "text_align":
+            if self._batched_properties is not None:
+                # Defer the change until the end of the batch.
+                self._batched_properties[prop] = None
+            elif prop == "text_align":
                 if value is None:
                     if self.text_direction == RTL:
                         value = RIGHT
@@ -257,6 +364,8 @@ class Pack(BaseStyle):
                         value = LEFT
                 self._applicator.set_text_align(value)
             elif prop == "text_direction":
+                # The text direction determines the order of children in a row.
+                self._applicator.widget.layout.dirty()
                 if self.text_align is None:
                     self._applicator.set_text_align(RIGHT if value == RTL else LEFT)
             elif prop == "color":
@@ -274,25 +383,12 @@ class Pack(BaseStyle):
                             break
 
                 self._applicator.set_hidden(value == HIDDEN)
-            elif prop in (
-                "font_family",
-                "font_size",
-                "font_style",
-                "font_variant",
-                "font_weight",
-            ):
-                self._applicator.set_font(
-                    Font(
-                        self.font_family,
-                        self.font_size,
-                        style=self.font_style,
-                        variant=self.font_variant,
-                        weight=self.font_weight,
-                    )
-                )
+            elif prop in FONT_PROPERTIES:
+                self._apply_font()
             else:
                 # Any other style change will cause a change in layout geometry,
-                # so perform a refresh.
+                # so mark the layout as dirty, and perform a refresh.
+                self._applicator.widget.layout.dirty()
                 self._applicator.refresh()
 
     def layout(self, node: Node, viewport: Any) -> None:
@@ -323,6 +419,19 @@ class Pack(BaseStyle):
         use_all_width: bool,
         use_all_height: bool,
     ) -> None:
+        # If nothing in the subtree has changed, and the node has been given the same
+        # allocation as last time, the existing layout of the subtree is still valid.
+        # An explicit width or height overrides the allocation in that dimension.
+        layout_key = (
+            alloc_width if self.width == NONE else None,
+            alloc_height if self.height == NONE else None,
+            use_all_width,
+            use_all_height,
+        )
+        if not node.layout._dirty and node.layout._layout_key == layout_key:
+            # self._debug(f"CACHED LAYOUT for {node}")
+            return
+
         self.__class__._depth += 1
         # self._debug(
         #     f"COMPUTE LAYOUT for {node} available "
@@ -424,6 +533,11 @@ class Pack(BaseStyle):
         node.layout.min_content_width = int(min_width)
         node.layout.min_content_height = int(min_height)
 
+        node.layout._dirty = False
+        node.layout._layout_key = layout_key
+        # The new layout hasn't been applied to the widget yet.
+        node.layout._applied = False
+
         # self._debug("END LAYOUT", node, node.layout)
         self.__class__._depth -= 1
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from builtins import id as identifier
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 from warnings import warn
 
 from travertino.declaration import BaseStyle
@@ -17,6 +19,58 @@ if TYPE_CHECKING:
 StyleT = TypeVar("StyleT", bound=BaseStyle)
 
 
+class _RefreshBatch:
+    """A record of the widgets whose refresh has been deferred by a batch."""
+
+    def __init__(self) -> None:
+        # The number of (nested) batches that are currently open.
+        self.depth = 0
+        # The widgets that have requested a refresh, in the order they were requested.
+        # A dictionary is used as an ordered set.
+        self.widgets: dict[Widget, None] = {}
+
+    def apply(self) -> None:
+        """Perform the deferred refreshes.
+
+        Each widget that requested a refresh is rehinted; then the layout of each tree
+        containing those widgets is refreshed once.
+        """
+        roots = {}
+        for widget in self.widgets:
+            root = widget.root
+            if widget is not root:
+                widget._impl.refresh()
+                widget.layout.dirty()
+            roots[root] = None
+
+        for root in roots:
+            root.refresh()
+
+
+class _RefreshBatchOwner(Protocol):
+    _refresh_batch: _RefreshBatch | None
+
+
+@contextmanager
+def _batch_refresh(owner: _RefreshBatchOwner) -> Iterator[None]:
+    """Defer any refresh of widgets managed by ``owner`` until the end of the block.
+
+    :param owner: The widget, window or app that is opening the batch.
+    """
+    if owner._refresh_batch is None:
+        owner._refresh_batch = _RefreshBatch()
+    batch = owner._refresh_batch
+
+    batch.depth += 1
+    try:
+        yield
+    finally:
+        batch.depth -= 1
+        if batch.depth == 0:
+            owner._refresh_batch = None
+            batch.apply()
+
+
 class Widget(Node):
     _MIN_WIDTH = 100
     _MIN_HEIGHT = 100
@@ -39,6 +93,7 @@ class Widget(Node):
         self._id = str(id if id else identifier(self))
         self._window: Window | None = None
         self._app: App | None = None
+        self._refresh_batch: _RefreshBatch | None = None
 
         # Get factory and assign implementation
         self.factory = get_platform_factory()
@@ -319,9 +374,52 @@ class Widget(Node):
     def enabled(self, value: bool) -> None:
         self._impl.set_enabled(bool(value))
 
+    def _pending_refresh_batch(self) -> _RefreshBatch | None:
+        # Find the batch (if any) that this widget's refreshes should be deferred to.
+        # The innermost batch is used; when it ends, its own refreshes will be
+        # deferred to any enclosing batch.
+        widget = self
+        while widget is not None:
+            if widget._refresh_batch is not None:
+                return widget._refresh_batch
+            widget = widget.parent
+
+        for owner in (self.window, self.app):
+            if owner is not None and owner._refresh_batch is not None:
+                return owner._refresh_batch
+
+        return None
+
+    def batch_refresh(self) -> Iterator[None]:
+        """Obtain a context manager that defers refreshes of this widget and its
+        descendants until the end of the block.
+
+        Any change that would normally cause the layout to be recomputed (such as
+        adding, inserting or removing children, or modifying a style property that
+        affects geometry) is recorded, rather than performed. When the block exits,
+        each affected widget is rehinted, and the layout is recomputed and applied
+        exactly once::
+
+            with box.batch_refresh():
+                for i in range(500):
+                    box.add(toga.Label(f"Row {i}"))
+
+        Batches can be nested; refreshes are only performed when the outermost batch
+        exits.
+        """
+        return _batch_refresh(self)
+
     def refresh(self) -> None:
+        if batch := self._pending_refresh_batch():
+            batch.widgets[self] = None
+            return
+
         self._impl.refresh()
 
+        # Whatever has changed on this widget may have altered its size, so its
+        # cached layout (and that of its ancestors) can't be reused.
+        self.layout.dirty()
+
         # Refresh the layout
         if self._root:
             # We're not the root of the node hierarchy;
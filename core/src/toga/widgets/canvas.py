@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from array import array
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
-from math import cos, pi, sin, tan
+from itertools import chain, islice
+from math import cos, floor, hypot, inf, pi, sin, tan
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -25,12 +28,18 @@ from toga.fonts import (
     Font,
 )
 from toga.handlers import wrapped_handler
+from toga.images import _capture_image
 
 from .base import StyleT, Widget
 
 if TYPE_CHECKING:
     from toga.images import ImageT
 
+# Sets an attribute of a drawing object without checking whether the object has been
+# modified. Used for internal state that doesn't affect how the object is drawn, so
+# that maintaining that state doesn't pay for DrawingObject.__setattr__.
+_set_internal = object.__setattr__
+
 #######################################################################################
 # Simple drawing objects
 #######################################################################################
@@ -56,6 +65,7 @@ class DrawingObject(ABC):
     * :meth:`toga.widgets.canvas.Fill <Context.fill>`
     * :meth:`toga.widgets.canvas.LineTo <Context.line_to>`
     * :meth:`toga.widgets.canvas.MoveTo <Context.move_to>`
+    * :meth:`toga.widgets.canvas.Polyline <Context.polyline>`
     * :meth:`toga.widgets.canvas.QuadraticCurveTo <Context.quadratic_curve_to>`
     * :meth:`toga.widgets.canvas.Rect <Context.rect>`
     * :meth:`toga.widgets.canvas.ResetTransform <Context.reset_transform>`
@@ -66,21 +76,348 @@ class DrawingObject(ABC):
     * :meth:`toga.widgets.canvas.WriteText <Context.write_text>`
     """
 
+    # The context that contains this drawing object (if any).
+    _parent: Context | None = None
+    # The extent of the object on the canvas, as computed by the most recent update of
+    # the canvas's spatial index.
+    _bounds: Bounds | None = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
+    def __setattr__(self, name: str, value: object) -> None:
+        _set_internal(self, name, value)
+        # Modifying a public property of a drawing object means that any cached
+        # rendering of a context containing the object is out of date.
+        if self._parent is not None and not name.startswith("_"):
+            self._parent._invalidate()
+
     @abstractmethod
-    def _draw(self, impl: Any, **kwargs: Any) -> None: ...
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        """Add the backend operations that draw this object to a list of instructions.
+
+        :param impl: The backend implementation of the canvas.
+        :param instructions: The list of instructions to extend. Each instruction is a
+            tuple of a backend method, positional arguments, and keyword arguments.
+        :param kwargs: The drawing arguments inherited from the containing contexts.
+            This dictionary is shared by every object in the context, so it must not
+            be modified.
+        """
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        """Compute the extent of this object on the canvas.
+
+        :param state: The transform and path state at the point the object is drawn.
+            The object should update the state to reflect its own effect.
+        :returns: The bounds of the object in canvas coordinates, ``None`` if the
+            object doesn't draw anything, or :data:`_UNBOUNDED` if the extent of the
+            object can't be determined.
+        """
+        return _UNBOUNDED
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float] | None:
+        """The bounding box of the object on its canvas, as a tuple of ``(x, y, width,
+        height)`` in canvas coordinates, taking into account any transformations that
+        apply to the object.
+
+        Bounding boxes are approximate; curves, arcs and stroked lines may report a box
+        that is slightly larger than the area that is actually drawn, and the extent of
+        text is based on :meth:`Canvas.measure_text`.
+
+        This will be ``None`` if the object doesn't draw anything by itself (e.g., a
+        ``MoveTo`` or ``Rotate``), if its extent can't be determined, or if the object
+        isn't part of a canvas.
+        """
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        canvas = getattr(root, "_canvas", None)
+        if canvas is None or canvas.context is not root:
+            return None
+
+        canvas._spatial_index()
+        bounds = self._bounds
+        if bounds is None or bounds[0] == -inf:
+            return None
+        left, top, right, bottom = bounds
+        return (left, top, right - left, bottom - top)
+
+
+#######################################################################################
+# Bounding boxes and hit testing
+#######################################################################################
+
+# A bounding box, as (left, top, right, bottom).
+Bounds = tuple[float, float, float, float]
+
+# The bounds of an object whose extent can't be determined.
+_UNBOUNDED: Bounds = (-inf, -inf, inf, inf)
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def _union(first: Bounds | None, second: Bounds | None) -> Bounds | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (
+        min(first[0], second[0]),
+        min(first[1], second[1]),
+        max(first[2], second[2]),
+        max(first[3], second[3]),
+    )
+
+
+def _intersects(first: Bounds, second: Bounds) -> bool:
+    return (
+        first[0] <= second[2]
+        and second[0] <= first[2]
+        and first[1] <= second[3]
+        and second[1] <= first[3]
+    )
+
+
+class _MeasureState:
+    """The transform and path state while computing the bounds of drawing objects.
+
+    Transforms are tracked as an affine matrix ``(a, b, c, d, e, f)``, which maps a
+    point ``(x, y)`` to ``(a*x + c*y + e, b*x + d*y + f)``.
+    """
+
+    def __init__(self, canvas: Canvas):
+        self.canvas = canvas
+        self.matrix = _IDENTITY
+        # The current point, and the start of the current subpath, in user space.
+        self.current: tuple[float, float] | None = None
+        self.start: tuple[float, float] | None = None
+        # The bounds of the current path, in canvas coordinates.
+        self.path: Bounds | None = None
+        # The distance that drawing extends beyond a path (e.g., half the width of a
+        # stroke), in user space.
+        self.inflate = 0.0
+
+    def measure(self, obj: DrawingObject) -> Bounds | None:
+        bounds = obj._measure(self)
+        _set_internal(obj, "_bounds", bounds)
+        return bounds
+
+    def save(self) -> tuple:
+        """Return a snapshot of the state."""
+        return (self.matrix, self.inflate, self.current, self.start, self.path)
+
+    def restore(self, saved: tuple) -> None:
+        """Restore the state from a snapshot returned by :meth:`save`."""
+        self.matrix, self.inflate, self.current, self.start, self.path = saved
+
+    def begin_path(self) -> None:
+        self.current = self.start = self.path = None
+
+    def move_to(self, x: float, y: float) -> None:
+        self.current = self.start = (x, y)
+
+    def line_to(self, *points: tuple[float, float]) -> Bounds | None:
+        """Extend the path from the current point through a series of points, and
+        return the bounds of the new segments."""
+        if self.current is None:
+            # The path has no current point, so the first point starts a new subpath.
+            self.move_to(*points[0])
+            if len(points) == 1:
+                return None
+        bounds = self.segment([self.current, *points])
+        self.current = points[-1]
+        return bounds
+
+    def segment(self, points: Iterable[tuple[float, float]]) -> Bounds:
+        """Add a segment, enclosed by a collection of points in user space, to the
+        current path, and return the bounds of the segment."""
+        bounds = self.box(points)
+        self.path = _union(self.path, bounds)
+        return bounds
+
+    def paint(self, width: float = 0.0) -> Bounds | None:
+        """Return the bounds of the current path when it is drawn, extended by
+        ``width`` in user space."""
+        if self.path is None or width == 0.0:
+            return self.path
+        a, b, c, d = self.matrix[:4]
+        width *= max(hypot(a, b), hypot(c, d))
+        left, top, right, bottom = self.path
+        return (left - width, top - width, right + width, bottom + width)
+
+    def multiply(self, a: float, b: float, c: float, d: float, e: float, f: float):
+        """Apply a transformation to user space."""
+        a0, b0, c0, d0, e0, f0 = self.matrix
+        self.matrix = (
+            a0 * a + c0 * b,
+            b0 * a + d0 * b,
+            a0 * c + c0 * d,
+            b0 * c + d0 * d,
+            a0 * e + c0 * f + e0,
+            b0 * e + d0 * f + f0,
+        )
+
+    def box(self, points: Iterable[tuple[float, float]]) -> Bounds:
+        """Return the bounds in canvas coordinates of a collection of points in user
+        space."""
+        xs, ys = zip(*points)
+        inflate = self.inflate
+        return self.transform_box(
+            min(xs) - inflate,
+            min(ys) - inflate,
+            max(xs) + inflate,
+            max(ys) + inflate,
+        )
+
+    def transform_box(
+        self, left: float, top: float, right: float, bottom: float
+    ) -> Bounds:
+        if self.matrix == _IDENTITY:
+            return (left, top, right, bottom)
+
+        a, b, c, d, e, f = self.matrix
+        corners = [(left, top), (right, top), (left, bottom), (right, bottom)]
+        xs = [a * x + c * y + e for x, y in corners]
+        ys = [b * x + d * y + f for x, y in corners]
+        return (min(xs), min(ys), max(xs), max(ys))
+
+
+class _SpatialIndex:
+    """A uniform grid of the drawing objects in a context, keyed by the cells that
+    their bounds overlap.
+
+    Each context has its own index of the objects it directly contains, so when a
+    context is modified, only the index of that context (and of the contexts that
+    contain it) needs to be rebuilt.
+    """
+
+    # The size of each cell of the grid, in canvas coordinates.
+    CELL_SIZE = 64.0
+    # Objects that overlap more cells than this are stored in a separate list that is
+    # always checked, rather than in every cell.
+    MAX_CELLS = 64
+
+    def __init__(self):
+        # The objects in the index, keyed by their position in the context.
+        self.objects: dict[int, tuple[DrawingObject, Bounds]] = {}
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.large: list[int] = []
+
+    def _cell_range(self, bounds: Bounds) -> tuple[range, range]:
+        left, top, right, bottom = bounds
+        size = self.CELL_SIZE
+        return (
+            range(floor(left / size), floor(right / size) + 1),
+            range(floor(top / size), floor(bottom / size) + 1),
+        )
+
+    def add(self, position: int, obj: DrawingObject, bounds: Bounds) -> None:
+        if bounds[0] == -inf:
+            # An object whose extent is unknown can't be found; but a context with an
+            # unknown extent may contain objects that can, so it is always checked.
+            if isinstance(obj, Context):
+                self.objects[position] = (obj, bounds)
+                self.large.append(position)
+            return
+
+        self.objects[position] = (obj, bounds)
+        columns, rows = self._cell_range(bounds)
+        if len(columns) * len(rows) > self.MAX_CELLS:
+            self.large.append(position)
+        else:
+            for column in columns:
+                for row in rows:
+                    self.cells.setdefault((column, row), []).append(position)
+
+    def query(self, bounds: Bounds) -> list[DrawingObject]:
+        """Return the objects whose bounds intersect the given bounds, including the
+        objects in any contexts they contain, from the topmost (most recently drawn)
+        to the bottommost."""
+        columns, rows = self._cell_range(bounds)
+        if len(columns) * len(rows) > len(self.objects):
+            # Checking every object is cheaper than checking every cell.
+            candidates = set(self.objects)
+        else:
+            candidates = set(self.large)
+            for column in columns:
+                for row in rows:
+                    candidates.update(self.cells.get((column, row), ()))
+
+        found = []
+        for position in sorted(candidates, reverse=True):
+            obj, obj_bounds = self.objects[position]
+            if _intersects(obj_bounds, bounds):
+                # The content of a context is drawn on top of the context itself.
+                if isinstance(obj, Context):
+                    found.extend(obj._index.query(bounds))
+                if obj_bounds[0] != -inf:
+                    found.append(obj)
+        return found
+
+
+#######################################################################################
+# Instruction replay
+#######################################################################################
+
+
+def _replay(instructions: list, kwargs: dict, clip: Bounds | None = None) -> None:
+    """Invoke a list of compiled instructions.
+
+    :param instructions: The instructions to invoke.
+    :param kwargs: Additional keyword arguments to pass to every instruction. If an
+        instruction provides an argument with the same name, the instruction's value
+        is used.
+    :param clip: If provided, the region of the canvas that is being drawn. Groups of
+        instructions for objects whose bounds are entirely outside this region are
+        skipped.
+    """
+    # Instructions in the same context share a dictionary of keyword arguments, so
+    # each dictionary only needs to be combined with the additional arguments once.
+    merged: dict[int, dict] = {}
+    instructions = iter(instructions)
+    for method, args, instruction_kwargs in instructions:
+        if method is None:
+            # The start of a group of instructions that draws a self-contained object.
+            # If the object is entirely outside the clip region, the instructions in
+            # the group are consumed without being invoked, and the group's reset
+            # method (if any) is invoked instead, so that the backend is left in the
+            # same state as if the group had been drawn.
+            obj, length, method = args
+            bounds = obj._bounds
+            if clip is None or (bounds is not None and _intersects(bounds, clip)):
+                continue
+            next(islice(instructions, length, length), None)
+            if method is None:
+                continue
+            args = ()
+
+        try:
+            call_kwargs = merged[id(instruction_kwargs)]
+        except KeyError:
+            call_kwargs = merged[id(instruction_kwargs)] = {
+                **kwargs,
+                **instruction_kwargs,
+            }
+        method(*args, **call_kwargs)
 
 
 class BeginPath(DrawingObject):
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.begin_path(**kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.begin_path, (), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.begin_path()
+        return None
 
 
 class ClosePath(DrawingObject):
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.close_path(**kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.close_path, (), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.current = state.start
+        return None
 
 
 class Fill(DrawingObject):
@@ -99,8 +436,11 @@ class Fill(DrawingObject):
             f"fill_rule={self.fill_rule})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.fill(self.color, self.fill_rule, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.fill, (self.color, self.fill_rule), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        return state.paint()
 
     @property
     def fill_rule(self) -> FillRule:
@@ -154,8 +494,13 @@ class Stroke(DrawingObject):
             f"line_width={self.line_width}, line_dash={self.line_dash!r})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.stroke(self.color, self.line_width, self.line_dash, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (impl.stroke, (self.color, self.line_width, self.line_dash), kwargs)
+        )
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        return state.paint(self.line_width / 2)
 
     @property
     def color(self) -> Color:
@@ -207,8 +552,12 @@ class MoveTo(DrawingObject):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.move_to(self.x, self.y, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.move_to, (self.x, self.y), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.move_to(self.x, self.y)
+        return None
 
 
 class LineTo(DrawingObject):
@@ -219,8 +568,11 @@ class LineTo(DrawingObject):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.line_to(self.x, self.y, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.line_to, (self.x, self.y), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        return state.line_to((self.x, self.y))
 
 
 class BezierCurveTo(DrawingObject):
@@ -241,9 +593,19 @@ class BezierCurveTo(DrawingObject):
             f"x={self.x}, y={self.y})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.bezier_curve_to(
-            self.cp1x, self.cp1y, self.cp2x, self.cp2y, self.x, self.y, **kwargs
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (
+                impl.bezier_curve_to,
+                (self.cp1x, self.cp1y, self.cp2x, self.cp2y, self.x, self.y),
+                kwargs,
+            )
+        )
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        # A Bézier curve is contained by the hull of its control points.
+        return state.line_to(
+            (self.cp1x, self.cp1y), (self.cp2x, self.cp2y), (self.x, self.y)
         )
 
 
@@ -260,8 +622,45 @@ class QuadraticCurveTo(DrawingObject):
             f"(cpx={self.cpx}, cpy={self.cpy}, x={self.x}, y={self.y})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.quadratic_curve_to(self.cpx, self.cpy, self.x, self.y, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (impl.quadratic_curve_to, (self.cpx, self.cpy, self.x, self.y), kwargs)
+        )
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        return state.line_to((self.cpx, self.cpy), (self.x, self.y))
+
+
+def _measure_arc(
+    state: _MeasureState,
+    x: float,
+    y: float,
+    radiusx: float,
+    radiusy: float,
+    rotation: float,
+    startangle: float,
+    endangle: float,
+) -> Bounds:
+    def point(angle: float) -> tuple[float, float]:
+        px = radiusx * cos(angle)
+        py = radiusy * sin(angle)
+        return (
+            x + px * cos(rotation) - py * sin(rotation),
+            y + px * sin(rotation) + py * cos(rotation),
+        )
+
+    # The arc is contained by the circle around its longest radius. It is also joined
+    # to the current point (if any) by a straight line.
+    radius = max(abs(radiusx), abs(radiusy))
+    points = [(x - radius, y - radius), (x + radius, y + radius)]
+    if state.current is None:
+        state.start = point(startangle)
+    else:
+        points.append(state.current)
+
+    bounds = state.segment(points)
+    state.current = point(endangle)
+    return bounds
 
 
 class Arc(DrawingObject):
@@ -288,15 +687,32 @@ class Arc(DrawingObject):
             f"endangle={self.endangle:.3f}, anticlockwise={self.anticlockwise})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.arc(
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (
+                impl.arc,
+                (
+                    self.x,
+                    self.y,
+                    self.radius,
+                    self.startangle,
+                    self.endangle,
+                    self.anticlockwise,
+                ),
+                kwargs,
+            )
+        )
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        return _measure_arc(
+            state,
             self.x,
             self.y,
             self.radius,
+            self.radius,
+            0.0,
             self.startangle,
             self.endangle,
-            self.anticlockwise,
-            **kwargs,
         )
 
 
@@ -329,8 +745,27 @@ class Ellipse(DrawingObject):
             f"endangle={self.endangle:.3f}, anticlockwise={self.anticlockwise})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.ellipse(
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (
+                impl.ellipse,
+                (
+                    self.x,
+                    self.y,
+                    self.radiusx,
+                    self.radiusy,
+                    self.rotation,
+                    self.startangle,
+                    self.endangle,
+                    self.anticlockwise,
+                ),
+                kwargs,
+            )
+        )
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        return _measure_arc(
+            state,
             self.x,
             self.y,
             self.radiusx,
@@ -338,8 +773,6 @@ class Ellipse(DrawingObject):
             self.rotation,
             self.startangle,
             self.endangle,
-            self.anticlockwise,
-            **kwargs,
         )
 
 
@@ -356,8 +789,85 @@ class Rect(DrawingObject):
             f"width={self.width}, height={self.height})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.rect(self.x, self.y, self.width, self.height, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (impl.rect, (self.x, self.y, self.width, self.height), kwargs)
+        )
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.move_to(self.x, self.y)
+        return state.segment(
+            [(self.x, self.y), (self.x + self.width, self.y + self.height)]
+        )
+
+
+def _coordinates(points: object) -> array:
+    """Convert a collection of points into a flat array of coordinates.
+
+    :param points: A buffer or flat sequence of numbers, or a sequence of ``(x, y)``
+        pairs.
+    :returns: An array of floats, alternating between X and Y coordinates.
+    """
+    try:
+        view = memoryview(points)
+    except TypeError:
+        values = list(points)
+    else:
+        with view:
+            if view.format == "d" and view.c_contiguous:
+                # The data is already in the right format; copy it directly.
+                coordinates = array("d")
+                coordinates.frombytes(view.cast("B"))
+                values = None
+            else:
+                values = view.tolist()
+
+    if values is not None:
+        try:
+            coordinates = array("d", values)
+        except TypeError:
+            # A sequence of (x, y) pairs, or a multi-dimensional buffer.
+            coordinates = array("d", chain.from_iterable(values))
+
+    if len(coordinates) % 2:
+        raise ValueError("points must contain an even number of coordinates")
+    return coordinates
+
+
+class Polyline(DrawingObject):
+    def __init__(self, points: object, closed: bool = False):
+        self.points = points
+        self.closed = closed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(points=<{len(self.points) // 2} points>, "
+            f"closed={self.closed})"
+        )
+
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.polyline, (self.points, self.closed), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        points = self.points
+        if not points:
+            return None
+        xs = points[0::2]
+        ys = points[1::2]
+        state.move_to(xs[0], ys[0])
+        bounds = state.segment([(min(xs), min(ys)), (max(xs), max(ys))])
+        state.current = (xs[-1], ys[-1])
+        return bounds
+
+    @property
+    def points(self) -> array:
+        """The points on the line, as a flat array of alternating X and Y
+        coordinates."""
+        return self._points
+
+    @points.setter
+    def points(self, value: object) -> None:
+        self._points = _coordinates(value)
 
 
 class WriteText(DrawingObject):
@@ -381,11 +891,38 @@ class WriteText(DrawingObject):
             f"font={self.font!r}, baseline={self.baseline})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.write_text(
-            str(self.text), self.x, self.y, self.font._impl, self.baseline, **kwargs
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append(
+            (
+                impl.write_text,
+                (str(self.text), self.x, self.y, self.font._impl, self.baseline),
+                kwargs,
+            )
         )
 
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        width, height = state.canvas.measure_text(str(self.text), self.font)
+        if self.baseline == Baseline.TOP:
+            top = self.y
+        elif self.baseline == Baseline.MIDDLE:
+            top = self.y - height / 2
+        elif self.baseline == Baseline.BOTTOM:
+            top = self.y - height
+        else:
+            impl = state.canvas._impl
+            if hasattr(impl, "text_ascent"):
+                # The alphabetic baseline of the first line is the font's ascent below
+                # the top of the text.
+                top = self.y - impl.text_ascent(self.font._impl)
+            else:
+                # The ascent and descent of the font are only known to be within a
+                # line height of the baseline; extend the bounds by a line, so that
+                # the descenders of the last line are included.
+                line_height = height / max(len(str(self.text).splitlines()), 1)
+                top = self.y - line_height
+                height += line_height
+        return state.box([(self.x, top), (self.x + width, top + height)])
+
     @property
     def font(self) -> Font:
         return self._font
@@ -405,8 +942,13 @@ class Rotate(DrawingObject):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(radians={self.radians:.3f})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.rotate(self.radians, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.rotate, (self.radians,), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        c, s = cos(self.radians), sin(self.radians)
+        state.multiply(c, s, -s, c, 0.0, 0.0)
+        return None
 
 
 class Scale(DrawingObject):
@@ -417,8 +959,12 @@ class Scale(DrawingObject):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(sx={self.sx:.3f}, sy={self.sy:.3f})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.scale(self.sx, self.sy, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.scale, (self.sx, self.sy), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.multiply(self.sx, 0.0, 0.0, self.sy, 0.0, 0.0)
+        return None
 
 
 class Translate(DrawingObject):
@@ -429,13 +975,21 @@ class Translate(DrawingObject):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(tx={self.tx}, ty={self.ty})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.translate(self.tx, self.ty, **kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.translate, (self.tx, self.ty), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.multiply(1.0, 0.0, 0.0, 1.0, self.tx, self.ty)
+        return None
 
 
 class ResetTransform(DrawingObject):
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.reset_transform(**kwargs)
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.reset_transform, (), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        state.matrix = _IDENTITY
+        return None
 
 
 #######################################################################################
@@ -451,17 +1005,162 @@ class Context(DrawingObject):
     or use :any:`Canvas.context` to access the root context of the canvas.
     """
 
-    def __init__(self, canvas: toga.Canvas, **kwargs: Any):
+    def __init__(self, canvas: toga.Canvas, cached: bool = False, **kwargs: Any):
         # kwargs used to support multiple inheritance
         super().__init__(**kwargs)
         self._canvas = canvas
+        self._cached = bool(cached)
+        # A counter that is incremented whenever the content of this context (or any
+        # context it contains) is modified. Backends use this to determine if a cached
+        # rendering of the context can be reused.
+        self._version = 0
+        # The compiled instructions for the content of the context, as a tuple of the
+        # backend and version for which they were compiled, and the instructions.
+        self._compiled: tuple[Any, int, list] | None = None
+        # The spatial index of the objects in the context; and the version of the
+        # context, and the measurement state on entry and exit, when it was built.
+        self._index: _SpatialIndex | None = None
+        self._measured: tuple[int, tuple, tuple] | None = None
         self.drawing_objects: list[DrawingObject] = []
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.push_context(**kwargs)
+    # Is the context self-contained (i.e., does it draw everything that it defines),
+    # so that it can be skipped if it is outside the region being drawn?
+    _clippable = False
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        # The public properties of a context (e.g., the color of a fill context) affect
+        # everything it draws, so modifying one modifies the content of the context.
+        if not name.startswith("_"):
+            self._invalidate()
+
+    def _draw(self, impl: Any, clip: Bounds | None = None, **kwargs: Any) -> None:
+        """Draw the context.
+
+        :param impl: The backend that is drawing the context.
+        :param clip: If provided, the ``(left, top, right, bottom)`` region of the
+            canvas that is being drawn. Self-contained objects that lie entirely
+            outside this region will not be drawn.
+        :param kwargs: Additional arguments to pass to every drawing operation.
+        """
+        if clip is not None and self._canvas is not None:
+            # Make sure the bounds of every object are up to date.
+            self._canvas._spatial_index()
+
+        # Not every backend is able to cache the rendering of a context; if the
+        # backend can't, the context is drawn every time.
+        if self._cached and hasattr(impl, "draw_layer"):
+            if clip is None or (
+                self._bounds is not None and _intersects(self._bounds, clip)
+            ):
+                impl.draw_layer(self, self._version, **kwargs)
+        else:
+            self._draw_layer(impl, clip=clip, **kwargs)
+
+    def _draw_layer(self, impl: Any, clip: Bounds | None = None, **kwargs: Any) -> None:
+        """Draw the content of the context. Used by backends to render a cached
+        context."""
+        # Rather than traversing the tree of drawing objects on every redraw, the tree
+        # is compiled into a flat list of instructions, which is reused until the
+        # content of the context is modified.
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not impl or compiled[1] != self._version:
+            instructions: list = []
+            self._compile_layer(impl, instructions, {})
+            compiled = self._compiled = (impl, self._version, instructions)
+
+        _replay(compiled[2], kwargs, clip)
+
+    def _compile(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        cached = self._cached and hasattr(impl, "draw_layer")
+        if cached or self._clippable:
+            # Start a group of instructions that can be skipped if the context is
+            # outside the region being drawn. The length of the group isn't known
+            # until the context has been compiled.
+            start = len(instructions)
+            instructions.append(None)
+        if cached:
+            instructions.append((impl.draw_layer, (self, self._version), kwargs))
+        else:
+            self._compile_layer(impl, instructions, kwargs)
+        if cached or self._clippable:
+            # A closed path context starts a new path, so if it is skipped, the path
+            # must still be reset.
+            reset = None if cached else impl.begin_path
+            length = len(instructions) - start - 1
+            instructions[start] = (None, (self, length, reset), kwargs)
+
+    def _compile_layer(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        """Add the backend operations that draw the content of the context to a list
+        of instructions."""
+        instructions.append((impl.push_context, (), kwargs))
         for obj in self.drawing_objects:
-            obj._draw(impl, **kwargs)
-        impl.pop_context(**kwargs)
+            obj._compile(impl, instructions, kwargs)
+        instructions.append((impl.pop_context, (), kwargs))
+
+    def _measure(self, state: _MeasureState) -> Bounds | None:
+        # If the context hasn't been modified, and it is drawn in the same state, the
+        # bounds of its content are unchanged, so the context doesn't need to be
+        # measured again.
+        entry = self._entry_state(state)
+        measured = self._measured
+        if measured and measured[0] == self._version and measured[1] == entry:
+            state.restore(measured[2])
+            return self._bounds
+
+        # The transform is restored when the context is popped.
+        matrix = state.matrix
+        inflate = state.inflate
+        self._index = _SpatialIndex()
+        bounds = self._measure_content(state)
+        state.matrix = matrix
+        state.inflate = inflate
+        self._measured = (self._version, entry, state.save())
+        return bounds
+
+    def _entry_state(self, state: _MeasureState) -> tuple:
+        """The parts of the measurement state that can affect the content of the
+        context."""
+        return state.save()
+
+    def _measure_content(self, state: _MeasureState) -> Bounds | None:
+        bounds = None
+        for position, obj in enumerate(self.drawing_objects):
+            obj_bounds = state.measure(obj)
+            if obj_bounds is not None:
+                self._index.add(position, obj, obj_bounds)
+            bounds = _union(bounds, obj_bounds)
+        return bounds
+
+    def _invalidate(self) -> None:
+        # Mark this context, and every context that contains it, as modified.
+        context = self
+        while context is not None:
+            _set_internal(context, "_version", context._version + 1)
+            context = context._parent
+
+    @property
+    def cached(self) -> bool:
+        """Should the rendered content of this context be cached?
+
+        If the context is cached, the backend will render its content once, and reuse
+        that rendering on subsequent redraws until a drawing object in the context (or
+        in any context it contains) is added, removed or modified. This makes it
+        possible to redraw a complex canvas at a cost that is proportional to what has
+        changed; for example, the grid and axes of a chart can be placed in a cached
+        context, so that only the data needs to be drawn when the chart is updated.
+
+        A cached context is rendered as an image; so it should be self-contained. Any
+        path that it defines must be filled or stroked inside the context.
+
+        Caching is an optimization, and isn't supported by every backend; if the backend
+        doesn't support caching, the context will be drawn normally.
+        """
+        return self._cached
+
+    @cached.setter
+    def cached(self, value: object) -> None:
+        self._cached = bool(value)
 
     ###########################################################################
     # Methods to keep track of the canvas, automatically redraw it
@@ -494,6 +1193,8 @@ class Context(DrawingObject):
         :param obj: The drawing object to add to the context.
         """
         self.drawing_objects.append(obj)
+        _set_internal(obj, "_parent", self)
+        self._invalidate()
         self.redraw()
 
     def insert(self, index: int, obj: DrawingObject) -> None:
@@ -503,6 +1204,8 @@ class Context(DrawingObject):
         :param obj: The drawing object to add to the context.
         """
         self.drawing_objects.insert(index, obj)
+        _set_internal(obj, "_parent", self)
+        self._invalidate()
         self.redraw()
 
     def remove(self, obj: DrawingObject) -> None:
@@ -511,11 +1214,18 @@ class Context(DrawingObject):
         :param obj: The drawing object to remove.
         """
         self.drawing_objects.remove(obj)
+        if obj._parent is self:
+            _set_internal(obj, "_parent", None)
+        self._invalidate()
         self.redraw()
 
     def clear(self) -> None:
         """Remove all drawing objects from the context."""
+        for obj in self.drawing_objects:
+            if obj._parent is self:
+                _set_internal(obj, "_parent", None)
         self.drawing_objects.clear()
+        self._invalidate()
         self.redraw()
 
     ###########################################################################
@@ -705,6 +1415,32 @@ class Context(DrawingObject):
         self.append(rect)
         return rect
 
+    def polyline(self, points: object, closed: bool = False) -> Polyline:
+        """Draw a sequence of connected line segments in the canvas context.
+
+        A new subpath is started at the first point, and a line segment is drawn to
+        each subsequent point. The backend receives all the points in a single
+        operation, so this is much more efficient than a long sequence of
+        :meth:`~toga.widgets.canvas.Context.line_to` operations (e.g., when plotting
+        a large data series).
+
+        The points will be copied into a flat :class:`array.array` of coordinates. If
+        you modify the points after drawing the line, you must assign a new value to
+        the ``points`` property of the drawing object.
+
+        :param points: The points on the line. This can be a flat sequence of
+            coordinates (``[x0, y0, x1, y1, ...]``), a sequence of ``(x, y)`` pairs, or
+            any object that supports the buffer protocol (such as an
+            :class:`array.array`, or a NumPy array).
+        :param closed: Should a line segment be drawn from the last point back to the
+            first point?
+        :returns: The ``Polyline`` :any:`DrawingObject` for the operation.
+        :raises ValueError: If the points don't contain an even number of coordinates.
+        """
+        polyline = Polyline(points, closed)
+        self.append(polyline)
+        return polyline
+
     def fill(
         self,
         color: str = BLACK,
@@ -831,13 +1567,15 @@ class Context(DrawingObject):
     ###########################################################################
 
     @contextmanager
-    def Context(self) -> Iterator[Context]:
+    def Context(self, cached: bool = False) -> Iterator[Context]:
         """Construct and yield a new sub-:class:`~toga.widgets.canvas.Context` within
         this context.
 
+        :param cached: Should the rendered content of the new context be
+            :attr:`~toga.widgets.canvas.Context.cached`?
         :yields: The new :class:`~toga.widgets.canvas.Context` object.
         """
-        context = Context(canvas=self._canvas)
+        context = Context(canvas=self._canvas, cached=cached)
         self.append(context)
         yield context
         self.redraw()
@@ -1004,19 +1742,29 @@ class ClosedPathContext(Context):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        """Used by parent to draw all objects that are part of the context."""
-        impl.push_context(**kwargs)
-        impl.begin_path(**kwargs)
+    def _compile_layer(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.push_context, (), kwargs))
+        instructions.append((impl.begin_path, (), kwargs))
         if self.x is not None and self.y is not None:
-            impl.move_to(x=self.x, y=self.y, **kwargs)
+            instructions.append((impl.move_to, (self.x, self.y), kwargs))
 
-        sub_kwargs = kwargs.copy()
         for obj in self.drawing_objects:
-            obj._draw(impl, **sub_kwargs)
+            obj._compile(impl, instructions, kwargs)
 
-        impl.close_path(**kwargs)
-        impl.pop_context(**kwargs)
+        instructions.append((impl.close_path, (), kwargs))
+        instructions.append((impl.pop_context, (), kwargs))
+
+    def _entry_state(self, state: _MeasureState) -> tuple:
+        # The context starts a new path, so the path that precedes it doesn't matter.
+        return (state.matrix, state.inflate)
+
+    def _measure_content(self, state: _MeasureState) -> Bounds | None:
+        state.begin_path()
+        if self.x is not None and self.y is not None:
+            state.move_to(self.x, self.y)
+        bounds = super()._measure_content(state)
+        state.current = state.start
+        return bounds
 
 
 class FillContext(ClosedPathContext):
@@ -1060,26 +1808,34 @@ class FillContext(ClosedPathContext):
             f"color={self.color!r}, fill_rule={self.fill_rule})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.push_context(**kwargs)
-        impl.begin_path(**kwargs)
+    def _compile_layer(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.push_context, (), kwargs))
+        instructions.append((impl.begin_path, (), kwargs))
         if self.x is not None and self.y is not None:
-            impl.move_to(x=self.x, y=self.y, **kwargs)
+            instructions.append((impl.move_to, (self.x, self.y), kwargs))
 
-        sub_kwargs = kwargs.copy()
-        sub_kwargs.update(fill_color=self.color, fill_rule=self.fill_rule)
+        sub_kwargs = {**kwargs, "fill_color": self.color, "fill_rule": self.fill_rule}
         for obj in self.drawing_objects:
-            obj._draw(impl, **sub_kwargs)
+            obj._compile(impl, instructions, sub_kwargs)
 
         # Fill passes fill_rule to its children; but that is also a valid argument for
         # fill(), so if a fill context is a child of a fill context, there's an argument
         # collision. Duplicate the kwargs and explicitly overwrite to avoid the
         # collision.
-        draw_kwargs = kwargs.copy()
-        draw_kwargs.update(fill_rule=self.fill_rule)
-        impl.fill(self.color, **draw_kwargs)
+        draw_kwargs = {**kwargs, "fill_rule": self.fill_rule}
+        instructions.append((impl.fill, (self.color,), draw_kwargs))
 
-        impl.pop_context(**kwargs)
+        instructions.append((impl.pop_context, (), kwargs))
+
+    _clippable = True
+
+    def _measure_content(self, state: _MeasureState) -> Bounds | None:
+        state.begin_path()
+        if self.x is not None and self.y is not None:
+            state.move_to(self.x, self.y)
+        bounds = _union(Context._measure_content(self, state), state.paint())
+        state.begin_path()
+        return bounds
 
     @property
     def color(self) -> Color:
@@ -1133,30 +1889,47 @@ class StrokeContext(ClosedPathContext):
             f"line_width={self.line_width}, line_dash={self.line_dash!r})"
         )
 
-    def _draw(self, impl: Any, **kwargs: Any) -> None:
-        impl.push_context(**kwargs)
-        impl.begin_path(**kwargs)
+    def _compile_layer(self, impl: Any, instructions: list, kwargs: dict) -> None:
+        instructions.append((impl.push_context, (), kwargs))
+        instructions.append((impl.begin_path, (), kwargs))
 
         if self.x is not None and self.y is not None:
-            impl.move_to(x=self.x, y=self.y, **kwargs)
+            instructions.append((impl.move_to, (self.x, self.y), kwargs))
 
-        sub_kwargs = kwargs.copy()
-        sub_kwargs["stroke_color"] = self.color
-        sub_kwargs["line_width"] = self.line_width
-        sub_kwargs["line_dash"] = self.line_dash
+        sub_kwargs = {
+            **kwargs,
+            "stroke_color": self.color,
+            "line_width": self.line_width,
+            "line_dash": self.line_dash,
+        }
         for obj in self.drawing_objects:
-            obj._draw(impl, **sub_kwargs)
+            obj._compile(impl, instructions, sub_kwargs)
 
         # Stroke passes line_width and line_dash to its children; but those two are also
         # valid arguments for stroke, so if a stroke context is a child of stroke
         # context, there's an argument collision. Duplicate the kwargs and explicitly
         # overwrite to avoid the collision
-        draw_kwargs = kwargs.copy()
-        draw_kwargs["line_width"] = self.line_width
-        draw_kwargs["line_dash"] = self.line_dash
-        impl.stroke(self.color, **draw_kwargs)
+        draw_kwargs = {
+            **kwargs,
+            "line_width": self.line_width,
+            "line_dash": self.line_dash,
+        }
+        instructions.append((impl.stroke, (self.color,), draw_kwargs))
+
+        instructions.append((impl.pop_context, (), kwargs))
 
-        impl.pop_context(**kwargs)
+    _clippable = True
+
+    def _measure_content(self, state: _MeasureState) -> Bounds | None:
+        state.begin_path()
+        if self.x is not None and self.y is not None:
+            state.move_to(self.x, self.y)
+        # Everything drawn in the context is stroked, so it extends beyond its path by
+        # half the width of the line.
+        state.inflate = self.line_width / 2
+        bounds = Context._measure_content(self, state)
+        state.begin_path()
+        return bounds
 
     @property
     def color(self) -> Color:
@@ -1243,6 +2016,11 @@ class Canvas(Widget):
 
         self._context = Context(canvas=self)
 
+        # Has the canvas been modified since the backend was last asked to redraw it?
+        # And the number of (nested) redraw batches that are currently open.
+        self._dirty = False
+        self._redraw_depth = 0
+
         # Set all the properties
         self.on_resize = on_resize
         self.on_press = on_press
@@ -1283,16 +2061,97 @@ class Canvas(Widget):
         The Canvas will be automatically redrawn after adding or removing a drawing
         object, or when the Canvas resizes. However, when you modify the properties of a
         drawing object, you must call ``redraw`` manually.
+
+        The canvas is marked as needing a redraw, and is redrawn on the next iteration
+        of the event loop; no matter how many redraws are requested before then, the
+        canvas is only redrawn once. If a :meth:`batch_redraw` block is active, the
+        redraw is deferred until the end of the block.
+        """
+        if not self._dirty:
+            self._dirty = True
+            if not self._redraw_depth:
+                asyncio.get_event_loop().call_soon(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        # Perform any pending redraw. If a batch is open, the redraw is performed when
+        # the batch exits.
+        if self._dirty and not self._redraw_depth:
+            self._dirty = False
+            self._impl.redraw()
+
+    @contextmanager
+    def batch_redraw(self) -> Iterator[None]:
+        """Obtain a context manager that defers redraws of the canvas until the end of
+        the block.
+
+        Redraws are normally performed on the next iteration of the event loop. Inside
+        a batch, they are deferred until the block exits, even if the block yields to
+        the event loop; the canvas is then redrawn immediately, at most once, no
+        matter how many changes were made::
+
+            with canvas.batch_redraw():
+                with canvas.context.Stroke() as stroke:
+                    for x, y in points:
+                        stroke.line_to(x, y)
+
+        Batches can be nested; the redraw is only performed when the outermost batch
+        exits.
+        """
+        self._redraw_depth += 1
+        try:
+            yield
+        finally:
+            self._redraw_depth -= 1
+            self._flush_redraw()
+
+    ###########################################################################
+    # Hit testing
+    ###########################################################################
+
+    def _spatial_index(self) -> _SpatialIndex:
+        # Update the index of every context that has changed since the canvas was last
+        # measured. Contexts that haven't changed keep their existing index.
+        context = self.context
+        context._bounds = context._measure(_MeasureState(self))
+        return context._index
+
+    def objects_at(self, x: float, y: float) -> list[DrawingObject]:
+        """Find the drawing objects whose :attr:`~DrawingObject.bounds` contain a
+        point.
+
+        :param x: The X coordinate of the point, in canvas coordinates.
+        :param y: The Y coordinate of the point, in canvas coordinates.
+        :returns: A list of drawing objects, from the topmost (most recently drawn)
+            object to the bottommost. An object is listed before the context that
+            contains it.
+        """
+        return self._spatial_index().query((x, y, x, y))
+
+    def objects_in(
+        self, x: float, y: float, width: float, height: float
+    ) -> list[DrawingObject]:
+        """Find the drawing objects whose :attr:`~DrawingObject.bounds` intersect a
+        rectangle.
+
+        :param x: The X coordinate of the top-left corner of the rectangle.
+        :param y: The Y coordinate of the top-left corner of the rectangle.
+        :param width: The width of the rectangle.
+        :param height: The height of the rectangle.
+        :returns: A list of drawing objects, from the topmost (most recently drawn)
+            object to the bottommost. An object is listed before the context that
+            contains it.
         """
-        self._impl.redraw()
+        return self._spatial_index().query((x, y, x + width, y + height))
 
-    def Context(self) -> ContextManager[Context]:
+    def Context(self, cached: bool = False) -> ContextManager[Context]:
         """Construct and yield a new sub-:class:`~toga.widgets.canvas.Context` within
         the root context of this Canvas.
 
+        :param cached: Should the rendered content of the new context be
+            :attr:`~toga.widgets.canvas.Context.cached`?
         :yields: The new :class:`~toga.widgets.canvas.Context` object.
         """
-        return self.context.Context()
+        return self.context.Context(cached=cached)
 
     def ClosedPath(
         self,
@@ -1482,12 +2341,13 @@ class Canvas(Widget):
         """Render the canvas as an image.
 
         :param format: Format to provide. Defaults to :class:`~toga.images.Image`; also
-            supports :any:`PIL.Image.Image` if Pillow is installed, as well as any image
-            types defined by installed :doc:`image format plugins
-            </reference/plugins/image_formats>`
+            supports :any:`PIL.Image.Image` if Pillow is installed,
+            :class:`~toga.images.PixelBuffer` (to obtain the raw pixels, without any
+            image encoding), as well as any image types defined by installed
+            :doc:`image format plugins </reference/plugins/image_formats>`
         :returns: The canvas as an image of the specified type.
         """
-        return toga.Image(self._impl.get_image_data()).as_format(format)
+        return _capture_image(self._impl, format)
 
     ###########################################################################
     # 2023-07 Backwards compatibility
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import sys
+import traceback
 from typing import TYPE_CHECKING, Any, Literal
 
 from travertino.size import at_least
@@ -67,12 +70,27 @@ def rehint_imageview(
     return width, height, aspect_ratio
 
 
+def _as_image(image: ImageContentT | None) -> toga.Image | None:
+    if image is None or isinstance(image, toga.Image):
+        return image
+    return toga.Image(image)
+
+
+def _report_load_error(future: asyncio.Future[toga.Image]) -> None:
+    # The future may never be awaited, so the error must be retrieved (and reported)
+    # here.
+    if not future.cancelled() and (e := future.exception()):
+        print("Error loading image:", e, file=sys.stderr)
+        traceback.print_exception(type(e), e, e.__traceback__)
+
+
 class ImageView(Widget):
     def __init__(
         self,
         image: ImageContentT | None = None,
         id: str | None = None,
         style: StyleT | None = None,
+        placeholder: ImageContentT | None = None,
     ):
         """
         Create a new image view.
@@ -82,9 +100,14 @@ class ImageView(Widget):
         :param id: The ID for the widget.
         :param style: A style object. If no style is provided, a default style will be
             applied to the widget.
+        :param placeholder: The image to display while an image is being
+            :meth:`loaded <load>`.
         """
-        # Prime the image attribute
+        # Prime the image attributes
         self._image = None
+        self._placeholder = _as_image(placeholder)
+        # The task that is loading the image to display (if any).
+        self._loading: asyncio.Future[toga.Image] | None = None
 
         super().__init__(id=id, style=style)
 
@@ -121,16 +144,66 @@ class ImageView(Widget):
 
     @image.setter
     def image(self, image: ImageContentT) -> None:
-        if isinstance(image, toga.Image):
-            self._image = image
-        elif image is None:
-            self._image = None
-        else:
-            self._image = toga.Image(image)
+        # An image that is assigned explicitly supersedes any image that is loading.
+        self._loading = None
+        self._set_image(_as_image(image))
 
+    def _set_image(self, image: toga.Image | None) -> None:
+        self._image = image
         self._impl.set_image(self._image)
         self.refresh()
 
+    @property
+    def placeholder(self) -> toga.Image | None:
+        """The image to display while an image is being :meth:`loaded <load>`.
+
+        When setting a placeholder, you can provide any valid :any:`image content
+        <ImageContentT>` type; or :any:`None` to display no image while loading.
+        """
+        return self._placeholder
+
+    @placeholder.setter
+    def placeholder(self, image: ImageContentT | None) -> None:
+        self._placeholder = _as_image(image)
+        if self._loading is not None:
+            self._set_image(self._placeholder)
+
+    def load(self, image: ImageContentT) -> asyncio.Future[toga.Image]:
+        """Load an image without blocking the app, and display it once it has been
+        loaded.
+
+        The image is loaded using :meth:`toga.Image.load`. Until it has been loaded,
+        the :any:`placeholder` is displayed. If another image is assigned (or loaded)
+        before the load completes, the loaded image won't be displayed.
+
+        If the image can't be loaded, the image view is cleared, and the error is
+        reported on the console; the error is also raised by the returned future.
+
+        :param image: The image to load. Can be any valid :any:`image content
+            <ImageContentT>` type.
+        :returns: A future that resolves to the loaded image.
+        """
+        self._set_image(self._placeholder)
+        self._loading = asyncio.ensure_future(self._load(image))
+        self._loading.add_done_callback(_report_load_error)
+        return self._loading
+
+    async def _load(self, src: ImageContentT) -> toga.Image:
+        try:
+            image = await toga.Image.load(src)
+        except Exception:
+            # The placeholder shouldn't be left in place of an image that will never
+            # arrive.
+            if self._loading is asyncio.current_task():
+                self._loading = None
+                self._set_image(None)
+            raise
+
+        if self._loading is asyncio.current_task():
+            self._loading = None
+            self._set_image(image)
+        return image
+
     def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
         """Return the image in the specified format.
 
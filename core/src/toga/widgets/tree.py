@@ -197,6 +197,11 @@ class Tree(Widget):
 
         If a node is specified, the children of that node will also be expanded.
 
+        If the children of the specified node are :ref:`loaded on demand
+        <treesource-lazy>`, they will be loaded when the node is expanded. Other nodes
+        whose children haven't been loaded are not expanded, so expanding a node (or
+        the whole tree) doesn't load the entire tree.
+
         :param node: The node to expand
         """
         if node is None:
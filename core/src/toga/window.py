@@ -11,9 +11,10 @@ from toga import dialogs
 from toga.command import CommandSet
 from toga.constants import WindowState
 from toga.handlers import AsyncResult, wrapped_handler
-from toga.images import Image
+from toga.images import Image, _capture_image
 from toga.platform import get_platform_factory
 from toga.types import Position, Size
+from toga.widgets.base import _batch_refresh
 
 if TYPE_CHECKING:
     from toga.app import App
@@ -189,6 +190,7 @@ class Window:
         self._impl: Any = None
         self._content: Widget | None = None
         self._closed = False
+        self._refresh_batch = None
 
         self._resizable = resizable
         self._closable = closable
@@ -369,6 +371,15 @@ class Window:
         # Update the geometry of the widget
         widget.refresh()
 
+    def batch_refresh(self) -> Iterator[None]:
+        """Obtain a context manager that defers refreshes of all widgets in the window
+        until the end of the block.
+
+        This behaves in the same way as :meth:`toga.Widget.batch_refresh`, but applies
+        to every widget in the window, rather than a single widget tree.
+        """
+        return _batch_refresh(self)
+
     @property
     def widgets(self) -> FilteredWidgetRegistry:
         """The widgets contained in the window.
@@ -522,12 +533,13 @@ class Window:
         """Render the current contents of the window as an image.
 
         :param format: Format to provide. Defaults to :class:`~toga.images.Image`; also
-            supports :any:`PIL.Image.Image` if Pillow is installed, as well as any image
-            types defined by installed :doc:`image format plugins
-            </reference/plugins/image_formats>`.
+            supports :any:`PIL.Image.Image` if Pillow is installed,
+            :class:`~toga.images.PixelBuffer` (to obtain the raw pixels, without any
+            image encoding), as well as any image types defined by installed
+            :doc:`image format plugins </reference/plugins/image_formats>`.
         :returns: An image containing the window content, in the format requested.
         """
-        return Image(self._impl.get_image_data()).as_format(format)
+        return _capture_image(self._impl, format)
 
     async def dialog(self, dialog) -> Coroutine[None, None, Any]:
         """Display a dialog to the user, modal to this window.
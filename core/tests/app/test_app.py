@@ -2,7 +2,9 @@ import asyncio
 import importlib.metadata
 import signal
 import sys
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -811,6 +813,16 @@ def test_exit_direct(app):
     on_exit_handler.assert_not_called()
 
 
+def test_exit_executor(app):
+    """Exiting an app shuts down the handler thread pool."""
+    executor = app.executor
+    app.exit()
+
+    assert_action_performed(app, "exit")
+    with pytest.raises(RuntimeError, match=r"cannot schedule new futures"):
+        executor.submit(print)
+
+
 def test_exit_no_handler(app):
     """An app without an exit handler can be exited."""
     # Request an app exit
@@ -906,6 +918,87 @@ def test_loop(app, event_loop):
     assert app.loop is event_loop
 
 
+def test_handler_time_budget(app):
+    """The time budget for generator handlers can be modified."""
+    assert app.handler_time_budget == 0.0
+
+    app.handler_time_budget = 0.008
+    assert app.handler_time_budget == 0.008
+
+    app.handler_time_budget = 1
+    assert app.handler_time_budget == 1.0
+    assert isinstance(app.handler_time_budget, float)
+
+    with pytest.raises(
+        ValueError,
+        match=r"handler_time_budget must be a non-negative number",
+    ):
+        app.handler_time_budget = -0.1
+    assert app.handler_time_budget == 1.0
+
+
+def test_executor(app):
+    """The app has a thread pool for running blocking operations."""
+    executor = app.executor
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert 1 <= executor._max_workers <= toga.app.MAX_HANDLER_WORKERS
+
+    # The same pool is used each time.
+    assert app.executor is executor
+
+
+def test_call_soon_main(app, event_loop):
+    """Callbacks can be invoked on the event loop from a worker thread."""
+    calls = []
+
+    def callback(*args):
+        calls.append((args, threading.current_thread()))
+        return 42
+
+    async def run():
+        future = app.call_soon_main(callback, "arg1", "arg2")
+        # The callback isn't invoked immediately, even on the main thread.
+        assert calls == []
+        return await asyncio.wrap_future(future)
+
+    assert event_loop.run_until_complete(run()) == 42
+    assert calls == [(("arg1", "arg2"), threading.main_thread())]
+
+    # Invoke from a worker thread, waiting for the result.
+    result = event_loop.run_until_complete(
+        event_loop.run_in_executor(
+            app.executor,
+            lambda: app.call_soon_main(callback, "arg3").result(),
+        )
+    )
+    assert result == 42
+    assert calls[1] == (("arg3",), threading.main_thread())
+
+
+def test_call_soon_main_error(app, event_loop):
+    """An error raised by a marshaled callback is returned by the future."""
+
+    def callback():
+        raise ValueError("Problem in callback")
+
+    future = app.call_soon_main(callback)
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    with pytest.raises(ValueError, match=r"Problem in callback"):
+        future.result()
+
+
+def test_call_soon_main_cancelled(app, event_loop):
+    """A marshaled callback that has been cancelled isn't invoked."""
+    callback = Mock()
+
+    future = app.call_soon_main(callback)
+    future.cancel()
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    callback.assert_not_called()
+
+
 def test_running(event_loop):
     """The running() method is invoked when the main loop starts"""
     running = {}
@@ -0,0 +1,219 @@
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga.sources import LazyListSource
+from toga_dummy.utils import assert_action_performed_with
+
+
+def fetch_items(start, stop):
+    return [(f"item {i}", i) for i in range(start, stop)]
+
+
+@pytest.fixture
+def fetch():
+    return Mock(side_effect=fetch_items)
+
+
+@pytest.fixture
+def source(fetch):
+    return LazyListSource(
+        accessors=["val1", "val2"],
+        length=1_000_000,
+        fetch=fetch,
+        block_size=100,
+        cache_size=3,
+    )
+
+
+@pytest.mark.parametrize("value", [None, 42, "not a list"])
+def test_invalid_accessors(value):
+    """Accessors for a lazy list source must be a list of attribute names."""
+    with pytest.raises(
+        ValueError,
+        match=r"accessors should be a list of attribute names",
+    ):
+        LazyListSource(accessors=value, length=0, fetch=fetch_items)
+
+
+def test_accessors_required():
+    """A lazy list source must specify *some* accessors."""
+    with pytest.raises(
+        ValueError,
+        match=r"LazyListSource must be provided a list of accessors",
+    ):
+        LazyListSource(accessors=[], length=0, fetch=fetch_items)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"length": -1}, r"length must be a non-negative integer"),
+        ({"length": 10, "block_size": 0}, r"block_size must be a positive integer"),
+        ({"length": 10, "cache_size": 0}, r"cache_size must be a positive integer"),
+    ],
+)
+def test_invalid_sizes(kwargs, message):
+    """The length, block size and cache size must be valid."""
+    with pytest.raises(ValueError, match=message):
+        LazyListSource(accessors=["val1"], fetch=fetch_items, **kwargs)
+
+
+def test_no_eager_fetch(source, fetch):
+    """Creating a lazy source doesn't retrieve any data."""
+    assert len(source) == 1_000_000
+    fetch.assert_not_called()
+
+
+def test_getitem(source, fetch):
+    """Items are retrieved a block at a time, and converted into rows."""
+    row = source[150]
+    assert row.val1 == "item 150"
+    assert row.val2 == 150
+    fetch.assert_called_once_with(100, 200)
+
+    # Another item in the same block doesn't require a fetch, and the same row
+    # instance is returned on subsequent lookups.
+    fetch.reset_mock()
+    assert source[199].val1 == "item 199"
+    assert source[150] is row
+    fetch.assert_not_called()
+
+    # Negative indices count from the end; the final block is truncated.
+    assert source[-1].val1 == "item 999999"
+    fetch.assert_called_once_with(999900, 1_000_000)
+
+
+@pytest.mark.parametrize("index", [1_000_000, -1_000_001])
+def test_getitem_out_of_range(source, fetch, index):
+    """Retrieving an item outside the source raises IndexError."""
+    with pytest.raises(IndexError, match=r"list index out of range"):
+        source[index]
+    fetch.assert_not_called()
+
+
+def test_fetch_wrong_size(fetch):
+    """If fetch returns the wrong number of items, an error is raised."""
+    source = LazyListSource(
+        accessors=["val1", "val2"],
+        length=10,
+        fetch=lambda start, stop: fetch_items(start, stop - 1),
+    )
+    with pytest.raises(
+        ValueError,
+        match=r"Expected 10 items for range 0:10; fetch returned 9",
+    ):
+        source[0]
+
+
+def test_cache_eviction(source, fetch):
+    """The least recently used block is discarded when the cache is full."""
+    row = source[0]
+    source[100]
+    source[200]
+    # Touch the first block, so the second block is the least recently used.
+    source[1]
+    source[300]
+    assert fetch.call_count == 4
+
+    # The first block is still cached
+    fetch.reset_mock()
+    assert source[0] is row
+    fetch.assert_not_called()
+
+    # The second block was discarded, so it is fetched again.
+    source[100]
+    fetch.assert_called_once_with(100, 200)
+
+
+def test_modified_rows_retained(source, fetch):
+    """Rows that have been modified are retained after their block is discarded."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    row = source[5]
+    row.val1 = "new value"
+    listener.change.assert_called_once_with(item=row)
+
+    # Force the block containing the row out of the cache.
+    for index in (100, 200, 300):
+        source[index]
+
+    fetch.reset_mock()
+    assert source[5] is row
+    assert source[5].val1 == "new value"
+    fetch.assert_not_called()
+
+    # Other rows in that block are fetched again.
+    assert source[6].val1 == "item 6"
+    fetch.assert_called_once_with(0, 100)
+
+
+def test_notify(source):
+    """Notifications other than changes are passed to listeners."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    source.notify("reset")
+    listener.reset.assert_called_once_with()
+
+
+def test_index(source, fetch):
+    """The index of a row can be found without retrieving other items."""
+    row = source[123_456]
+    fetch.reset_mock()
+
+    assert source.index(row) == 123_456
+    fetch.assert_not_called()
+
+
+def test_index_missing(source):
+    """A row that isn't part of the source can't be found."""
+    other = LazyListSource(accessors=["val1", "val2"], length=10, fetch=fetch_items)
+
+    with pytest.raises(ValueError, match=r"<Row .* val1='item 0' .*> is not in"):
+        source.index(other[0])
+
+
+def test_find(source):
+    """Rows can be found by value."""
+    first = source.find({"val2": 42})
+    assert source.index(first) == 42
+
+    row = source.find(("item 250", 250))
+    assert source.index(row) == 250
+
+    row = source.find("item 7")
+    assert source.index(row) == 7
+
+    # Searches can start after a specific row
+    row = source.find({"val1": "item 43"}, start=first)
+    assert source.index(row) == 43
+
+    with pytest.raises(ValueError, match=r"No row matching {'val1': 'item 42'}"):
+        source.find({"val1": "item 42"}, start=first)
+
+
+def test_find_missing_attribute():
+    """Rows without a requested attribute don't match."""
+    source = LazyListSource(
+        accessors=["val1", "val2"],
+        length=3,
+        fetch=lambda start, stop: [{"val1": i} for i in range(start, stop)],
+    )
+
+    with pytest.raises(ValueError, match=r"No row matching {'val2': 1} in data"):
+        source.find({"val2": 1})
+
+
+def test_table(source, fetch):
+    """A lazy source can be used as the data for a table without retrieving items."""
+    table = toga.Table(headings=["Value 1", "Value 2"], data=source)
+
+    assert_action_performed_with(table, "change source", source=source)
+    fetch.assert_not_called()
+
+    table._impl.simulate_selection(999_999)
+    assert table.selection.val1 == "item 999999"
+    fetch.assert_called_once_with(999900, 1_000_000)
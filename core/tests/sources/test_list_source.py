@@ -1,8 +1,8 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call, patch
 
 import pytest
 
-from toga.sources import ListSource, Row
+from toga.sources import ListSource, Row, list_source
 
 
 @pytest.fixture
@@ -317,6 +317,123 @@ def test_append_positional(source):
     listener.insert.assert_called_once_with(index=3, item=row)
 
 
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        (1, 1),
+        (0, 0),
+        (-1, 2),
+        (10, 3),
+        (-10, 0),
+    ],
+)
+def test_insert_many(source, index, expected):
+    """Multiple rows can be inserted with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source.insert_many(index, [("new 1", 901), {"val1": "new 2", "val2": 902}])
+
+    assert len(source) == 5
+    assert source[expected] == rows[0]
+    assert source[expected + 1] == rows[1]
+    assert rows[0].val1 == "new 1"
+    assert rows[1].val2 == 902
+
+    listener.insert_range.assert_called_once_with(index=expected, items=rows)
+    listener.insert.assert_not_called()
+
+
+def test_insert_many_empty(source):
+    """Inserting no rows doesn't generate a notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    assert source.insert_many(1, []) == []
+
+    assert len(source) == 3
+    listener.insert_range.assert_not_called()
+
+
+def test_extend(source):
+    """Multiple rows can be appended with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source.extend(("new", i) for i in range(5))
+
+    assert len(source) == 8
+    assert [row.val2 for row in source] == [111, 222, 333, 0, 1, 2, 3, 4]
+    assert source[3] == rows[0]
+
+    listener.insert_range.assert_called_once_with(index=3, items=rows)
+
+
+def test_replace_range(source):
+    """A range of rows can be replaced with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+    first = source[0]
+
+    rows = source.replace_range(1, 3, [("new 1", 901), ("new 2", 902), ("new 3", 903)])
+
+    assert len(source) == 4
+    assert list(source) == [first] + rows
+    assert [row.val1 for row in source] == ["first", "new 1", "new 2", "new 3"]
+
+    listener.reset.assert_called_once_with()
+    listener.insert.assert_not_called()
+    listener.remove.assert_not_called()
+
+
+def test_sort(source):
+    """Rows can be sorted with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+    first, second, third = source
+
+    # By default, the values of the accessors are used.
+    source.sort()
+    assert list(source) == [first, second, third]
+
+    source.sort(key=lambda row: row.val2, reverse=True)
+    assert list(source) == [third, second, first]
+
+    source.sort(key=lambda row: row.val1[-1])
+    assert list(source) == [third, second, first]
+
+    assert listener.reset.call_count == 3
+
+
+def test_range_notification_fallback(source):
+    """Listeners without range-level notifications receive item notifications."""
+    listener = Mock(spec=["insert", "clear"])
+    source.add_listener(listener)
+
+    rows = source.insert_many(1, [("new 1", 901), ("new 2", 902)])
+    assert listener.mock_calls == [
+        call.insert(index=1, item=rows[0]),
+        call.insert(index=2, item=rows[1]),
+    ]
+
+    listener.reset_mock()
+    source.sort(key=lambda row: row.val2, reverse=True)
+    assert listener.mock_calls == [call.clear()] + [
+        call.insert(index=i, item=row) for i, row in enumerate(source)
+    ]
+
+    # Notifications without an equivalent are ignored.
+    listener.reset_mock()
+    source[0].val1 = "changed"
+    assert listener.mock_calls == []
+
+    # A listener that doesn't accept any of the notifications is ignored.
+    source.remove_listener(listener)
+    source.add_listener(object())
+    source.extend([("new 3", 903)])
+    source.sort()
+
+
 def test_del(source):
     """You can delete an item from a list source by index."""
     listener = Mock()
@@ -381,8 +498,102 @@ def test_index(source):
         source.index(Row())
 
 
-def test_find(source):
+def test_index_after_modification(source):
+    """Row indices remain correct as the source is modified."""
+    first, second, third = source
+
+    # Populate the cache of row positions.
+    assert source.index(third) == 2
+
+    def assert_indices():
+        for i, row in enumerate(list(source)):
+            assert source.index(row) == i
+
+    source.insert(0, ("zeroth", 0))
+    assert_indices()
+
+    source.insert(-1, ("before last", 999))
+    assert source.index(third) == 4
+    assert_indices()
+
+    source.extend([("fourth", 444), ("fifth", 555)])
+    source.insert_many(-10, [("start", -1)])
+    assert_indices()
+
+    del source[-1]
+    source.remove(second)
+    assert_indices()
+
+    with pytest.raises(ValueError, match=r"<Row .* val1='second' .*> is not in list"):
+        source.index(second)
+
+    source[0] = ("replaced", 123)
+    source.replace_range(-3, -1, [("new", 1), ("newer", 2), ("newest", 3)])
+    assert_indices()
+
+    source.sort(key=lambda row: row.val2)
+    assert_indices()
+
+    source.clear()
+    with pytest.raises(ValueError, match=r"<Row .* val1='first' .*> is not in list"):
+        source.index(first)
+
+    source.append(("new", 1))
+    assert_indices()
+
+    # Unhashable values can't be found.
+    with pytest.raises(ValueError, match=r"\[\] is not in list"):
+        source.index([])
+
+
+class CountingList(list):
+    """A list that counts how many times its items are accessed."""
+
+    accesses = 0
+
+    def __getitem__(self, index):
+        self.accesses += 1
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        self.accesses += 1
+        return super().__iter__()
+
+
+def test_index_no_rescan():
+    """Once the positions of the rows are known, looking up the index of a row doesn't
+    examine the data."""
+    source = ListSource(accessors=["value"], data=range(1000))
+    source._data = data = CountingList(source._data)
+    last = source[-1]
+    assert source.index(last) == 999
+
+    data.accesses = 0
+    assert source.index(last) == 999
+    assert source.index(source[0]) == 0
+    # The only access is the one made to retrieve source[0].
+    assert data.accesses == 1
+
+    # Inserting a row at the start moves every row, so the positions are recomputed.
+    source.insert(0, {"value": -1})
+    data.accesses = 0
+    assert source.index(last) == 1000
+    assert data.accesses == 1001
+
+    # ... after which they are known again.
+    data.accesses = 0
+    assert source.index(last) == 1000
+    assert data.accesses == 0
+
+
+@pytest.mark.parametrize(
+    "indexes",
+    [[], ["val1"], ["val2"], ["val1", "val2"], ["value"]],
+)
+def test_find(source, indexes):
     """You can find the index of any matching row within a list source."""
+    for accessor in indexes:
+        source.add_index(accessor)
 
     # Duplicate row 1 of the data.
     source.append(dict(val1="second", val2=222))
@@ -421,3 +632,200 @@ def test_find(source):
         ),
     ):
         source.find(dict(val1="first", val2=111, value="overspecified"))
+
+
+@pytest.mark.parametrize("indexes", [[], ["val1"], ["val1", "val2"]])
+def test_find_all(source, indexes):
+    """All the rows matching a search can be iterated over."""
+    for accessor in indexes:
+        source.add_index(accessor)
+    source.append(dict(val1="second", val2=444))
+    source.insert(0, dict(val1="second", val2=222))
+
+    assert list(source.find_all("second")) == [source[0], source[2], source[4]]
+    assert list(source.find_all(dict(val1="second", val2=222))) == [
+        source[0],
+        source[2],
+    ]
+    assert list(source.find_all(("second", 444))) == [source[4]]
+    assert list(source.find_all(dict(val1="not there"))) == []
+
+
+def test_index_maintained(source):
+    """Indexes are updated as the source is modified."""
+    source.add_index("val1")
+    # Adding an index a second time is a no-op
+    index = source._indexes["val1"]
+    source.add_index("val1")
+    assert source._indexes["val1"] is index
+
+    first, second, third = source
+
+    # Rows that are added are indexed.
+    new = source.insert(1, dict(val1="third", val2=999))
+    rows = source.extend([("third", 1), ("fourth", 4)])
+    source[5] = ("fifth", 5)
+    assert list(source.find_all("third")) == [new, third, rows[0]]
+    assert source.find("fifth") is source[5]
+    with pytest.raises(ValueError, match=r"No row matching 'fourth' in data"):
+        source.find("fourth")
+
+    # Rows that are modified are re-indexed
+    first.val1 = "third"
+    assert list(source.find_all("third")) == [first, new, third, rows[0]]
+    with pytest.raises(ValueError, match=r"No row matching 'first' in data"):
+        source.find("first")
+
+    # Modifications in a batch are indexed at the end of the batch.
+    with second.batch_update():
+        second.val1 = "modified"
+    assert source.find("modified") is second
+
+    # Rows that are removed are no longer found, even if they are modified
+    source.remove(new)
+    del source[0]
+    new.val1 = "fifth"
+    first.val1 = "fifth"
+    assert list(source.find_all("third")) == [third, rows[0]]
+    assert list(source.find_all("fifth")) == [source[-1]]
+
+    source.replace_range(1, 3, [("third", 3), ("sixth", 6)])
+    assert [row.val2 for row in source.find_all("third")] == [3]
+    assert source.find("sixth") is source[2]
+
+    # Sorting doesn't change the index, but does change the order of results.
+    source.append(("third", 0))
+    source.sort(key=lambda row: row.val2)
+    assert [row.val2 for row in source.find_all("third")] == [0, 3]
+
+    source.clear()
+    assert list(source.find_all("third")) == []
+    source.append(("third", 7))
+    assert source.find("third").val2 == 7
+
+
+def test_index_missing_and_unhashable_values():
+    """Rows with missing or unhashable values can still be found."""
+    source = ListSource(
+        accessors=["val1", "val2"],
+        data=[
+            dict(val1="first", val2=[1, 2]),
+            dict(val2=[3]),
+            dict(val1=["unhashable"], val2=[3]),
+            dict(val1="first", val2=[3]),
+        ],
+    )
+    source.add_index("val1")
+    source.add_index("val2")
+
+    # Unhashable search values fall back to the other criteria, or a full scan.
+    assert source.find(dict(val1="first", val2=[3])) is source[3]
+    assert list(source.find_all(dict(val2=[3]))) == [source[1], source[2], source[3]]
+    assert source.find(dict(val1=["unhashable"])) is source[2]
+    assert list(source.find_all(dict(val1="first"))) == [source[0], source[3]]
+
+    # A row without the attribute isn't found, but can be re-indexed once it has a
+    # value.
+    source[1].val1 = "first"
+    assert list(source.find_all(dict(val1="first"))) == [
+        source[0],
+        source[1],
+        source[3],
+    ]
+
+
+def test_find_index_no_rescan():
+    """Finding a row using an index doesn't scan the data."""
+    source = ListSource(
+        accessors=["value", "parity"],
+        data=[(i, i % 2) for i in range(1000)],
+    )
+    source.add_index("value")
+    source._data = data = CountingList(source._data)
+    last = source[-1]
+    assert source.find(last.value) is last
+
+    # The ordering of the matching rows is cached, so the data isn't accessed again.
+    data.accesses = 0
+    assert source.find(last.value) is last
+    assert list(source.find_all(last.value)) == [last]
+    assert data.accesses == 0
+
+    # An attribute without an index requires a scan.
+    data.accesses = 0
+    assert source.find(dict(parity=1)) is source[1]
+    assert data.accesses > 2
+
+
+def test_find_start_index():
+    """Finding each match in turn using an index only examines each matching row
+    once."""
+    source = ListSource(
+        accessors=["value", "parity"],
+        data=[(i, i % 2) for i in range(1000)],
+    )
+    source.add_index("parity")
+
+    with patch.object(
+        list_source, "_item_matches", wraps=list_source._item_matches
+    ) as matches:
+        found = []
+        row = None
+        while True:
+            try:
+                row = source.find(dict(parity=1), start=row)
+            except ValueError:
+                break
+            found.append(row.value)
+
+    assert found == list(range(1, 1000, 2))
+    assert matches.call_count == 500
+
+    # The cached ordering is discarded when rows move.
+    source.insert(0, (-1, 1))
+    assert source.find(dict(parity=1)).value == -1
+    assert source.find(dict(parity=1), start=source[0]).value == 1
+
+
+class IndexingListener:
+    """A listener that resolves the position of each changed row, as a Table does."""
+
+    def __init__(self, source):
+        self.source = source
+        self.changed = []
+        self.notifications = []
+
+    def change(self, item):
+        self.changed.append((self.source.index(item), item))
+
+    def __getattr__(self, name):
+        return lambda **kwargs: self.notifications.append(name)
+
+
+@pytest.mark.parametrize(
+    "mutate, notification",
+    [
+        (lambda source: source.remove(source[1]), "remove"),
+        (lambda source: source.__delitem__(1), "remove"),
+        (lambda source: source.__setitem__(1, ("new", 0)), "insert"),
+        (lambda source: source.replace_range(1, 2, [("new", 0)]), "reset"),
+        (lambda source: source.clear(), "clear"),
+    ],
+)
+async def test_coalesced_change_removed(source, mutate, notification):
+    """A coalesced change to a row that is then removed isn't delivered."""
+    listener = IndexingListener(source)
+    source.add_listener(listener)
+    source.coalesce_changes = True
+
+    first = source[0]
+    first.val2 = 112
+    source[1].val2 = 223
+    mutate(source)
+
+    assert listener.notifications == [notification]
+    if notification in {"clear", "reset"}:
+        assert listener.changed == []
+    else:
+        # The change to a row that is still in the source was delivered first.
+        assert listener.changed == [(0, first)]
@@ -477,6 +477,26 @@ def test_find(node, child_b):
     assert node.find({"val1": "value a", "val2": 333}) == child_c
 
 
+def test_find_all(node, child_b):
+    """All the children of a node matching a value can be iterated over."""
+    # Append some additional children
+    node.append({"val1": "value a", "val2": 333})
+    child_d = node.append({"val1": "value b", "val2": 444})
+
+    assert list(node.find_all({"val1": "value b"})) == [child_b, child_d]
+    assert list(node.find_all({"val2": 444})) == [child_d]
+    assert list(node.find_all("not there")) == []
+
+
+def test_find_all_leaf(leaf_node):
+    """Children cannot be found from a leaf node."""
+    with pytest.raises(
+        ValueError,
+        match=r"<Leaf Node .* val1='value 1' val2=42> is a leaf node",
+    ):
+        leaf_node.find_all({"val1": "value 1"})
+
+
 def test_found_leaf(leaf_node):
     """A child cannot be found from a leaf node."""
     with pytest.raises(
@@ -75,3 +75,68 @@ def test_row_without_source():
     # still causes a change notification
     del row.val3
     assert not hasattr(row, "val")
+
+
+def test_update():
+    """Multiple attributes can be updated with a single notification."""
+    source = Mock()
+    row = Row(val1="value 1", val2=42)
+    row._source = source
+
+    row.update(val1="new value", val2=37, val3="extra")
+    assert row.val1 == "new value"
+    assert row.val2 == 37
+    assert row.val3 == "extra"
+    source.notify.assert_called_once_with("change", item=row)
+
+    # An update that doesn't modify anything doesn't notify
+    source.notify.reset_mock()
+    row.update()
+    source.notify.assert_not_called()
+
+
+def test_batch_update():
+    """Change notifications can be deferred to the end of a block."""
+    source = Mock()
+    row = Row(val1="value 1", val2=42)
+    row._source = source
+
+    with row.batch_update():
+        row.val1 = "new value"
+        del row.val2
+
+        # Batch updates can be nested
+        with row.batch_update():
+            row.update(val3="extra", val4="more")
+        source.notify.assert_not_called()
+
+        # Private attributes can still be modified
+        row._secret = "secret"
+
+    source.notify.assert_called_once_with("change", item=row)
+    assert row.val1 == "new value"
+    assert not hasattr(row, "val2")
+
+    # If the block only modifies private attributes, there's no notification
+    source.notify.reset_mock()
+    with row.batch_update():
+        row._secret = "other secret"
+    source.notify.assert_not_called()
+
+    # If the block raises an exception, changes are still notified
+    try:
+        with row.batch_update():
+            row.val1 = "error"
+            raise RuntimeError()
+    except RuntimeError:
+        pass
+    source.notify.assert_called_once_with("change", item=row)
+
+
+def test_update_without_source():
+    """A row with no source can be updated."""
+    row = Row(val1="value 1")
+
+    row.update(val1="new value", val2=42)
+    assert row.val1 == "new value"
+    assert row.val2 == 42
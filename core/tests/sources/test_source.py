@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, call
 
 from toga.sources import Source
 
@@ -67,3 +68,66 @@ def test_missing_listener_method():
     source.notify("message1")
 
     full_listener.message1.assert_called_once_with()
+
+
+async def test_coalesce_changes():
+    """Change notifications can be coalesced until the next event loop iteration."""
+    listener = Mock()
+    source = Source()
+    source.add_listener(listener)
+    item1 = object()
+    item2 = object()
+
+    assert not source.coalesce_changes
+    source.coalesce_changes = True
+    assert source.coalesce_changes
+
+    # Repeated changes are deferred
+    source.notify("change", item=item1)
+    source.notify("change", item=item2)
+    source.notify("change", item=item1)
+    listener.change.assert_not_called()
+
+    # On the next event loop iteration, each item is notified once.
+    await asyncio.sleep(0)
+    assert listener.mock_calls == [call.change(item=item1), call.change(item=item2)]
+
+    # Any other notification delivers pending changes first
+    listener.reset_mock()
+    source.notify("change", item=item1)
+    source.notify("remove", index=1, item=item2)
+    assert listener.mock_calls == [
+        call.change(item=item1),
+        call.remove(index=1, item=item2),
+    ]
+
+    # A pending change to an item that is removed is discarded.
+    listener.reset_mock()
+    source.notify("change", item=item1)
+    source.notify("change", item=item2)
+    source.notify("remove", index=1, item=item2)
+    assert listener.mock_calls == [
+        call.change(item=item1),
+        call.remove(index=1, item=item2),
+    ]
+
+    # Pending changes are discarded when the source is cleared or reset.
+    for notification in ["clear", "reset"]:
+        listener.reset_mock()
+        source.notify("change", item=item1)
+        source.notify(notification)
+        assert listener.mock_calls == [getattr(call, notification)()]
+
+    # The scheduled delivery has nothing left to do.
+    listener.reset_mock()
+    await asyncio.sleep(0)
+    listener.change.assert_not_called()
+
+    # Disabling coalescing delivers pending changes immediately.
+    source.notify("change", item=item1)
+    source.coalesce_changes = False
+    listener.change.assert_called_once_with(item=item1)
+
+    listener.reset_mock()
+    source.notify("change", item=item1)
+    listener.change.assert_called_once_with(item=item1)
@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from toga.sources import Node, TreeSource
+from toga.sources import LazyChildren, Node, TreeSource
 
 
 @pytest.fixture
@@ -612,3 +613,265 @@ def test_find(source):
 
     # Find the child by a full match of values, starting at the first match
     assert source.find({"val1": "group1", "val2": 333}) == root2
+
+
+def test_find_all(source):
+    """All the root nodes matching a value can be iterated over."""
+    root1 = source[1]
+
+    # Append some additional roots
+    source.append({"val1": "group1", "val2": 333})
+    root3 = source.append({"val1": "group2", "val2": 444})
+
+    assert list(source.find_all({"val1": "group2"})) == [root1, root3]
+    assert list(source.find_all(("group2", 444))) == [root3]
+    assert list(source.find_all({"val1": "not there"})) == []
+
+
+def test_find_missing(source):
+    """If no root node matches, an error is raised."""
+    with pytest.raises(
+        ValueError,
+        match=r"No root node matching {'val1': 'not there'} in <toga.sources",
+    ):
+        source.find({"val1": "not there"})
+
+
+def test_lazy_children(listener):
+    """The children of a node can be loaded on demand."""
+    loader = Mock(
+        side_effect=lambda node: [
+            (
+                {"val1": f"{node.val1} child {i}", "val2": i},
+                LazyChildren(loader) if i else None,
+            )
+            for i in range(2)
+        ]
+    )
+    source = TreeSource(
+        accessors=["val1", "val2"],
+        data=[({"val1": "root", "val2": 0}, LazyChildren(loader))],
+    )
+    source.add_listener(listener)
+    root = source[0]
+
+    # The loader hasn't been invoked; the node isn't a leaf, but has no children.
+    loader.assert_not_called()
+    assert root.can_have_children()
+    assert not root.loaded
+    assert len(root) == 0
+
+    # Load the children
+    assert root.load_children() is None
+    loader.assert_called_once_with(root)
+    assert root.loaded
+    assert [child.val1 for child in root] == ["root child 0", "root child 1"]
+    listener.insert.assert_any_call(parent=root, index=0, item=root[0])
+    listener.insert.assert_any_call(parent=root, index=1, item=root[1])
+    listener.change.assert_called_once_with(item=root)
+
+    # The children are leaf nodes or lazy nodes, as described by the loaded data.
+    assert not root[0].can_have_children()
+    assert root[0].loaded
+    assert root[1].can_have_children()
+    assert not root[1].loaded
+
+    # Loading again is a no-op; as is loading a node without a loader.
+    loader.reset_mock()
+    assert root.load_children() is None
+    assert root[0].load_children() is None
+    loader.assert_not_called()
+
+
+def test_lazy_children_repr():
+    """The lazy children marker has a useful repr."""
+
+    def loader(node):
+        return None
+
+    assert repr(LazyChildren(loader)) == f"<LazyChildren {loader!r}>"
+
+
+def test_callable_child_data():
+    """Callable child data isn't treated as a loader unless it is marked as lazy."""
+
+    def callback(node):  # pragma: no cover
+        return None
+
+    source = TreeSource(accessors=["val1"], data=[("root", callback)])
+    root = source[0]
+
+    # The callable is the data for a single child node.
+    assert root.loaded
+    assert len(root) == 1
+    assert root[0].val1 is callback
+    assert not root[0].can_have_children()
+
+
+def test_lazy_children_appended(listener):
+    """Children can be added to a node before its children have been loaded."""
+    source = TreeSource(accessors=["val1"], data=[])
+    source.add_listener(listener)
+    root = source.append("root", children=LazyChildren(lambda node: [("loaded", None)]))
+    root.append("appended")
+
+    assert not root.loaded
+    root.load_children()
+
+    assert [child.val1 for child in root] == ["appended", "loaded"]
+    listener.insert.assert_any_call(parent=root, index=1, item=root[1])
+
+
+def test_lazy_no_children(listener):
+    """A loader can report that a node has no children."""
+    source = TreeSource(
+        accessors=["val1"], data=[("root", LazyChildren(lambda node: None))]
+    )
+    source.add_listener(listener)
+    root = source[0]
+
+    root.load_children()
+    assert root.loaded
+    assert root.can_have_children()
+    assert len(root) == 0
+    listener.insert.assert_not_called()
+    listener.change.assert_called_once_with(item=root)
+
+
+def test_lazy_load_error():
+    """If a loader raises an error, the load can be retried."""
+    loader = Mock(side_effect=[OSError("Can't read"), [("child", None)]])
+    source = TreeSource(accessors=["val1"], data=[("root", LazyChildren(loader))])
+    root = source[0]
+
+    with pytest.raises(OSError, match=r"Can't read"):
+        root.load_children()
+    assert not root.loaded
+
+    root.load_children()
+    assert root.loaded
+    assert root[0].val1 == "child"
+
+
+async def test_lazy_children_async(listener):
+    """The children of a node can be loaded by an async loader."""
+    loaded = asyncio.Event()
+
+    async def loader(node):
+        await loaded.wait()
+        return [("child 1", None), ("child 2", None)]
+
+    source = TreeSource(accessors=["val1"], data=[("root", LazyChildren(loader))])
+    source.add_listener(listener)
+    root = source[0]
+
+    task = root.load_children()
+    assert task is not None
+    # A second request returns the same task
+    assert root.load_children() is task
+    assert not root.loaded
+
+    loaded.set()
+    await task
+
+    assert root.loaded
+    assert [child.val1 for child in root] == ["child 1", "child 2"]
+    listener.change.assert_called_once_with(item=root)
+    assert root.load_children() is None
+
+
+async def test_lazy_children_async_error(capsys):
+    """If an async loader raises an error, the error is reported, and the load can be
+    retried."""
+    results = [OSError("Can't read"), OSError("Still can't read"), [("child", None)]]
+
+    async def loader(node):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    source = TreeSource(accessors=["val1"], data=[("root", LazyChildren(loader))])
+    root = source[0]
+
+    # The error is raised by the task if it is awaited...
+    with pytest.raises(OSError, match=r"Can't read"):
+        await root.load_children()
+    assert not root.loaded
+
+    # ... and is reported even if nothing awaits the task.
+    await asyncio.wait([root.load_children()])
+    assert not root.loaded
+    stderr = capsys.readouterr().err
+    assert "Error loading children: Can't read" in stderr
+    assert "Error loading children: Still can't read" in stderr
+    assert "OSError: Still can't read" in stderr
+
+    await root.load_children()
+    assert root.loaded
+    assert root[0].val1 == "child"
+
+
+async def test_lazy_children_async_cancelled(capsys):
+    """If an async load is cancelled, the load can be retried."""
+    loaded = asyncio.Event()
+
+    async def loader(node):
+        await loaded.wait()
+        return [("child", None)]
+
+    source = TreeSource(accessors=["val1"], data=[("root", LazyChildren(loader))])
+    root = source[0]
+
+    task = root.load_children()
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.wait([task])
+    assert not root.loaded
+    assert capsys.readouterr().err == ""
+
+    loaded.set()
+    await root.load_children()
+    assert root.loaded
+
+
+async def test_lazy_children_async_removed(listener):
+    """If a node is removed while its children are loading, the result is
+    discarded."""
+
+    async def loader(node):
+        return [("child", None)]
+
+    source = TreeSource(accessors=["val1"], data=[("root", LazyChildren(loader))])
+    source.add_listener(listener)
+    root = source[0]
+
+    task = root.load_children()
+    source.remove(root)
+    await task
+
+    assert len(root) == 0
+    listener.insert.assert_not_called()
+
+    # A node that isn't part of a source can't load its children.
+    assert root.load_children() is None
+
+
+async def test_coalesced_change_removed(source, listener):
+    """A coalesced change to a node that is removed (directly, or as the descendant of
+    a removed node) isn't delivered."""
+    source.coalesce_changes = True
+    group1, group2 = source[0], source[1]
+
+    group2.val2 = 3
+    group1[2][0].val2 = 133
+    group1.val2 = 2
+    del source[0]
+
+    listener.change.assert_called_once_with(item=group2)
+    listener.remove.assert_called_once_with(parent=None, index=0, item=group1)
+
+    # Nothing is left to be delivered.
+    listener.reset_mock()
+    await asyncio.sleep(0)
+    listener.change.assert_not_called()
@@ -1,5 +1,7 @@
 from unittest.mock import call
 
+import pytest
+
 from toga.colors import rgb
 from toga.fonts import Font
 from toga.style.pack import (
@@ -118,3 +120,79 @@ def test_set_visibility_inherited():
     # Show grandparent again; the other two should reappear.
     grandparent.style.visibility = VISIBLE
     assert_hidden_called(False, False, False)
+
+
+def test_update_coalesced():
+    """Updating multiple properties applies the font, and refreshes the layout, once."""
+    root = ExampleNode("app", style=Pack())
+    root.refresh.reset_mock()
+
+    root.style.update(
+        font_family="Roboto",
+        font_size=12,
+        font_weight="bold",
+        color="#ffffff",
+        width=100,
+        margin=10,
+    )
+    root._impl.set_font.assert_called_once_with(
+        Font("Roboto", 12, style="normal", variant="normal", weight="bold")
+    )
+    root._impl.set_color.assert_called_once_with(rgb(255, 255, 255))
+    root.refresh.assert_called_once_with()
+    assert root.style.width == 100
+    assert root.style.margin == (10, 10, 10, 10)
+
+
+def test_update_coalesced_layout():
+    """Updating multiple geometry properties only refreshes the layout once."""
+    root = ExampleNode("app", style=Pack())
+    root.refresh.reset_mock()
+
+    root.style.update(width=100, height=200, flex=1, margin=(10, 20))
+    root._impl.set_font.assert_not_called()
+    root.refresh.assert_called_once_with()
+
+
+def test_update_invalid():
+    """Valid properties set before an invalid property are still applied."""
+    root = ExampleNode("app", style=Pack())
+    root.refresh.reset_mock()
+
+    with pytest.raises(ValueError, match=r"Invalid value 'bogus' for property height"):
+        root.style.update(width=100, font_size=20, height="bogus")
+
+    root._impl.set_font.assert_called_once_with(Font("system", 20))
+    root.refresh.assert_called_once_with()
+    assert root.style.width == 100
+
+
+def test_reapply_coalesced():
+    """Reapplying a style applies the font once."""
+    root = ExampleNode(
+        "app",
+        style=Pack(font_family="Roboto", font_size=12, color="#ffffff", width=100),
+    )
+    root._impl.reset_mock()
+    root.refresh.reset_mock()
+
+    root.style.reapply()
+
+    root._impl.set_font.assert_called_once_with(Font("Roboto", 12))
+    root._impl.set_color.assert_called_once_with(rgb(255, 255, 255))
+    root.refresh.assert_called_once_with()
+
+
+def test_nested_batch():
+    """Updates made inside a batch are applied when the outermost batch ends."""
+    root = ExampleNode("app", style=Pack())
+    root.refresh.reset_mock()
+
+    with root.style._batch_apply():
+        root.style.update(font_size=20, width=100)
+        root.style.update(font_weight="bold", height=100)
+        root._impl.set_font.assert_not_called()
+        root.refresh.assert_not_called()
+
+    root._impl.set_font.assert_called_once_with(Font("system", 20, weight="bold"))
+    root.refresh.assert_called_once_with()
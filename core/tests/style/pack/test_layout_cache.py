@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+from toga.style.pack import COLUMN, ROW, Pack
+
+from .utils import ExampleNode, ExampleViewport, assert_layout
+
+
+def example_tree():
+    return ExampleNode(
+        "app",
+        style=Pack(direction=COLUMN),
+        children=[
+            ExampleNode(
+                "first",
+                style=Pack(direction=ROW),
+                children=[
+                    ExampleNode("first_a", style=Pack(width=10, height=10)),
+                    ExampleNode("first_b", style=Pack(width=20, height=20)),
+                ],
+            ),
+            ExampleNode(
+                "second",
+                style=Pack(direction=ROW),
+                children=[
+                    ExampleNode("second_a", style=Pack(width=30, height=30)),
+                ],
+            ),
+        ],
+    )
+
+
+def laid_out_nodes(root, viewport):
+    """Lay out the tree, returning the names of the nodes whose layout was
+    recomputed."""
+    nodes = set()
+    original = Pack._layout_node
+
+    def _layout_node(style, node, *args, **kwargs):
+        key = node.layout._layout_key
+        original(style, node, *args, **kwargs)
+        if node.layout._layout_key is not key:
+            nodes.add(node.name)
+
+    with patch.object(Pack, "_layout_node", autospec=True, side_effect=_layout_node):
+        root.style.layout(root, viewport)
+
+    return nodes
+
+
+def test_initial_layout():
+    """All nodes are dirty before the first layout."""
+    root = example_tree()
+    assert all(node.layout._dirty for node in [root, *root.children])
+
+    assert laid_out_nodes(root, ExampleViewport(640, 480)) == {
+        "app",
+        "first",
+        "first_a",
+        "first_b",
+        "second",
+        "second_a",
+    }
+    assert not any(node.layout._dirty for node in [root, *root.children])
+
+
+def test_clean_layout():
+    """If nothing has changed, no node is laid out again."""
+    root = example_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    assert laid_out_nodes(root, ExampleViewport(640, 480)) == set()
+
+
+def test_dirty_subtree():
+    """A style change only causes the changed node and its ancestors to be laid out
+    again."""
+    root = example_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    first_b = root.children[0].children[1]
+    first_b.style.width = 40
+    assert first_b.layout._dirty
+    assert root.children[0].layout._dirty
+    assert root.layout._dirty
+    assert not root.children[1].layout._dirty
+
+    assert laid_out_nodes(root, ExampleViewport(640, 480)) == {
+        "app",
+        "first",
+        "first_b",
+    }
+    assert_layout(
+        root,
+        (50, 50),
+        (640, 480),
+        {
+            "origin": (0, 0),
+            "content": (640, 480),
+            "children": [
+                {
+                    "origin": (0, 0),
+                    "content": (50, 20),
+                    "children": [
+                        {"origin": (0, 0), "content": (10, 10)},
+                        {"origin": (10, 0), "content": (40, 20)},
+                    ],
+                },
+                {
+                    "origin": (0, 20),
+                    "content": (30, 30),
+                    "children": [
+                        {"origin": (0, 20), "content": (30, 30)},
+                    ],
+                },
+            ],
+        },
+    )
+
+
+def test_intrinsic_size_change():
+    """A change in intrinsic size marks the node and its ancestors as dirty."""
+    root = example_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    second_a = root.children[1].children[0]
+    second_a.intrinsic.width = 50
+    assert second_a.layout._dirty
+    assert root.children[1].layout._dirty
+    assert root.layout._dirty
+    assert not root.children[0].layout._dirty
+
+    assert laid_out_nodes(root, ExampleViewport(640, 480)) == {
+        "app",
+        "second",
+        "second_a",
+    }
+
+
+def test_new_allocation():
+    """A clean node is laid out again if its allocation changes."""
+    root = example_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    # The children of the root have a new width; but the grandchildren have an
+    # explicit size, and are allocated the same space as before.
+    assert laid_out_nodes(root, ExampleViewport(800, 480)) == {"app", "first", "second"}
+    assert root.layout.content_width == 800
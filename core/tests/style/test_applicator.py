@@ -4,7 +4,11 @@ from toga.colors import REBECCAPURPLE
 from toga.fonts import FANTASY
 from toga.style import TogaApplicator
 from toga.style.pack import HIDDEN, RIGHT, VISIBLE
-from toga_dummy.utils import assert_action_performed_with
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed_with,
+)
 
 from ..utils import ExampleLeafWidget, ExampleWidget
 
@@ -153,3 +157,33 @@ def test_widget_alias_to_node(widget):
 
     assert applicator.widget is widget
     assert applicator.widget is applicator.node
+
+
+def test_set_bounds_unchanged(widget, child, grandchild):
+    """Bounds are only applied to widgets whose bounds have changed."""
+    widget.layout.content_width = 300
+    widget.layout.content_height = 400
+    child.layout.content_width = 30
+    child.layout.content_height = 40
+    grandchild.layout.content_width = 3
+    grandchild.layout.content_height = 4
+
+    widget.applicator.set_bounds()
+    for node in [widget, child, grandchild]:
+        assert len(EventLog.performed_actions(node, "set bounds")) == 1
+
+    # Applying the same bounds again is a no-op.
+    EventLog.reset()
+    widget.applicator.set_bounds()
+    for node in [widget, child, grandchild]:
+        assert_action_not_performed(node, "set bounds")
+
+    # Simulate a new layout that only changes the size of the grandchild.
+    for node in [widget, child, grandchild]:
+        node.layout._applied = False
+    grandchild.layout.content_width = 5
+
+    widget.applicator.set_bounds()
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_not_performed(child, "set bounds")
+    assert_action_performed_with(grandchild, "set bounds", x=0, y=0, width=5, height=4)
@@ -198,3 +198,73 @@ def test_register_font_variant(app, path, registered):
         Path(_REGISTERED_FONT_CACHE[("Custom Font", BOLD, NORMAL, NORMAL)]).resolve()
         == registered.resolve()
     )
+
+
+def test_font_cache():
+    """Fonts with the same descriptor share an implementation."""
+    toga.Font.cache_clear()
+    assert toga.Font.cache_info() == (0, 0, 256, 0)
+
+    font1 = toga.Font(SANS_SERIF, 12, weight=BOLD)
+    font2 = toga.Font(SANS_SERIF, "12pt", weight=BOLD, style="unknown")
+    font3 = toga.Font(SANS_SERIF, 12)
+
+    assert font1 is not font2
+    assert font1._impl is font2._impl
+    assert font1._impl is not font3._impl
+
+    info = toga.Font.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    toga.Font.cache_clear()
+    assert toga.Font.cache_info() == (0, 0, 256, 0)
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD)._impl is not font1._impl
+
+
+def test_font_cache_mutation():
+    """Modifying a font doesn't affect other fonts that share its implementation."""
+    toga.Font.cache_clear()
+    font1 = toga.Font(SANS_SERIF, 12, weight=BOLD)
+    font2 = toga.Font(SANS_SERIF, 12, weight=BOLD)
+
+    # The shared implementation isn't bound to either font.
+    assert font1._impl.interface is not font1
+    assert font1._impl.interface == (SANS_SERIF, 12, BOLD, NORMAL, NORMAL)
+    assert str(font1._impl.interface) == "sans-serif 12pt bold"
+
+    font1.size = 20
+    assert font2._impl.interface.size == 12
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD)._impl is font2._impl
+    assert toga.Font(SANS_SERIF, 20, weight=BOLD)._impl is not font2._impl
+
+    toga.Font.cache_clear()
+
+
+def test_font_cache_eviction(monkeypatch):
+    """The least recently used font implementations are evicted from the cache."""
+    toga.Font.cache_clear()
+    monkeypatch.setattr(toga.fonts._FONT_CACHE, "maxsize", 2)
+
+    font1 = toga.Font(SANS_SERIF, 12)
+    font2 = toga.Font(SANS_SERIF, 13)
+    # Use font 1, so font 2 is the least recently used
+    assert toga.Font(SANS_SERIF, 12)._impl is font1._impl
+    toga.Font(SANS_SERIF, 14)
+    assert toga.Font.cache_info().currsize == 2
+
+    assert toga.Font(SANS_SERIF, 12)._impl is font1._impl
+    assert toga.Font(SANS_SERIF, 13)._impl is not font2._impl
+
+    toga.Font.cache_clear()
+
+
+def test_register_font_clears_cache(app):
+    """Registering a font discards cached implementations of that family."""
+    toga.Font.cache_clear()
+    font = toga.Font("Custom Font", 12)
+    other = toga.Font(SANS_SERIF, 12)
+
+    toga.Font.register("Custom Font", "path/to/custom/font.otf")
+
+    assert toga.Font("Custom Font", 12)._impl is not font._impl
+    assert toga.Font(SANS_SERIF, 12)._impl is other._impl
@@ -1,9 +1,23 @@
 import asyncio
-from unittest.mock import Mock
+import functools
+import threading
+import time
+from unittest.mock import ANY, Mock
 
 import pytest
 
-from toga.handlers import AsyncResult, NativeHandler, simple_handler, wrapped_handler
+from toga.handlers import (
+    AsyncResult,
+    HandlerPolicy,
+    NativeHandler,
+    coalesce,
+    debounce,
+    simple_handler,
+    switch_latest,
+    threaded_handler,
+    throttle,
+    wrapped_handler,
+)
 
 
 class ExampleAsyncResult(AsyncResult):
@@ -212,6 +226,46 @@ def test_generator_handler(event_loop):
     }
 
 
+@pytest.mark.parametrize(
+    "budget, releases",
+    [
+        # With no budget, control is released after every iteration.
+        (0, [0] * 10),
+        # Control is released once each budget has been used.
+        (0.008, [0, 0, 0]),
+        # An explicit delay always releases control.
+        (1.0, []),
+    ],
+)
+def test_generator_handler_time_budget(app, event_loop, monkeypatch, budget, releases):
+    """A generator handler is resumed repeatedly until its time budget is used."""
+    clock = [0.0]
+    monkeypatch.setattr(time, "perf_counter", lambda: clock[0])
+
+    sleeps = []
+    original_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        await original_sleep(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    def handler(*args, **kwargs):
+        for i in range(10):
+            # Each iteration takes 3ms.
+            clock[0] += 0.003
+            yield
+        yield 0.01
+        return 42
+
+    app.handler_time_budget = budget
+    wrapped = wrapped_handler(Mock(), handler)
+    assert event_loop.run_until_complete(wrapped()) == 42
+
+    assert sleeps == releases + [0.01]
+
+
 def test_generator_handler_error(event_loop, capsys):
     """A generator can raise an error."""
     obj = Mock()
@@ -466,6 +520,645 @@ def test_coroutine_handler_with_cleanup_error(event_loop, capsys):
     )
 
 
+def test_threaded_handler(app, event_loop):
+    """A threaded handler is invoked on a worker thread."""
+    obj = Mock()
+    handler_call = {}
+
+    @threaded_handler
+    def handler(*args, **kwargs):
+        handler_call["args"] = args
+        handler_call["kwargs"] = kwargs
+        handler_call["thread"] = threading.current_thread()
+        return 42
+
+    wrapped = wrapped_handler(obj, handler)
+
+    # Raw handler is the original function
+    assert wrapped._raw == handler
+
+    # Invoke the handler; the result is a future
+    assert (
+        event_loop.run_until_complete(wrapped("arg1", "arg2", kwarg1=3, kwarg2=4)) == 42
+    )
+
+    # Handler arguments are as expected.
+    assert handler_call["args"] == (obj, "arg1", "arg2")
+    assert handler_call["kwargs"] == {"kwarg1": 3, "kwarg2": 4}
+
+    # The handler was run on one of the app's worker threads.
+    assert handler_call["thread"] is not threading.main_thread()
+    assert handler_call["thread"].name.startswith("toga-handler")
+
+
+def test_threaded_handler_error(app, event_loop, capsys):
+    """A threaded handler can raise an error."""
+    obj = Mock()
+    cleanup = Mock()
+
+    @threaded_handler
+    def handler(*args, **kwargs):
+        raise Exception("Problem in handler")
+
+    wrapped = wrapped_handler(obj, handler, cleanup=cleanup)
+
+    # Invoke the handler; the error is swallowed
+    assert (
+        event_loop.run_until_complete(wrapped("arg1", "arg2", kwarg1=3, kwarg2=4))
+        is None
+    )
+
+    # Cleanup method was not invoked
+    cleanup.assert_not_called()
+
+    # Evidence of the handler error is in the log.
+    assert (
+        "Error in threaded handler: Problem in handler\n"
+        "Traceback (most recent call last):\n" in capsys.readouterr().err
+    )
+
+
+def test_threaded_handler_with_cleanup(app, event_loop):
+    """A threaded handler can have cleanup, which is invoked on the event loop."""
+    obj = Mock()
+    cleanup_thread = {}
+
+    def cleanup(interface, result):
+        cleanup_thread["interface"] = interface
+        cleanup_thread["result"] = result
+        cleanup_thread["thread"] = threading.current_thread()
+
+    @threaded_handler
+    def handler(*args, **kwargs):
+        return 42
+
+    wrapped = wrapped_handler(obj, handler, cleanup=cleanup)
+
+    assert (
+        event_loop.run_until_complete(wrapped("arg1", "arg2", kwarg1=3, kwarg2=4)) == 42
+    )
+
+    # Cleanup method was invoked on the main thread
+    assert cleanup_thread == {
+        "interface": obj,
+        "result": 42,
+        "thread": threading.main_thread(),
+    }
+
+
+def test_threaded_handler_with_cleanup_error(app, event_loop, capsys):
+    """A threaded handler can raise an error during cleanup."""
+    obj = Mock()
+    cleanup = Mock(side_effect=Exception("Problem in cleanup"))
+
+    @threaded_handler
+    def handler(*args, **kwargs):
+        return 42
+
+    wrapped = wrapped_handler(obj, handler, cleanup=cleanup)
+
+    # Invoke the handler; error in cleanup is swallowed
+    assert (
+        event_loop.run_until_complete(wrapped("arg1", "arg2", kwarg1=3, kwarg2=4)) == 42
+    )
+
+    # Cleanup method was invoked
+    cleanup.assert_called_once_with(obj, 42)
+
+    # Evidence of the handler cleanup error is in the log.
+    assert (
+        "Error in threaded handler cleanup: Problem in cleanup\n"
+        "Traceback (most recent call last):\n" in capsys.readouterr().err
+    )
+
+
+def test_threaded_handler_gui_update(app, event_loop):
+    """A threaded handler can update the GUI by marshaling calls to the event loop."""
+    label = Mock()
+    updates = []
+
+    def update(value):
+        updates.append((value, threading.current_thread()))
+        label.text = value
+        return value * 2
+
+    @threaded_handler
+    def handler(widget, **kwargs):
+        # Wait for each update to be applied before continuing.
+        results = [app.call_soon_main(update, i).result() for i in range(3)]
+        return results
+
+    wrapped = wrapped_handler(Mock(), handler)
+    assert event_loop.run_until_complete(wrapped()) == [0, 2, 4]
+
+    # Every update was performed on the main thread, in order.
+    assert updates == [(i, threading.main_thread()) for i in range(3)]
+    assert label.text == 2
+
+
+def test_threaded_async_handler():
+    """Coroutines can't be marked as threaded handlers."""
+
+    async def handler(*args, **kwargs):
+        pass
+
+    with pytest.raises(
+        ValueError,
+        match=r"Only synchronous handlers can be run on a worker thread",
+    ):
+        threaded_handler(handler)
+
+
+def test_threaded_generator_handler():
+    """Generators can't be marked as threaded handlers."""
+
+    def handler(*args, **kwargs):
+        yield 0.01
+
+    with pytest.raises(
+        ValueError,
+        match=r"Only synchronous handlers can be run on a worker thread",
+    ):
+        threaded_handler(handler)
+
+
+def test_threaded_bound_method(app, event_loop):
+    """An existing bound method can be run on a worker thread."""
+
+    class Worker:
+        def work(self, widget, value, **kwargs):
+            return (self, widget, value, threading.current_thread())
+
+    worker = Worker()
+    handler = threaded_handler(worker.work)
+    # The original method isn't modified.
+    assert not hasattr(Worker.work, "handler")
+
+    obj = Mock()
+    result = event_loop.run_until_complete(wrapped_handler(obj, handler)(42))
+    assert result[:3] == (worker, obj, 42)
+    assert result[3] is not threading.main_thread()
+
+    # The wrapper can still be invoked directly.
+    assert handler(obj, 37)[:3] == (worker, obj, 37)
+
+
+def test_threaded_decorated_method(app, event_loop):
+    """A method decorated as a threaded handler is bound to its instance."""
+
+    class Worker:
+        @threaded_handler
+        def work(self, widget, **kwargs):
+            return (self, threading.current_thread())
+
+    # Accessed on the class, the decorator is returned unmodified.
+    assert Worker.__dict__["work"] is Worker.work
+    assert Worker.work.__name__ == "work"
+
+    worker = Worker()
+    wrapped = wrapped_handler(Mock(), worker.work)
+    instance, thread = event_loop.run_until_complete(wrapped())
+    assert instance is worker
+    assert thread is not threading.main_thread()
+
+
+def test_threaded_partial(app, event_loop):
+    """A callable that can't be bound can be a threaded handler."""
+
+    class Holder:
+        handler = threaded_handler(functools.partial(lambda prefix, widget: prefix, 42))
+
+    # The partial can't be bound, so the same wrapper is returned.
+    assert Holder().handler is Holder.handler
+    wrapped = wrapped_handler(Mock(), Holder().handler)
+    assert event_loop.run_until_complete(wrapped()) == 42
+
+
+def test_threaded_twice(app, event_loop):
+    """Marking a threaded handler again has no additional effect."""
+
+    def handler(widget, **kwargs):
+        return threading.current_thread()
+
+    wrapped = wrapped_handler(Mock(), threaded_handler(threaded_handler(handler)))
+    assert event_loop.run_until_complete(wrapped()) is not threading.main_thread()
+
+
+class FakeClock:
+    def __init__(self, loop):
+        self.loop = loop
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward, and run any timers that have become due."""
+        self.now += seconds
+        for _ in range(3):
+            self.loop.run_until_complete(asyncio.sleep(0))
+
+
+@pytest.fixture
+def clock(event_loop, monkeypatch):
+    """Timers on the event loop only fire when the test advances the clock."""
+    clock = FakeClock(event_loop)
+    monkeypatch.setattr(event_loop, "time", clock.time)
+    return clock
+
+
+def test_debounce(clock):
+    """A debounced handler is invoked once events stop arriving."""
+    obj = Mock()
+    calls = []
+    cleanup = Mock()
+
+    @debounce(0.05)
+    def handler(*args, **kwargs):
+        calls.append((args, kwargs))
+        return 42
+
+    wrapped = wrapped_handler(obj, handler, cleanup=cleanup)
+    assert wrapped._raw == handler
+
+    # Invocations are deferred.
+    assert wrapped("first") is None
+    assert wrapped("second", kwarg=1) is None
+    clock.advance(0.04)
+    assert wrapped("third", kwarg=2) is None
+    assert calls == []
+
+    # The timer restarts with every event; the handler is invoked once, with the most
+    # recent arguments.
+    clock.advance(0.04)
+    assert calls == []
+    clock.advance(0.02)
+    assert calls == [((obj, "third"), {"kwarg": 2})]
+    cleanup.assert_called_once_with(obj, 42)
+
+
+def test_debounce_async(clock):
+    """A coroutine handler can be debounced."""
+    obj = Mock()
+    calls = []
+
+    @debounce(0.01)
+    async def handler(*args, **kwargs):
+        calls.append(args)
+
+    wrapped = wrapped_handler(obj, handler)
+    wrapped("first")
+    wrapped("second")
+
+    clock.advance(0.01)
+    assert calls == [(obj, "second")]
+
+
+def test_throttle(clock):
+    """A throttled handler is invoked at most once per interval."""
+    obj = Mock()
+    calls = []
+
+    @throttle(0.05)
+    def handler(*args, **kwargs):
+        calls.append(args)
+        return 42
+
+    wrapped = wrapped_handler(obj, handler)
+    assert wrapped._raw == handler
+
+    # The first event is handled immediately.
+    assert wrapped("first") == 42
+    assert calls == [(obj, "first")]
+
+    # Subsequent events are deferred to the end of the interval, and combined.
+    clock.advance(0.01)
+    assert wrapped("second") is None
+    assert wrapped("third") is None
+    clock.advance(0.03)
+    assert calls == [(obj, "first")]
+
+    clock.advance(0.01)
+    assert calls == [(obj, "first"), (obj, "third")]
+
+    # An event during the next interval is deferred to the end of that interval.
+    clock.advance(0.01)
+    assert wrapped("fourth") is None
+    clock.advance(0.04)
+    assert calls[-1] == (obj, "fourth")
+
+    # Once the interval has passed, an event is handled immediately again.
+    clock.advance(0.05)
+    assert wrapped("fifth") == 42
+    assert calls[-1] == (obj, "fifth")
+
+
+def test_coalesce(event_loop):
+    """Events in one iteration of the event loop invoke a handler once."""
+    obj = Mock()
+    calls = []
+
+    @coalesce
+    def handler(*args, **kwargs):
+        calls.append((args, kwargs))
+
+    wrapped = wrapped_handler(obj, handler)
+    assert wrapped._raw == handler
+
+    assert wrapped(1) is None
+    assert wrapped(2) is None
+    assert wrapped(3, kwarg=4) is None
+    assert calls == []
+
+    event_loop.run_until_complete(asyncio.sleep(0))
+    assert calls == [((obj, 3), {"kwarg": 4})]
+
+    # Events in a later iteration invoke the handler again.
+    wrapped(5)
+    event_loop.run_until_complete(asyncio.sleep(0))
+    assert calls[-1] == ((obj, 5), {})
+    assert len(calls) == 2
+
+
+def test_policy_bound_method(clock):
+    """A policy can be applied to an existing bound method."""
+
+    class Search:
+        def __init__(self):
+            self.calls = []
+
+        def on_change(self, widget, value, **kwargs):
+            self.calls.append(value)
+
+    search = Search()
+    handler = debounce(0.1)(search.on_change)
+    # The original method isn't modified.
+    assert not hasattr(Search.on_change, "policy")
+
+    wrapped = wrapped_handler(Mock(), handler)
+    wrapped("a")
+    wrapped("ab")
+    clock.advance(0.1)
+    assert search.calls == ["ab"]
+
+    # The wrapper can still be invoked directly.
+    handler(Mock(), "abc")
+    assert search.calls == ["ab", "abc"]
+
+
+def test_policy_decorated_method(clock):
+    """A method decorated with a policy is bound to its instance."""
+
+    class Search:
+        def __init__(self):
+            self.calls = []
+
+        @debounce(0.1)
+        def on_change(self, widget, value, **kwargs):
+            self.calls.append(value)
+
+    # Accessed on the class, the decorator is returned unmodified.
+    assert Search.__dict__["on_change"] is Search.on_change
+    assert Search.on_change.__name__ == "on_change"
+
+    first = Search()
+    second = Search()
+    first_wrapped = wrapped_handler(Mock(), first.on_change)
+    second_wrapped = wrapped_handler(Mock(), second.on_change)
+    first_wrapped("one")
+    second_wrapped("two")
+    clock.advance(0.1)
+
+    assert first.calls == ["one"]
+    assert second.calls == ["two"]
+
+
+def test_combined_policies(event_loop):
+    """Policies can be combined; the outer policy controls the inner policy."""
+    calls = []
+
+    @throttle(1)
+    @coalesce
+    def handler(widget, value, **kwargs):
+        calls.append(value)
+
+    wrapped = wrapped_handler(Mock(), handler)
+
+    # The first event passes the throttle, but is deferred by the coalesce policy.
+    assert wrapped(1) is None
+    assert calls == []
+    event_loop.run_until_complete(asyncio.sleep(0))
+    assert calls == [1]
+
+
+def test_threaded_policy(app, event_loop):
+    """A threaded handler can have a policy."""
+    calls = []
+
+    @coalesce
+    @threaded_handler
+    def handler(widget, value, **kwargs):
+        calls.append((value, threading.current_thread()))
+
+    wrapped = wrapped_handler(Mock(), handler)
+    wrapped(1)
+    wrapped(2)
+
+    # Wait for the coalesced call, and then the worker thread.
+    event_loop.run_until_complete(asyncio.sleep(0))
+    event_loop.run_until_complete(asyncio.gather(*app._running_tasks))
+    assert len(calls) == 1
+    assert calls[0][0] == 2
+    assert calls[0][1] is not threading.main_thread()
+
+
+def test_threaded_policy_coroutine():
+    """A coroutine with a policy can't be made into a threaded handler."""
+
+    @debounce(0.1)
+    async def handler(*args, **kwargs):
+        pass
+
+    with pytest.raises(
+        ValueError,
+        match=r"Only synchronous handlers can be run on a worker thread",
+    ):
+        threaded_handler(handler)
+
+
+def test_switch_latest(app, event_loop):
+    """Invoking a switch-latest handler cancels the previous invocation."""
+    obj = Mock()
+    cleanup = Mock()
+    started = []
+    finished = []
+
+    @switch_latest
+    async def handler(widget, value, **kwargs):
+        started.append(value)
+        await asyncio.sleep(0.01 * value)
+        finished.append(value)
+        return value
+
+    wrapped = wrapped_handler(obj, handler, cleanup=cleanup)
+    assert wrapped._raw == handler
+
+    first = wrapped(3)
+    event_loop.run_until_complete(asyncio.sleep(0))
+    second = wrapped(2)
+    third = wrapped(1)
+
+    # The earlier invocations are cancelled, and removed from the app's tasks.
+    assert event_loop.run_until_complete(third) == 1
+    assert first.cancelled()
+    assert second.cancelled()
+    assert first not in app._running_tasks
+    assert second not in app._running_tasks
+
+    # The second invocation was cancelled before it started.
+    assert started == [3, 1]
+    assert finished == [1]
+    # Only the latest invocation is cleaned up.
+    cleanup.assert_called_once_with(obj, 1)
+
+    # A completed invocation doesn't need to be cancelled.
+    assert event_loop.run_until_complete(wrapped(1)) == 1
+    assert finished == [1, 1]
+
+
+def test_switch_latest_generator(clock):
+    """A generator handler can be cancelled by a later invocation."""
+    obj = Mock()
+    progress = []
+
+    @switch_latest
+    def handler(widget, value, **kwargs):
+        for i in range(3):
+            progress.append((value, i))
+            yield 0.02
+        return value
+
+    wrapped = wrapped_handler(obj, handler)
+
+    first = wrapped("first")
+    clock.advance(0)
+    clock.advance(0.02)
+    second = wrapped("second")
+    clock.advance(0)
+    for _ in range(3):
+        clock.advance(0.02)
+
+    assert first.cancelled()
+    assert second.result() == "second"
+    assert progress == [("first", 0), ("first", 1)] + [("second", i) for i in range(3)]
+
+
+def test_debounced_switch_latest(app, clock):
+    """A debounced handler can cancel its stale invocations."""
+    requests = []
+    results = []
+    cleanup = Mock()
+
+    @debounce(0.3)
+    @switch_latest
+    async def on_change(widget, value, **kwargs):
+        requests.append(value)
+        # A slow search
+        await asyncio.sleep(1)
+        results.append(value)
+        return value
+
+    wrapped = wrapped_handler(Mock(), on_change, cleanup=cleanup)
+
+    # Typing quickly only starts one search.
+    wrapped("a")
+    clock.advance(0.1)
+    wrapped("ab")
+    clock.advance(0.3)
+    assert requests == ["ab"]
+
+    # Typing again after a pause starts a new search, cancelling the previous one.
+    clock.advance(0.2)
+    wrapped("abc")
+    clock.advance(0.3)
+    assert requests == ["ab", "abc"]
+
+    clock.advance(1)
+    assert results == ["abc"]
+    cleanup.assert_called_once_with(ANY, "abc")
+    assert not app._running_tasks
+
+
+def test_switch_latest_bound_method(app, event_loop):
+    """An existing bound method can be given the switch-latest policy."""
+
+    class Search:
+        async def on_change(self, widget, value, **kwargs):
+            await asyncio.sleep(0.01)
+            return value
+
+    wrapped = wrapped_handler(Mock(), switch_latest(Search().on_change))
+    first = wrapped(1)
+    second = wrapped(2)
+
+    assert event_loop.run_until_complete(second) == 2
+    assert first.cancelled()
+
+
+def test_switch_latest_sync(event_loop):
+    """A synchronous handler is unaffected by the switch-latest policy."""
+    obj = Mock()
+
+    @switch_latest
+    def handler(widget, value, **kwargs):
+        return value * 2
+
+    wrapped = wrapped_handler(obj, handler)
+    assert wrapped(2) == 4
+    assert wrapped(3) == 6
+
+
+def test_policy_per_handler(event_loop):
+    """Each installed copy of a handler has its own policy state."""
+    calls = []
+
+    @coalesce
+    def handler(widget, **kwargs):
+        calls.append(widget)
+
+    first = wrapped_handler("first", handler)
+    second = wrapped_handler("second", handler)
+    first()
+    second()
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    assert calls == ["first", "second"]
+
+
+def test_policy_repr():
+    """A handler policy has a useful repr."""
+
+    @throttle(0.1)
+    def handler(*args, **kwargs):
+        pass
+
+    assert isinstance(handler.policy, HandlerPolicy)
+    assert repr(handler.policy) == "<HandlerPolicy throttle>"
+
+
+@pytest.mark.parametrize(
+    "policy, message",
+    [
+        (lambda: debounce(-1), r"delay must be a non-negative number"),
+        (lambda: throttle(-0.5), r"interval must be a non-negative number"),
+    ],
+)
+def test_invalid_policy(policy, message):
+    """Policy intervals must be valid."""
+    with pytest.raises(ValueError, match=message):
+        policy()
+
+
 def test_native_handler():
     """A native function can be used as a handler."""
     obj = Mock()
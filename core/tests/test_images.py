@@ -1,15 +1,24 @@
+import sys
+import threading
 from pathlib import Path
 
 import PIL.Image
 import pytest
 
 import toga
+import toga_dummy.images
+from toga.constants import PixelFormat
+from toga.images import PixelBuffer
+from toga.plugins.image_formats import PILConverter
 from toga_dummy.plugins.image_formats import (
     CustomImage,
     CustomImageSubclass,
     DisabledImageConverter,
 )
-from toga_dummy.utils import assert_action_performed_with
+from toga_dummy.utils import (
+    assert_action_not_performed,
+    assert_action_performed_with,
+)
 
 RELATIVE_FILE_PATH = Path("resources/sample.png")
 ABSOLUTE_FILE_PATH = Path(__file__).parent / "resources/sample.png"
@@ -181,6 +190,108 @@ def test_create_from_toga_image(app):
     assert isinstance(toga_image_2, toga.Image)
     assert toga_image_2.size == (144, 72)
 
+    # The copy shares the native image of the original, rather than decoding the
+    # image again.
+    assert toga_image_2._impl.native is toga_image._impl.native
+    assert_action_performed_with(toga_image_2, "load image from raw")
+    assert_action_not_performed(toga_image_2, "load image data")
+
+
+def test_pixel_buffer():
+    """A pixel buffer wraps raw pixel data without copying it."""
+    data = bytearray(2 * 16 + 3 * 4)
+    pixels = PixelBuffer(data, 3, 3, stride=16, format=PixelFormat.ARGB32)
+
+    assert pixels.size == (3, 3)
+    assert pixels.width == 3
+    assert pixels.height == 3
+    assert pixels.stride == 16
+    assert pixels.format == PixelFormat.ARGB32
+    assert repr(pixels) == "<PixelBuffer 3x3 stride=16 format=ARGB32>"
+
+    # The data is exposed through the buffer protocol, and shares memory with the
+    # original data.
+    data[0] = 42
+    assert pixels.data[0] == 42
+    assert pixels.__buffer__(0)[0] == 42
+
+    # The stride defaults to 4 bytes per pixel.
+    pixels = PixelBuffer(bytes(24), 3, 2)
+    assert pixels.stride == 12
+    assert pixels.format == PixelFormat.RGBA
+
+    # An empty image doesn't require any data.
+    assert PixelBuffer(b"", 10, 0).size == (10, 0)
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, message",
+    [
+        ((bytes(16), -1, 1), {}, r"width and height must be non-negative"),
+        ((bytes(16), 1, -1), {}, r"width and height must be non-negative"),
+        ((bytes(16), 2, 2), {"stride": 4}, r"stride must be at least 8 bytes"),
+        (
+            (bytes(15), 2, 2),
+            {},
+            r"A 2x2 image with a stride of 8 requires at least 16 bytes; got 15",
+        ),
+    ],
+)
+def test_pixel_buffer_invalid(args, kwargs, message):
+    """A pixel buffer must be large enough to contain its pixels."""
+    with pytest.raises(ValueError, match=message):
+        PixelBuffer(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "pixel, format, color",
+    [
+        (bytes([10, 20, 30, 255]), PixelFormat.RGBA, (10, 20, 30, 255)),
+        # ARGB32 is stored as native-endian integers
+        (
+            (0xFF0A141E).to_bytes(4, sys.byteorder),
+            PixelFormat.ARGB32,
+            (10, 20, 30, 255),
+        ),
+    ],
+)
+def test_create_from_pixels(app, pixel, format, color):
+    """An image can be created from raw pixels."""
+    # A 2x2 image, with 4 bytes of padding at the end of each row.
+    data = (pixel * 2 + bytes(4)) * 2
+    image = toga.Image(PixelBuffer(data, 2, 2, stride=12, format=format))
+
+    assert image.size == (2, 2)
+    assert_action_performed_with(image, "load image pixels")
+    assert image.as_format(PIL.Image.Image).getpixel((1, 1)) == color
+
+
+def test_as_format_pixels(app):
+    """An image can be converted to raw pixels."""
+    image = toga.Image(ABSOLUTE_FILE_PATH)
+    pixels = image.as_format(PixelBuffer)
+
+    assert pixels.size == (144, 72)
+    assert pixels.stride == 144 * 4
+    assert pixels.format == PixelFormat.RGBA
+
+    # The pixels can be used to construct a new image.
+    copy = toga.Image(pixels)
+    assert copy.size == (144, 72)
+    assert copy.as_format(PixelBuffer).data == pixels.data
+
+
+def test_pixels_unsupported(app, monkeypatch):
+    """If the backend doesn't support raw pixels, they can't be used."""
+    pixels = toga.Image(ABSOLUTE_FILE_PATH).as_format(PixelBuffer)
+    monkeypatch.delattr(toga_dummy.images.Image, "get_pixels")
+
+    with pytest.raises(TypeError, match=r"Unsupported source type for Image"):
+        toga.Image(pixels)
+
+    with pytest.raises(TypeError, match=r"Unknown conversion format for Image:"):
+        toga.Image(ABSOLUTE_FILE_PATH).as_format(PixelBuffer)
+
 
 @pytest.mark.parametrize("kwargs", [{"data": BYTES}, {"path": ABSOLUTE_FILE_PATH}])
 def test_deprecated_arguments(kwargs):
@@ -263,6 +374,7 @@ def test_as_format_toga(app, Class_1, Class_2):
 
     assert isinstance(image_2, Class_2)
     assert image_2.size == (144, 72)
+    assert image_2._impl.native is image_1._impl.native
 
 
 def test_as_format_pil(app):
@@ -273,6 +385,58 @@ def test_as_format_pil(app):
     assert pil_image.size == (144, 72)
 
 
+@pytest.mark.parametrize("mode", ["RGBA", "RGB", "L", "P"])
+def test_pil_round_trip(app, mode):
+    """PIL images are converted using raw pixels, without an image encoding."""
+    pil_image = PIL.Image.new(mode, (3, 2))
+    pil_image.putpixel((1, 1), (10, 20, 30, 128) if mode == "RGBA" else 200)
+    toga_image = toga.Image(pil_image)
+
+    assert toga_image.size == (3, 2)
+    assert_action_performed_with(toga_image, "load image pixels")
+
+    converted = toga_image.as_format(PIL.Image.Image)
+    assert converted.mode == "RGBA"
+    assert converted.size == (3, 2)
+    assert converted.getpixel((1, 1)) == pil_image.convert("RGBA").getpixel((1, 1))
+
+
+def test_pil_unconvertible_mode(app, monkeypatch):
+    """A PIL image that can't be converted to raw pixels is encoded instead."""
+    assert PILConverter.convert_to_pixels(PIL.Image.new("La", (3, 2))) is None
+
+    monkeypatch.setattr(PILConverter, "convert_to_pixels", lambda image: None)
+    toga_image = toga.Image(PIL.Image.new("RGBA", (3, 2)))
+
+    assert toga_image.size == (3, 2)
+    assert_action_performed_with(toga_image, "load image data")
+
+
+def test_pil_pixels_unsupported(app, monkeypatch):
+    """If the backend doesn't support raw pixels, PIL images are encoded."""
+    monkeypatch.delattr(toga_dummy.images.Image, "get_pixels")
+
+    toga_image = toga.Image(PIL.Image.new("RGBA", (3, 2)))
+    assert_action_performed_with(toga_image, "load image data")
+
+    pil_image = toga_image.as_format(PIL.Image.Image)
+    assert pil_image.size == (3, 2)
+
+
+@pytest.mark.parametrize("format", [PixelFormat.RGBA, PixelFormat.ARGB32])
+def test_pil_from_pixels(format):
+    """The PIL converter can decode every pixel format."""
+    if format == PixelFormat.RGBA:
+        pixel = bytes([10, 20, 30, 255])
+    else:
+        pixel = (0xFF0A141E).to_bytes(4, sys.byteorder)
+    pixels = PixelBuffer((pixel * 2 + bytes(4)) * 2, 2, 2, stride=12, format=format)
+
+    pil_image = PILConverter.convert_from_pixels(pixels, PIL.Image.Image)
+    assert pil_image.size == (2, 2)
+    assert pil_image.getpixel((1, 1)) == (10, 20, 30, 255)
+
+
 @pytest.mark.parametrize("ImageClass", [CustomImage, CustomImageSubclass])
 def test_create_from_custom_class(app, ImageClass):
     """toga.Image can be created from custom type."""
@@ -304,3 +468,95 @@ def test_as_format_invalid_input(app, arg):
 
     with pytest.raises(TypeError, match=r"Unknown conversion format for Image:"):
         toga_image.as_format(arg)
+
+
+class ThreadRecordingImage(toga.Image):
+    def __init__(self, src):
+        self.thread = threading.current_thread()
+        super().__init__(src)
+
+
+@pytest.fixture
+def decode_threads(monkeypatch):
+    """Record the threads on which images are decoded."""
+    threads = []
+    decode = toga.images._decode
+
+    def recording_decode(src):
+        threads.append(threading.current_thread())
+        return decode(src)
+
+    monkeypatch.setattr(toga.images, "_decode", recording_decode)
+    return threads
+
+
+async def test_load(app, decode_threads):
+    """An image is decoded on a background thread, and created on the main thread."""
+    image = await ThreadRecordingImage.load(RELATIVE_FILE_PATH)
+
+    assert isinstance(image, ThreadRecordingImage)
+    assert image.size == (144, 72)
+    assert image.path == ABSOLUTE_FILE_PATH
+    # The file was decoded into raw pixels in the background.
+    assert_action_performed_with(image, "load image pixels")
+    assert decode_threads[0].name.startswith("toga-image")
+    assert image.thread is threading.main_thread()
+
+
+async def test_load_without_pixels(app, monkeypatch):
+    """If the backend doesn't support raw pixels, the image is created from its
+    data."""
+    monkeypatch.delattr(toga_dummy.images.Image, "get_pixels")
+    image = await toga.Image.load(RELATIVE_FILE_PATH)
+
+    assert image.size == (144, 72)
+    assert image.path == ABSOLUTE_FILE_PATH
+    assert_action_performed_with(image, "load image data", data=BYTES)
+
+
+async def test_load_unknown_format(app, monkeypatch):
+    """Data that can't be decoded in the background is passed to the backend."""
+    monkeypatch.setattr(
+        PILConverter, "convert_to_pixels", lambda image: pytest.fail("decoded")
+    )
+    with pytest.raises(PIL.UnidentifiedImageError):
+        await toga.Image.load(b"not an image")
+
+
+async def test_load_unsupported_pixels(app, monkeypatch):
+    """An image whose pixels can't be extracted in the background is passed to the
+    backend as-is."""
+    monkeypatch.setattr(PILConverter, "convert_to_pixels", lambda image: None)
+    image = await toga.Image.load(RELATIVE_FILE_PATH)
+
+    assert image.size == (144, 72)
+    assert_action_performed_with(image, "load image data")
+
+
+async def test_load_missing(app):
+    """Errors loading an image are raised when the load is awaited."""
+    with pytest.raises(FileNotFoundError, match=r"Image file .* does not exist"):
+        await toga.Image.load(MISSING_RELATIVE_PATH)
+
+
+async def test_load_many(app, decode_threads):
+    """Several images can be loaded in parallel, on a bounded pool of threads."""
+    with PIL.Image.open(ABSOLUTE_FILE_PATH) as pil_image:
+        pil_image.load()
+    custom_image = CustomImage()
+    raw_image = toga_dummy.images.DummyImage(pil_image)
+    sources = [ABSOLUTE_FILE_PATH, BYTES, pil_image, custom_image, raw_image] * 3
+
+    images = await ThreadRecordingImage.load_many(iter(sources))
+
+    assert len(images) == 15
+    assert all(isinstance(image, ThreadRecordingImage) for image in images)
+    assert [image.path for image in images[:3]] == [ABSOLUTE_FILE_PATH, None, None]
+    assert all(image.thread is threading.main_thread() for image in images)
+    assert len(set(decode_threads)) <= toga.images.MAX_LOAD_WORKERS
+    assert threading.main_thread() not in decode_threads
+
+
+async def test_load_many_empty(app):
+    """Loading no images returns an empty list."""
+    assert await toga.Image.load_many([]) == []
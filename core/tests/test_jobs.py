@@ -0,0 +1,298 @@
+import asyncio
+import os
+import queue
+import sys
+import threading
+from types import ModuleType
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+import toga.jobs
+from toga.jobs import (
+    Job,
+    _JobRunner,
+    _run_job,
+    _use_worker_processes,
+    cancel_requested,
+    report_progress,
+)
+
+
+def square(value):
+    return value * value
+
+
+def count_to(limit, step=1):
+    for i in range(0, limit, step):
+        report_progress(i)
+    return os.getpid()
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def gated(gate, finished=None):
+    # Wait until the test opens the gate, then report whether the job was cancelled.
+    report_progress("started")
+    gate.wait()
+    report_progress(cancel_requested())
+    if finished:
+        finished.set()
+    return "opened"
+
+
+@pytest.fixture
+def app(app, monkeypatch):
+    # Unless a test asks for worker processes, jobs are run on worker threads, so
+    # that a test can control exactly when each job runs.
+    monkeypatch.setattr(toga.jobs, "_use_worker_processes", lambda app: False)
+    yield app
+    # Shut down the job's workers.
+    app.exit()
+
+
+@pytest.fixture
+def gate():
+    gate = threading.Event()
+    yield gate
+    # Make sure no job is left blocking a worker thread.
+    gate.set()
+
+
+def test_run_job(app, event_loop):
+    """A function can be run as a job."""
+    job = app.run_job(square, 7)
+    assert isinstance(job, Job)
+    assert repr(job) == "<Job 0 running>"
+    assert not job.done
+
+    assert event_loop.run_until_complete(job) == 49
+    assert job.done
+    assert not job.cancelled
+    assert repr(job) == "<Job 0 done>"
+
+
+def test_progress(app, event_loop):
+    """Progress reported by a job is delivered on the event loop, before the result."""
+    progress = toga.ProgressBar(max=10)
+    reports = []
+
+    def on_progress(job, value, **kwargs):
+        reports.append(value)
+        progress.value = value
+
+    job = app.run_job(count_to, 10, on_progress=on_progress)
+    event_loop.run_until_complete(job)
+    assert reports == list(range(10))
+    assert progress.value == 9
+
+    # Another job can be run with keyword arguments, using the same workers.
+    reports.clear()
+    job = app.run_job(count_to, 10, step=5, on_progress=on_progress)
+    event_loop.run_until_complete(job)
+    assert reports == [0, 5]
+
+
+def test_no_progress_handler(app, event_loop):
+    """Progress is ignored if there is no handler."""
+    job = app.run_job(count_to, 5)
+    event_loop.run_until_complete(job)
+    assert job.done
+
+
+def test_job_error(app, event_loop):
+    """An exception raised by a job is raised when the job is awaited."""
+    job = app.run_job(fail, "Problem in job")
+
+    with pytest.raises(ValueError, match=r"Problem in job"):
+        event_loop.run_until_complete(job)
+    assert job.done
+    assert not job.cancelled
+
+
+def test_cancel_running(app, event_loop, gate):
+    """A running job can be asked to stop."""
+    started = asyncio.Event()
+    finished = threading.Event()
+    reports = []
+
+    def on_progress(job, value, **kwargs):
+        reports.append(value)
+        started.set()
+
+    job = app.run_job(gated, gate, finished, on_progress=on_progress)
+    event_loop.run_until_complete(started.wait())
+
+    assert job.cancel()
+    assert job.cancelled
+    assert repr(job) == "<Job 0 cancelled>"
+    with pytest.raises(asyncio.CancelledError):
+        event_loop.run_until_complete(job)
+
+    # A job can't be cancelled twice.
+    assert not job.cancel()
+
+    # The worker saw the cancellation, but the final progress report is discarded.
+    gate.set()
+    assert finished.wait(timeout=5)
+    event_loop.run_until_complete(app.run_job(square, 2))
+    assert reports == ["started"]
+
+
+def test_cancel_pending(app, event_loop, gate):
+    """A job that hasn't started running is never started."""
+    # Occupy every worker. The workers are created when the first job is run.
+    busy = [app.run_job(gated, gate)]
+    workers = app._jobs.executor._max_workers
+    busy.extend(app.run_job(gated, gate) for _ in range(workers - 1))
+
+    ran = threading.Event()
+    job = app.run_job(ran.set)
+    assert job.cancel()
+    # Let the cancellation reach the worker pool before any worker is free.
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    gate.set()
+    assert event_loop.run_until_complete(asyncio.gather(*busy)) == ["opened"] * workers
+    assert not ran.is_set()
+
+
+def test_exit_cancels_jobs(app, gate):
+    """Exiting the app cancels any jobs that are running."""
+    job = app.run_job(gated, gate)
+    app.exit()
+
+    assert job.cancelled
+    assert app._jobs is None
+
+
+def test_direct_invocation():
+    """A job's function can be invoked directly, ignoring progress."""
+    assert not cancel_requested()
+    assert count_to(3) == os.getpid()
+
+
+def test_closed_loop(app, event_loop):
+    """Messages that arrive after the event loop has closed are discarded."""
+    # The workers are created when the first job is run.
+    assert app._jobs is None
+    event_loop.run_until_complete(app.run_job(square, 2))
+    runner = app._jobs
+    runner.app = Mock()
+    runner.app.loop.call_soon_threadsafe.side_effect = RuntimeError("Loop closed")
+
+    # The reader stops when the message can't be delivered.
+    runner.messages.put((42, "progress", 1))
+    runner._reader.join(timeout=5)
+    assert not runner._reader.is_alive()
+
+
+def test_worker_processes(app, event_loop, monkeypatch):
+    """Jobs can be run in worker processes."""
+    # Spawning a worker process requires a __main__ module; the test suite removes
+    # the real one, so install an empty replacement.
+    monkeypatch.setitem(sys.modules, "__main__", ModuleType("__main__"))
+    app._jobs = _JobRunner(app, processes=True)
+
+    reports = []
+    job = app.run_job(
+        count_to, 3, on_progress=lambda job, value, **kwargs: reports.append(value)
+    )
+    # The job ran in a different process.
+    assert event_loop.run_until_complete(job) != os.getpid()
+    assert reports == [0, 1, 2]
+
+    # A job that can't be sent to a worker process fails.
+    job = app.run_job(lambda: 42)
+    with pytest.raises(Exception, match=r"pickle"):
+        event_loop.run_until_complete(job)
+    assert job.done
+
+
+@pytest.mark.parametrize(
+    "platform, executable, processes",
+    [
+        ("linux", "/usr/bin/python3", True),
+        ("macOS", "/usr/local/bin/python", True),
+        # A bundled app
+        ("macOS", "/Applications/Hello.app/Contents/MacOS/Hello", False),
+        # Platforms that can't start a process
+        ("android", "/usr/bin/python3", False),
+        ("iOS", "/usr/bin/python3", False),
+        ("web", "/usr/bin/python3", False),
+    ],
+)
+def test_use_worker_processes(app, monkeypatch, platform, executable, processes):
+    """Worker processes are only used where a Python interpreter can be started."""
+    monkeypatch.setattr(toga.jobs, "current_platform", platform)
+    monkeypatch.setattr(sys, "executable", executable)
+    assert _use_worker_processes(app) is processes
+
+
+def test_jobs_per_thread():
+    """Each worker thread has its own current job."""
+    cancelled = threading.Event()
+    cancelled.set()
+    seen = []
+
+    def check():
+        # Another thread isn't running this job.
+        thread = threading.Thread(target=lambda: seen.append(cancel_requested()))
+        thread.start()
+        thread.join()
+        return cancel_requested()
+
+    message_queue = queue.Queue()
+    _run_job(0, message_queue, cancelled, check, (), {})
+    assert message_queue.get() == (0, "result", True)
+    assert seen == [False]
+
+
+@pytest.mark.parametrize(
+    "fn, args, messages",
+    [
+        (count_to, (3,), [(0, "progress", 0), (0, "progress", 1), (0, "progress", 2)]),
+        (square, (3,), []),
+    ],
+)
+def test_run_job_in_process(fn, args, messages):
+    """The result of a job is returned after any progress it reports."""
+    message_queue = queue.Queue()
+    _run_job(0, message_queue, threading.Event(), fn, args, {})
+
+    results = []
+    while not message_queue.empty():
+        results.append(message_queue.get())
+    assert results[:-1] == messages
+    assert results[-1][:2] == (0, "result")
+
+
+def test_run_job_in_process_error():
+    """An error raised by a job is returned as a message."""
+    message_queue = queue.Queue()
+    _run_job(0, message_queue, threading.Event(), fail, ("Problem",), {})
+
+    job_id, kind, error = message_queue.get()
+    assert (job_id, kind) == (0, "error")
+    assert isinstance(error, ValueError)
+
+
+def test_cancel_requested_in_process():
+    """A job can check whether it has been cancelled."""
+    cancelled = threading.Event()
+    message_queue = queue.Queue()
+
+    def check():
+        return cancel_requested()
+
+    _run_job(0, message_queue, cancelled, check, (), {})
+    cancelled.set()
+    _run_job(1, message_queue, cancelled, check, (), {})
+
+    assert message_queue.get() == (0, "result", False)
+    assert message_queue.get() == (1, "result", True)
+    # Outside of a job, cancellation is never requested.
+    assert not cancel_requested()
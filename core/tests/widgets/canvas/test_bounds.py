@@ -0,0 +1,408 @@
+from math import pi
+from unittest.mock import patch
+
+import pytest
+
+from toga.constants import Baseline
+from toga.widgets.canvas import DrawingObject, Rect
+
+
+@pytest.mark.parametrize(
+    "draw, bounds",
+    [
+        # Rectangles
+        (lambda context: context.rect(10, 20, 30, 40), (10, 20, 30, 40)),
+        # Lines require a current point
+        (lambda context: context.line_to(10, 20), None),
+        (
+            lambda context: (context.move_to(10, 10), context.line_to(50, 30)),
+            (10, 10, 40, 20),
+        ),
+        # Curves are contained by their control points
+        (
+            lambda context: (
+                context.move_to(0, 0),
+                context.bezier_curve_to(10, -10, 30, 50, 40, 0),
+            ),
+            (0, -10, 40, 60),
+        ),
+        (
+            lambda context: context.bezier_curve_to(10, -10, 30, 50, 40, 0),
+            (10, -10, 30, 60),
+        ),
+        (
+            lambda context: (
+                context.move_to(0, 0),
+                context.quadratic_curve_to(20, 40, 40, 0),
+            ),
+            (0, 0, 40, 40),
+        ),
+        # Arcs are contained by their circle, and are joined to the current point.
+        (lambda context: context.arc(50, 50, 10), (40, 40, 20, 20)),
+        (
+            lambda context: (context.move_to(0, 0), context.arc(50, 50, 10)),
+            (0, 0, 60, 60),
+        ),
+        (lambda context: context.ellipse(50, 50, 20, 10, pi / 4), (30, 30, 40, 40)),
+        # Polylines
+        (lambda context: context.polyline([10, 20, 30, 5, 0, 40]), (0, 5, 30, 35)),
+        (lambda context: context.polyline([]), None),
+        # Text is measured by the canvas.
+        (lambda context: context.write_text("Hello", 10, 50), (10, 41, 60, 12)),
+        (
+            lambda context: context.write_text("Hello", 10, 50, baseline=Baseline.TOP),
+            (10, 50, 60, 12),
+        ),
+        (
+            lambda context: context.write_text(
+                "Hello", 10, 50, baseline=Baseline.MIDDLE
+            ),
+            (10, 44, 60, 12),
+        ),
+        (
+            lambda context: context.write_text(
+                "Hello", 10, 50, baseline=Baseline.BOTTOM
+            ),
+            (10, 38, 60, 12),
+        ),
+        # Operations that don't draw anything have no bounds.
+        (lambda context: context.begin_path(), None),
+        (lambda context: context.move_to(10, 20), None),
+        (lambda context: context.close_path(), None),
+        (lambda context: context.translate(10, 20), None),
+        (lambda context: context.fill(), None),
+    ],
+)
+def test_primitive_bounds(widget, draw, bounds):
+    """The bounds of a drawing primitive can be determined."""
+    result = draw(widget.context)
+    obj = result[-1] if isinstance(result, tuple) else result
+    if bounds is None:
+        assert obj.bounds is None
+    else:
+        assert obj.bounds == pytest.approx(bounds)
+
+
+def test_paint_bounds(widget):
+    """Fills and strokes cover the current path."""
+    widget.context.move_to(10, 10)
+    line = widget.context.line_to(50, 10)
+    fill = widget.context.fill()
+    stroke = widget.context.stroke(line_width=4)
+
+    assert line.bounds == (10, 10, 40, 0)
+    assert fill.bounds == (10, 10, 40, 0)
+    # A stroke extends beyond the path by half the line width.
+    assert stroke.bounds == (8, 8, 44, 4)
+
+    # Beginning a new path discards the existing path.
+    widget.context.begin_path()
+    assert widget.context.fill().bounds is None
+
+
+@pytest.mark.parametrize(
+    "transform, bounds",
+    [
+        (lambda context: context.translate(100, 50), (100, 50, 10, 20)),
+        (lambda context: context.scale(2, 3), (0, 0, 20, 60)),
+        (lambda context: context.rotate(pi / 2), (-20, 0, 20, 10)),
+        (
+            lambda context: (context.translate(100, 50), context.reset_transform()),
+            (0, 0, 10, 20),
+        ),
+    ],
+)
+def test_transformed_bounds(widget, transform, bounds):
+    """Bounds are reported in canvas coordinates."""
+    transform(widget.context)
+    rect = widget.context.rect(0, 0, 10, 20)
+    assert rect.bounds == pytest.approx(bounds)
+
+
+def test_transformed_stroke(widget):
+    """The width of a stroke is scaled by the transform."""
+    widget.context.scale(2, 2)
+    widget.context.move_to(10, 10)
+    widget.context.line_to(50, 10)
+    stroke = widget.context.stroke(line_width=4)
+    assert stroke.bounds == (16, 16, 88, 8)
+
+
+def test_context_bounds(widget):
+    """A context covers its content, and restores the transform when it ends."""
+    with widget.Context() as context:
+        context.translate(100, 100)
+        first = context.rect(0, 0, 10, 10)
+        second = context.rect(50, 20, 10, 10)
+    rect = widget.context.rect(0, 0, 10, 10)
+
+    assert first.bounds == (100, 100, 10, 10)
+    assert second.bounds == (150, 120, 10, 10)
+    assert context.bounds == (100, 100, 60, 30)
+    assert rect.bounds == (0, 0, 10, 10)
+    assert widget.context.bounds == (0, 0, 160, 130)
+
+    # An empty context has no bounds.
+    with widget.Context() as empty:
+        pass
+    assert empty.bounds is None
+
+
+def test_closed_path_bounds(widget):
+    """A closed path context starts a new path at its origin."""
+    widget.context.rect(100, 100, 10, 10)
+    with widget.ClosedPath(10, 10) as path:
+        line = path.line_to(20, 30)
+    fill = widget.context.fill()
+
+    assert line.bounds == (10, 10, 10, 20)
+    assert path.bounds == (10, 10, 10, 20)
+    assert fill.bounds == (10, 10, 10, 20)
+
+    # A closed path doesn't need an origin.
+    with widget.ClosedPath() as path:
+        path.move_to(50, 50)
+        line = path.line_to(60, 70)
+    assert line.bounds == (50, 50, 10, 20)
+
+
+def test_fill_context_bounds(widget):
+    """A fill context covers the path it fills."""
+    with widget.Fill(10, 10) as fill:
+        first = fill.line_to(50, 10)
+        fill.line_to(50, 50)
+
+    assert first.bounds == (10, 10, 40, 0)
+    assert fill.bounds == (10, 10, 40, 40)
+
+    # The path is consumed by the fill.
+    assert widget.context.fill().bounds is None
+
+
+def test_stroke_context_bounds(widget):
+    """A stroke context extends beyond its path by half the line width."""
+    with widget.Stroke(10, 10, line_width=4) as stroke:
+        line = stroke.line_to(50, 10)
+
+    assert line.bounds == (8, 8, 44, 4)
+    assert stroke.bounds == (8, 8, 44, 4)
+
+
+def test_unbounded(widget):
+    """An object whose extent can't be determined has no bounds, and makes the extent
+    of its context unknown."""
+
+    class Custom(DrawingObject):
+        def _compile(self, impl, instructions, kwargs):
+            pass
+
+    with widget.Context() as context:
+        context.rect(0, 0, 10, 10)
+        custom = Custom()
+        context.append(custom)
+
+    assert custom.bounds is None
+    assert context.bounds is None
+    assert widget.objects_at(5, 5) == [context.drawing_objects[0]]
+
+
+def test_text_descender_bounds(widget):
+    """The bounds of text on an alphabetic baseline include its descenders."""
+    text = widget.context.write_text("Hello", 10, 50)
+    # The dummy font has an ascent of 9, and a line height of 12; so the descenders
+    # extend 3 below the baseline.
+    assert text.bounds == (10, 41, 60, 12)
+    assert widget.objects_at(20, 52) == [text]
+    assert widget.objects_at(20, 54) == []
+
+
+def test_text_bounds_without_metrics(widget, monkeypatch):
+    """If the backend can't provide the ascent of a font, the bounds of text on an
+    alphabetic baseline are extended by a line, so they still include any
+    descenders."""
+    monkeypatch.delattr(type(widget._impl), "text_ascent")
+    text = widget.context.write_text("Hello", 10, 50)
+    assert text.bounds == (10, 38, 60, 24)
+    assert widget.objects_at(20, 52) == [text]
+
+
+def test_detached_bounds(widget):
+    """An object that isn't part of a canvas has no bounds."""
+    assert Rect(10, 20, 30, 40).bounds is None
+
+    rect = widget.context.rect(10, 20, 30, 40)
+    assert rect.bounds == (10, 20, 30, 40)
+
+    widget.context.remove(rect)
+    assert rect.bounds is None
+
+
+def test_modified_bounds(widget):
+    """Bounds are updated when an object is modified."""
+    rect = widget.context.rect(10, 20, 30, 40)
+    assert rect.bounds == (10, 20, 30, 40)
+    assert widget.objects_at(15, 25) == [rect]
+
+    rect.x = 100
+    assert rect.bounds == (100, 20, 30, 40)
+    assert widget.objects_at(15, 25) == []
+    assert widget.objects_at(115, 25) == [rect]
+
+
+def test_incremental_bounds(widget):
+    """When a context is modified, only that context is measured again."""
+    with widget.Fill() as first:
+        first.write_text("First", 0, 20)
+        rect = first.rect(0, 0, 10, 10)
+    with widget.Fill() as second:
+        second.write_text("Second", 100, 20)
+    assert first.bounds == (0, 0, 60, 23)
+    index = second._index
+
+    with patch.object(widget, "measure_text", wraps=widget.measure_text) as measure:
+        rect.x = 50
+        assert rect.bounds == (50, 0, 10, 10)
+        assert widget.objects_at(55, 5) == [rect, first]
+
+    # The text in the second context wasn't measured again.
+    measure.assert_called_once()
+    assert second._index is index
+    assert second.bounds == (100, 11, 72, 12)
+
+
+def test_incremental_bounds_state(widget):
+    """An unmodified context is measured again if the state it is drawn in changes."""
+    translate = widget.context.translate(10, 10)
+    with widget.Context() as context:
+        rect = context.rect(0, 0, 10, 10)
+    assert rect.bounds == (10, 10, 10, 10)
+
+    translate.tx = 100
+    assert rect.bounds == (100, 10, 10, 10)
+    assert context.bounds == (100, 10, 10, 10)
+    assert widget.objects_at(105, 15) == [rect, context]
+    assert widget.objects_at(15, 15) == []
+
+    # A plain context continues the path that precedes it, so it is measured again
+    # if that path changes.
+    widget.context.reset_transform()
+    widget.context.begin_path()
+    widget.context.move_to(0, 0)
+    line = widget.context.line_to(10, 10)
+    with widget.Context() as fill_context:
+        fill_context.fill()
+    assert fill_context.bounds == (0, 0, 10, 10)
+
+    line.x = 50
+    assert fill_context.bounds == (0, 0, 50, 10)
+
+
+def test_context_property_bounds(widget):
+    """Modifying a property of a context updates its bounds."""
+    with widget.Stroke(line_width=2) as stroke:
+        stroke.rect(10, 10, 10, 10)
+    assert stroke.bounds == (9, 9, 12, 12)
+
+    stroke.line_width = 10
+    assert stroke.bounds == (5, 5, 20, 20)
+
+
+def test_objects_at(widget):
+    """Objects at a point are returned from topmost to bottommost."""
+    with widget.Fill(color="red") as first:
+        first_rect = first.rect(0, 0, 100, 100)
+    with widget.Fill(color="blue") as second:
+        second_rect = second.rect(50, 50, 100, 100)
+
+    assert widget.objects_at(75, 75) == [second_rect, second, first_rect, first]
+    assert widget.objects_at(10, 10) == [first_rect, first]
+    # Edges are included.
+    assert widget.objects_at(150, 150) == [second_rect, second]
+    assert widget.objects_at(500, 500) == []
+
+    # The index is reused until the canvas is modified.
+    index = widget.context._index
+    widget.objects_at(10, 10)
+    assert widget.context._index is index
+
+
+def test_objects_in(widget):
+    """Objects intersecting a rectangle can be found."""
+    first = widget.context.rect(0, 0, 10, 10)
+    second = widget.context.rect(100, 100, 10, 10)
+    # A large object is indexed separately from the grid.
+    large = widget.context.rect(-1000, -1000, 2000, 2000)
+
+    assert widget.objects_in(90, 90, 20, 20) == [large, second]
+    assert widget.objects_in(5, 5, 100, 100) == [large, second, first]
+    assert widget.objects_in(2000, 2000, 10, 10) == []
+    # A rectangle that covers more cells than there are objects checks every object.
+    assert widget.objects_in(-10_000, -10_000, 20_000, 20_000) == [
+        large,
+        second,
+        first,
+    ]
+
+
+def test_clip(widget):
+    """Self-contained objects outside the clip region aren't drawn."""
+    with widget.Fill(color="red") as first:
+        first.rect(0, 0, 10, 10)
+    with widget.Stroke(color="blue") as second:
+        second.rect(100, 100, 10, 10)
+
+    widget.redraw()
+    everything = widget._impl.draw_instructions
+
+    draw_instructions = []
+    widget.context._draw(
+        widget._impl, clip=(0, 0, 1000, 1000), draw_instructions=draw_instructions
+    )
+    assert draw_instructions == everything
+
+    # The second context is replaced by an operation that resets the path.
+    draw_instructions = []
+    widget.context._draw(
+        widget._impl, clip=(0, 0, 50, 50), draw_instructions=draw_instructions
+    )
+    assert draw_instructions == everything[:6] + [
+        ("begin path", {}),
+        ("pop context", {}),
+    ]
+
+    # Contexts that aren't self-contained are always drawn.
+    widget.context.clear()
+    widget.context.rect(100, 100, 10, 10)
+    widget.context.fill()
+    draw_instructions = []
+    widget.context._draw(
+        widget._impl, clip=(0, 0, 50, 50), draw_instructions=draw_instructions
+    )
+    assert len(draw_instructions) == 4
+
+
+def test_clip_cached(widget):
+    """Cached contexts outside the clip region aren't rendered."""
+    with widget.Context(cached=True) as layer:
+        layer.rect(100, 100, 10, 10)
+        layer.fill()
+
+    draw_instructions = []
+    widget.context._draw(
+        widget._impl, clip=(0, 0, 50, 50), draw_instructions=draw_instructions
+    )
+    assert draw_instructions == [("push context", {}), ("pop context", {})]
+
+    draw_instructions = []
+    widget.context._draw(
+        widget._impl, clip=(0, 0, 500, 500), draw_instructions=draw_instructions
+    )
+    assert len(draw_instructions) == 6
+
+    # A cached root context is also skipped if it is outside the clip region.
+    widget.context.cached = True
+    draw_instructions = []
+    widget.context._draw(
+        widget._impl, clip=(0, 0, 50, 50), draw_instructions=draw_instructions
+    )
+    assert draw_instructions == []
@@ -1,10 +1,23 @@
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import PIL.Image
 import pytest
 
 import toga
 from toga.colors import rgb
 from toga.constants import Baseline, FillRule
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE, Font
-from toga.widgets.canvas import ClosedPathContext, Context, FillContext, StrokeContext
+from toga.images import PixelBuffer
+from toga.widgets import canvas as canvas_module
+from toga.widgets.canvas import (
+    ClosedPathContext,
+    Context,
+    FillContext,
+    Rect,
+    StrokeContext,
+)
 from toga_dummy.utils import assert_action_not_performed, assert_action_performed
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
@@ -76,11 +89,16 @@ def test_focus_noop(widget):
     assert_action_not_performed(widget, "focus")
 
 
-def test_redraw(widget):
-    """The canvas can be redrawn."""
+async def test_redraw(widget):
+    """A redraw of the canvas is performed on the next iteration of the event loop."""
     widget.redraw()
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
+    assert widget._impl.redraw_count == 0
+
+    await asyncio.sleep(0)
+    assert not widget._dirty
+    assert widget._impl.redraw_count == 1
 
     # An empty canvas has 2 draw operations - pushing and popping the root context.
     assert widget._impl.draw_instructions == [
@@ -89,6 +107,149 @@ def test_redraw(widget):
     ]
 
 
+async def test_redraw_coalesced(widget):
+    """Any number of changes made before the next iteration of the event loop only
+    redraw the canvas once."""
+    with widget.Stroke() as stroke:
+        for i in range(1000):
+            stroke.line_to(i, i)
+    widget.redraw()
+    assert widget._impl.redraw_count == 0
+
+    await asyncio.sleep(0)
+    assert widget._impl.redraw_count == 1
+    assert len(widget._impl.draw_instructions) == 1006
+
+    # If nothing changes, there is no redraw.
+    await asyncio.sleep(0)
+    assert widget._impl.redraw_count == 1
+
+    # A subsequent change causes another redraw.
+    widget.context.rect(10, 20, 30, 40)
+    await asyncio.sleep(0)
+    assert widget._impl.redraw_count == 2
+
+
+def test_batch_redraw(widget):
+    """Redraws requested during a batch are coalesced into a single redraw, which is
+    performed when the batch exits."""
+    with widget.batch_redraw():
+        with widget.Stroke() as stroke:
+            for i in range(1000):
+                stroke.line_to(i, i)
+
+        # Batches can be nested
+        with widget.batch_redraw():
+            widget.redraw()
+            widget.context.rect(10, 20, 30, 40)
+
+        assert widget._impl.redraw_count == 0
+
+    # Exactly one redraw was performed, which drew all the changes.
+    assert not widget._dirty
+    assert widget._impl.redraw_count == 1
+    assert len(widget._impl.draw_instructions) == 1007
+
+    # If nothing changes during a batch, there is no redraw.
+    with widget.batch_redraw():
+        pass
+    assert widget._impl.redraw_count == 1
+
+
+async def test_batch_redraw_event_loop(widget):
+    """A redraw isn't performed while a batch is open, even if the event loop runs."""
+    widget.redraw()
+    with widget.batch_redraw():
+        widget.context.rect(10, 20, 30, 40)
+        await asyncio.sleep(0)
+        assert widget._impl.redraw_count == 0
+
+    assert widget._impl.redraw_count == 1
+
+    # The redraw that was scheduled before the batch has already been performed.
+    await asyncio.sleep(0)
+    assert widget._impl.redraw_count == 1
+
+
+def test_batch_redraw_exception(widget):
+    """If a batch is exited with an exception, the pending redraw is performed."""
+    with pytest.raises(RuntimeError, match=r"Oops"):
+        with widget.batch_redraw():
+            widget.context.rect(10, 20, 30, 40)
+            raise RuntimeError("Oops")
+
+    assert not widget._dirty
+    assert widget._impl.redraw_count == 1
+
+    # Subsequent redraws are no longer part of the batch.
+    widget.redraw()
+    assert widget._dirty
+    assert widget._redraw_depth == 0
+
+
+def test_compiled_instructions(widget):
+    """The drawing objects are compiled into instructions that are reused."""
+    with widget.Fill(color="red") as fill:
+        rect = fill.rect(10, 20, 30, 40)
+    widget._impl.simulate_paint()
+    compiled = widget.context._compiled[2]
+    # The fill context is compiled as a group of instructions, which is preceded by a
+    # header that allows the group to be skipped.
+    assert len(compiled) == 8
+    assert compiled[1][0] is None
+
+    # Redrawing without changes reuses the same instructions, without traversing the
+    # drawing objects.
+    with patch.object(Rect, "_compile") as compile:
+        widget._impl.simulate_paint()
+    compile.assert_not_called()
+    assert widget.context._compiled[2] is compiled
+
+    # Modifying a drawing object recompiles the instructions.
+    rect.width = 50
+    widget._impl.simulate_paint()
+    assert widget.context._compiled[2] is not compiled
+    assert widget._impl.draw_instructions[3] == (
+        "rect",
+        {
+            "x": 10,
+            "y": 20,
+            "width": 50,
+            "height": 40,
+            "fill_color": rgb(255, 0, 0),
+            "fill_rule": FillRule.NONZERO,
+        },
+    )
+
+
+def test_redraw_reuses_compiled(widget):
+    """Redrawing a complex drawing replays the compiled instructions, without
+    compiling any drawing object again."""
+    with widget.batch_redraw():
+        for i in range(5):
+            with widget.Fill(color="red") as fill:
+                with fill.Stroke(color="blue") as stroke:
+                    for j in range(10):
+                        stroke.line_to(i, j)
+
+    draw_instructions = widget._impl.draw_instructions
+    compiled = widget.context._compiled
+
+    # Every method that compiles a drawing object fails if it is invoked.
+    with ExitStack() as stack:
+        for cls in vars(canvas_module).values():
+            if isinstance(cls, type):
+                for name in ["_compile", "_compile_layer"]:
+                    if name in vars(cls):
+                        compile = stack.enter_context(patch.object(cls, name))
+                        compile.side_effect = AssertionError(f"{cls.__name__} compiled")
+
+        widget._impl.simulate_paint()
+
+    assert widget.context._compiled is compiled
+    assert widget._impl.draw_instructions == draw_instructions
+
+
 def test_subcontext(widget):
     """A canvas can produce a subcontext."""
     with widget.Context() as subcontext:
@@ -156,9 +317,40 @@ def test_measure_text(widget, font, expected):
 def test_as_image(widget):
     """A rendered canvas can be retrieved as an image."""
     image = widget.as_image()
-    assert image is not None
+    assert isinstance(image, toga.Image)
+    assert image.size == (32, 32)
+    # The rendered pixels are used directly, without an intermediate image encoding.
+    assert_action_performed(widget, "get image pixels")
+    assert_action_not_performed(widget, "get image data")
+
+
+def test_as_image_format(widget):
+    """A rendered canvas can be retrieved in other formats."""
+    image = widget.as_image(PIL.Image.Image)
+    assert isinstance(image, PIL.Image.Image)
+    assert image.size == (32, 32)
+
+
+def test_as_image_pixels(widget):
+    """The raw pixels of a rendered canvas can be retrieved."""
+    pixels = widget.as_image(PixelBuffer)
+    assert isinstance(pixels, PixelBuffer)
+    assert pixels.size == (32, 32)
+    assert_action_performed(widget, "get image pixels")
+
+
+def test_as_image_pixels_unsupported(widget, monkeypatch):
+    """If the backend can't provide raw pixels, the encoded image data is used."""
+    monkeypatch.delattr(type(widget._impl), "get_image_pixels")
+
+    image = widget.as_image()
+    assert image.size == (32, 32)
     assert_action_performed(widget, "get image data")
 
+    pixels = widget.as_image(PixelBuffer)
+    assert isinstance(pixels, PixelBuffer)
+    assert pixels.size == (32, 32)
+
 
 def test_deprecated_drawing_operations(widget):
     """Deprecated simple drawing operations raise a warning."""
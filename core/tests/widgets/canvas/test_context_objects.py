@@ -1,3 +1,5 @@
+from unittest.mock import Mock, call
+
 import pytest
 
 from toga.colors import REBECCAPURPLE, rgb
@@ -9,7 +11,11 @@ from toga.widgets.canvas import (
     LineTo,
     StrokeContext,
 )
-from toga_dummy.utils import assert_action_performed
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed_with,
+)
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
 
@@ -22,7 +28,7 @@ def test_subcontext(widget):
     assert isinstance(subcontext, Context)
     assert subcontext != widget.context
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(subcontext) == "Context()"
 
     # The first and last instructions can be ignored; they're the root canvas context
@@ -33,6 +39,161 @@ def test_subcontext(widget):
     ]
 
 
+def layer_renders(widget):
+    try:
+        return len(EventLog.performed_actions(widget, "render layer"))
+    except AttributeError:
+        return 0
+
+
+def test_cached_subcontext(widget):
+    """A cached subcontext is only rendered when its content changes."""
+    with widget.context.Context(cached=True) as layer:
+        line = layer.line_to(30, 40)
+        with layer.Context() as inner:
+            inner.rect(1, 2, 3, 4)
+    widget.context.line_to(50, 60)
+
+    assert layer.cached
+    assert not inner.cached
+
+    expected = [
+        ("push context", {}),
+        ("line to", {"x": 30, "y": 40}),
+        ("push context", {}),
+        ("rect", {"x": 1, "y": 2, "width": 3, "height": 4}),
+        ("pop context", {}),
+        ("pop context", {}),
+    ]
+    # The first and last instructions can be ignored; they're the root canvas context
+    assert widget._impl.draw_instructions[1:-2] == expected
+    assert_action_performed_with(widget, "render layer", layer=layer)
+
+    # Changes outside the cached context don't cause it to be rendered again.
+    EventLog.reset()
+    widget.context.line_to(70, 80)
+    widget.redraw()
+    assert widget._impl.draw_instructions[1:-3] == expected
+    assert_action_not_performed(widget, "render layer")
+
+    # Modifying a property of an object in the context renders it again.
+    line.x = 35
+    widget.redraw()
+    assert widget._impl.draw_instructions[2] == ("line to", {"x": 35, "y": 40})
+    assert layer_renders(widget) == 1
+
+    # ... as does modifying an object in a nested context ...
+    EventLog.reset()
+    inner[0].width = 10
+    widget.redraw()
+    assert widget._impl.draw_instructions[4] == (
+        "rect",
+        {"x": 1, "y": 2, "width": 10, "height": 4},
+    )
+    assert layer_renders(widget) == 1
+
+    # ... or removing an object from a nested context.
+    EventLog.reset()
+    inner.clear()
+    assert widget._impl.draw_instructions[1:5] == [
+        ("push context", {}),
+        ("line to", {"x": 35, "y": 40}),
+        ("push context", {}),
+        ("pop context", {}),
+    ]
+    assert layer_renders(widget) == 1
+
+    # Once the layer has been removed from the canvas, the cached rendering is
+    # discarded.
+    widget.context.remove(layer)
+    assert layer._parent is None
+    widget._impl.simulate_paint()
+    assert widget._impl._layers == {}
+
+    # Modifying an object that has been removed doesn't affect the canvas.
+    version = widget.context._version
+    line.x = 40
+    layer.remove(line)
+    assert line._parent is None
+    line.y = 50
+    assert widget.context._version == version
+
+
+def test_shared_object(widget):
+    """An object that is in multiple contexts is tracked by the most recent one."""
+    line = LineTo(10, 20)
+    with widget.context.Context() as first:
+        first.append(line)
+    with widget.context.Context() as second:
+        second.append(line)
+
+    first.remove(line)
+    assert line._parent is second
+    first.append(line)
+    second.clear()
+    assert line._parent is first
+
+
+def test_cached_subcontext_arguments(widget):
+    """A cached subcontext is rendered again if the arguments it inherits change."""
+    with widget.context.Fill(color="red") as fill:
+        with fill.Context(cached=True) as layer:
+            layer.write_text("Hello", 10, 20)
+
+    widget._impl.simulate_paint()
+    assert_action_performed_with(widget, "render layer", layer=layer)
+    EventLog.reset()
+    widget._impl.simulate_paint()
+    assert_action_not_performed(widget, "render layer")
+
+    fill.color = "blue"
+    widget.redraw()
+    assert widget._dirty
+    assert widget._impl.draw_instructions[4][1]["fill_color"] == rgb(0, 0, 255)
+    assert layer_renders(widget) == 1
+
+
+def test_toggle_cached(widget):
+    """A context can be cached after it has been created."""
+    with widget.context.Context() as subcontext:
+        subcontext.line_to(30, 40)
+    assert_action_not_performed(widget, "render layer")
+
+    subcontext.cached = True
+    widget._impl.simulate_paint()
+    assert_action_performed_with(widget, "render layer", layer=subcontext)
+
+
+def test_cached_root(widget):
+    """The root context of a canvas can be cached."""
+    widget.context.line_to(10, 20)
+    widget.context.cached = True
+    widget._impl.simulate_paint()
+    assert_action_performed_with(widget, "render layer", layer=widget.context)
+
+    EventLog.reset()
+    assert widget._impl.draw_instructions == [
+        ("push context", {}),
+        ("line to", {"x": 10, "y": 20}),
+        ("pop context", {}),
+    ]
+    assert_action_not_performed(widget, "render layer")
+
+
+def test_cached_unsupported():
+    """If a backend doesn't support caching, a cached context is drawn directly."""
+    impl = Mock(spec=["push_context", "line_to", "pop_context"])
+    context = Context(canvas=None, cached=True)
+    context.drawing_objects.append(LineTo(10, 20))
+
+    context._draw(impl, extra=1)
+    assert impl.mock_calls == [
+        call.push_context(extra=1),
+        call.line_to(10, 20, extra=1),
+        call.pop_context(extra=1),
+    ]
+
+
 @pytest.mark.parametrize(
     "kwargs, args_repr, has_move, properties",
     [
@@ -75,7 +236,7 @@ def test_closed_path(widget, kwargs, args_repr, has_move, properties):
     assert isinstance(closed_path, ClosedPathContext)
     assert repr(closed_path) == f"ClosedPathContext({args_repr})"
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
 
     # All the attributes can be retrieved.
     for attr, value in properties.items():
@@ -1,9 +1,10 @@
+from array import array
+
 import pytest
 
 from toga.colors import REBECCAPURPLE, rgb
 from toga.constants import Baseline, FillRule
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE, Font
-from toga_dummy.utils import assert_action_performed
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
 
@@ -12,7 +13,7 @@ def test_begin_path(widget):
     """A begin path operation can be added."""
     draw_op = widget.context.begin_path()
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "BeginPath()"
 
     # The first and last instructions can be ignored as they are the
@@ -25,7 +26,7 @@ def test_close_path(widget):
     """A close path operation can be added."""
     draw_op = widget.context.close_path()
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "ClosePath()"
 
     # The first and last instructions can be ignored as they are the
@@ -91,7 +92,7 @@ def test_fill(widget, kwargs, args_repr, draw_kwargs):
     """A primitive fill operation can be added."""
     draw_op = widget.context.fill(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == f"Fill({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -161,7 +162,7 @@ def test_stroke(widget, kwargs, args_repr, draw_kwargs):
     """A primitive stroke operation can be added."""
     draw_op = widget.context.stroke(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == f"Stroke({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -178,7 +179,7 @@ def test_move_to(widget):
     """A move to operation can be added."""
     draw_op = widget.context.move_to(10, 20)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "MoveTo(x=10, y=20)"
 
     # The first and last instructions can be ignored as they are the
@@ -195,7 +196,7 @@ def test_line_to(widget):
     """A line to operation can be added."""
     draw_op = widget.context.line_to(10, 20)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "LineTo(x=10, y=20)"
 
     # The first and last instructions can be ignored as they are the
@@ -212,7 +213,7 @@ def test_bezier_curve_to(widget):
     """A Bézier curve to operation can be added."""
     draw_op = widget.context.bezier_curve_to(10, 20, 30, 40, 50, 60)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert (
         repr(draw_op) == "BezierCurveTo(cp1x=10, cp1y=20, cp2x=30, cp2y=40, x=50, y=60)"
     )
@@ -238,7 +239,7 @@ def test_quadratic_curve_to(widget):
     """A Quadratic curve to operation can be added."""
     draw_op = widget.context.quadratic_curve_to(10, 20, 30, 40)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "QuadraticCurveTo(cpx=10, cpy=20, x=30, y=40)"
 
     # The first and last instructions can be ignored as they are the
@@ -383,7 +384,7 @@ def test_arc(widget, kwargs, args_repr, draw_kwargs):
     """An arc operation can be added."""
     draw_op = widget.context.arc(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == f"Arc({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -540,7 +541,7 @@ def test_ellipse(widget, kwargs, args_repr, draw_kwargs):
     """An ellipse operation can be added."""
     draw_op = widget.context.ellipse(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == f"Ellipse({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -557,7 +558,7 @@ def test_rect(widget):
     """A rect operation can be added."""
     draw_op = widget.context.rect(10, 20, 30, 40)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "Rect(x=10, y=20, width=30, height=40)"
 
     # The first and last instructions can be ignored as they are the
@@ -572,6 +573,75 @@ def test_rect(widget):
     assert draw_op.height == 40
 
 
+@pytest.mark.parametrize(
+    "points",
+    [
+        # Flat sequence
+        [10, 20, 30, 40, 50, 60],
+        (10.0, 20.0, 30.0, 40.0, 50.0, 60.0),
+        # Sequence of pairs
+        [(10, 20), (30, 40), (50, 60)],
+        # Iterator
+        iter([10, 20, 30, 40, 50, 60]),
+        # Buffers in the native format, and in other formats
+        array("d", [10, 20, 30, 40, 50, 60]),
+        array("f", [10, 20, 30, 40, 50, 60]),
+        array("i", [10, 20, 30, 40, 50, 60]),
+        # Multi-dimensional buffer
+        memoryview(array("d", [10, 20, 30, 40, 50, 60]))
+        .cast("B")
+        .cast("d", shape=[3, 2]),
+        # Non-contiguous buffer
+        memoryview(array("d", [10, 0, 20, 0, 30, 0, 40, 0, 50, 0, 60, 0]))[::2],
+    ],
+)
+def test_polyline(widget, points):
+    """A polyline operation can be added."""
+    draw_op = widget.context.polyline(points)
+
+    assert widget._dirty
+    assert repr(draw_op) == "Polyline(points=<3 points>, closed=False)"
+
+    expected = array("d", [10, 20, 30, 40, 50, 60])
+    # The first and last instructions can be ignored as they are the
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("polyline", {"points": expected, "closed": False}),
+    ]
+
+    # All the attributes can be retrieved.
+    assert draw_op.points == expected
+    assert not draw_op.closed
+
+
+def test_polyline_closed(widget):
+    """A closed polyline operation can be added, and its points modified."""
+    draw_op = widget.context.polyline([], closed=True)
+    assert repr(draw_op) == "Polyline(points=<0 points>, closed=True)"
+
+    draw_op.points = [(1, 2), (3, 4)]
+    widget.redraw()
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("polyline", {"points": array("d", [1, 2, 3, 4]), "closed": True}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [10, 20, 30],
+        array("d", [10, 20, 30]),
+        [(10, 20), (30,)],
+    ],
+)
+def test_polyline_odd(widget, points):
+    """A polyline must have an even number of coordinates."""
+    with pytest.raises(
+        ValueError,
+        match=r"points must contain an even number of coordinates",
+    ):
+        widget.context.polyline(points)
+
+
 @pytest.mark.parametrize(
     "kwargs, args_repr, draw_kwargs",
     [
@@ -620,7 +690,7 @@ def test_write_text(widget, kwargs, args_repr, draw_kwargs):
     """A write text operation can be added."""
     draw_op = widget.context.write_text(**kwargs)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == f"WriteText({args_repr})"
 
     # The first and last instructions can be ignored as they are the
@@ -640,7 +710,7 @@ def test_rotate(widget):
     """A rotate operation can be added."""
     draw_op = widget.context.rotate(1.234)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "Rotate(radians=1.234)"
 
     # The first and last instructions can be ignored as they are the
@@ -656,7 +726,7 @@ def test_scale(widget):
     """A scale operation can be added."""
     draw_op = widget.context.scale(1.234, 2.345)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "Scale(sx=1.234, sy=2.345)"
 
     # The first and last instructions can be ignored as they are the
@@ -673,7 +743,7 @@ def test_translate(widget):
     """A translate operation can be added."""
     draw_op = widget.context.translate(10, 20)
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "Translate(tx=10, ty=20)"
 
     # The first and last instructions can be ignored as they are the
@@ -690,7 +760,7 @@ def test_reset_transform(widget):
     """A reset transform operation can be added."""
     draw_op = widget.context.reset_transform()
 
-    assert_action_performed(widget, "redraw")
+    assert widget._dirty
     assert repr(draw_op) == "ResetTransform()"
 
     # The first and last instructions can be ignored as they are the
@@ -1226,6 +1226,105 @@ def test_refresh_child(widget):
     assert_action_performed(widget, "refresh")
 
 
+def test_batch_refresh(app, widget):
+    """Refreshes within a batch are deferred until the end of the batch."""
+    window = toga.Window()
+    window.content = widget
+    children = [ExampleLeafWidget() for _ in range(10)]
+    EventLog.reset()
+
+    with widget.batch_refresh():
+        for child in children:
+            widget.add(child)
+        children[3].style.width = 50
+        widget.remove(children[0])
+
+        # No refresh has been performed yet.
+        assert_action_not_performed(widget, "refresh")
+        assert_action_not_performed(children[3], "refresh")
+        assert_action_not_performed(widget, "layout refreshed")
+
+    # Every widget that requested a refresh has been refreshed...
+    assert len(EventLog.performed_actions(widget, "refresh")) == 2
+    assert len(EventLog.performed_actions(children[3], "refresh")) == 1
+
+    # ... but the layout was only computed once.
+    assert len(EventLog.performed_actions(widget, "layout refreshed")) == 1
+    assert widget.children == children[1:]
+    assert children[3].layout.content_width == 50
+
+
+def test_batch_refresh_nested(app, widget):
+    """Nested batches only refresh when the outermost batch exits."""
+    window = toga.Window()
+    window.content = widget
+    child = ExampleWidget()
+    widget.add(child)
+    EventLog.reset()
+
+    with widget.batch_refresh():
+        with child.batch_refresh():
+            child.add(ExampleLeafWidget())
+            with child.batch_refresh():
+                child.add(ExampleLeafWidget())
+            child.add(ExampleLeafWidget())
+
+        # The inner batch has exited; but the refresh has been deferred to the outer
+        # batch.
+        assert_action_not_performed(widget, "layout refreshed")
+
+        widget.add(ExampleLeafWidget())
+
+    assert len(EventLog.performed_actions(widget, "layout refreshed")) == 1
+
+
+def test_batch_refresh_exception(app, widget):
+    """Deferred refreshes are performed even if the batch raises an exception."""
+    window = toga.Window()
+    window.content = widget
+    EventLog.reset()
+
+    with pytest.raises(RuntimeError, match=r"Oops"):
+        with widget.batch_refresh():
+            widget.add(ExampleLeafWidget())
+            raise RuntimeError("Oops")
+
+    assert len(EventLog.performed_actions(widget, "layout refreshed")) == 1
+    assert widget._refresh_batch is None
+
+
+def test_batch_refresh_unrelated(app, widget):
+    """A widget batch doesn't defer refreshes of widgets outside the batch."""
+    window = toga.Window()
+    window.content = widget
+    other = ExampleWidget()
+    EventLog.reset()
+
+    with other.batch_refresh():
+        widget.add(ExampleLeafWidget())
+        assert_action_performed(widget, "layout refreshed")
+
+
+@pytest.mark.parametrize("owner", ["window", "app"])
+def test_batch_refresh_window_app(app, widget, owner):
+    """Refreshes can be deferred for all widgets in a window or an app."""
+    window = toga.Window()
+    window.content = widget
+    child1 = ExampleWidget()
+    child2 = ExampleWidget()
+    widget.add(child1, child2)
+    EventLog.reset()
+
+    with {"window": window, "app": app}[owner].batch_refresh():
+        child1.add(ExampleLeafWidget())
+        child2.add(ExampleLeafWidget())
+        child2.style.margin = 10
+        assert_action_not_performed(widget, "layout refreshed")
+
+    assert len(EventLog.performed_actions(widget, "layout refreshed")) == 1
+    assert len(EventLog.performed_actions(child2, "refresh")) == 1
+
+
 def test_focus(widget):
     """A widget can be given focus."""
     widget.focus()
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from unittest.mock import ANY
 
@@ -9,6 +10,7 @@ import toga
 from toga.style.pack import Pack
 from toga.widgets.imageview import rehint_imageview
 from toga_dummy.utils import (
+    EventLog,
     assert_action_not_performed,
     assert_action_performed,
     assert_action_performed_with,
@@ -200,3 +202,100 @@ def test_as_image_pil():
     pil_img = imageview.as_image(PIL.Image.Image)
     assert isinstance(pil_img, PIL.Image.Image)
     assert pil_img.size == (32, 32)
+
+
+def test_placeholder(app):
+    """An ImageView can have a placeholder image."""
+    imageview = toga.ImageView(placeholder=ABSOLUTE_FILE_PATH)
+    assert isinstance(imageview.placeholder, toga.Image)
+    assert imageview.placeholder.size == (32, 32)
+    # The placeholder isn't displayed unless an image is loading.
+    assert imageview.image is None
+
+    imageview.placeholder = None
+    assert imageview.placeholder is None
+    assert imageview.image is None
+
+
+async def test_load(app):
+    """An image can be loaded in the background, with a placeholder displayed until
+    it has loaded."""
+    placeholder = toga.Image(ABSOLUTE_FILE_PATH)
+    imageview = toga.ImageView(placeholder=placeholder)
+    EventLog.reset()
+
+    future = imageview.load(ABSOLUTE_FILE_PATH)
+    assert imageview.image is placeholder
+    assert_action_performed_with(imageview, "set image", image=placeholder)
+
+    # Changing the placeholder while the image is loading displays the new
+    # placeholder.
+    imageview.placeholder = None
+    assert imageview.image is None
+
+    image = await future
+    assert isinstance(image, toga.Image)
+    assert imageview.image is image
+    assert_action_performed_with(imageview, "set image", image=image)
+
+    # Once the image has loaded, changing the placeholder has no effect.
+    imageview.placeholder = placeholder
+    assert imageview.image is image
+
+
+async def test_load_superseded(app):
+    """If an image is assigned while an image is loading, the loaded image isn't
+    displayed."""
+    imageview = toga.ImageView()
+    other = toga.Image(ABSOLUTE_FILE_PATH)
+
+    future = imageview.load(ABSOLUTE_FILE_PATH)
+    imageview.image = other
+    await future
+    assert imageview.image is other
+
+    # The same is true if another image is loaded.
+    first = imageview.load(ABSOLUTE_FILE_PATH)
+    second = imageview.load(other)
+    first_image = await first
+    second_image = await second
+    assert imageview.image is second_image
+    assert imageview.image is not first_image
+
+
+async def test_load_failure(app, capsys):
+    """If an image can't be loaded, the placeholder is removed, and the error is
+    reported and raised by the future."""
+    placeholder = toga.Image(ABSOLUTE_FILE_PATH)
+    imageview = toga.ImageView(placeholder=placeholder)
+
+    with pytest.raises(FileNotFoundError):
+        await imageview.load(Path("does/not/exist.png"))
+    assert imageview.image is None
+    assert "Error loading image: Image file" in capsys.readouterr().err
+
+    # The error is reported even if the future isn't awaited.
+    future = imageview.load(Path("does/not/exist.png"))
+    await asyncio.wait([future])
+    assert imageview.image is None
+    assert "FileNotFoundError: Image file" in capsys.readouterr().err
+
+
+async def test_load_failure_superseded(app, capsys):
+    """If a superseded load fails, the current image is retained."""
+    imageview = toga.ImageView()
+    other = toga.Image(ABSOLUTE_FILE_PATH)
+
+    future = imageview.load(Path("does/not/exist.png"))
+    imageview.image = other
+    await asyncio.wait([future])
+    assert imageview.image is other
+
+
+async def test_load_cancelled(app, capsys):
+    """A load can be cancelled."""
+    imageview = toga.ImageView()
+    future = imageview.load(ABSOLUTE_FILE_PATH)
+    future.cancel()
+    await asyncio.wait([future])
+    assert capsys.readouterr().err == ""
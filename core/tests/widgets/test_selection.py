@@ -285,6 +285,22 @@ def test_insert_item(widget, source, on_change_handler):
     assert widget.value == selection
 
 
+def test_extend(widget, source, on_change_handler):
+    """Multiple rows can be added to the source."""
+    # Store the original selection
+    selection = widget.value
+
+    source.extend([dict(key="new", value=998), dict(key="newer", value=999)])
+
+    # The widget adds each item
+    assert_action_performed_with(widget, "insert item", index=3)
+    assert_action_performed_with(widget, "insert item", index=4)
+
+    # This doesn't change the widget
+    on_change_handler.assert_not_called()
+    assert widget.value == selection
+
+
 def test_remove(widget, source, on_change_handler):
     """If you remove an item that isn't selected, no change is generated."""
     # Store the original selection
@@ -217,6 +217,17 @@ def test_set_data(table, on_select_handler, data, all_attributes, extra_attribut
         assert table.data[2].extra == "extra3"
 
 
+def test_bulk_changes(table, source):
+    """Bulk changes to the data are passed to the backend as single notifications."""
+    rows = source.extend([("fourth", 444), ("fifth", 555)])
+    assert_action_performed_with(table, "insert rows", index=3, items=rows)
+    assert_action_not_performed(table, "insert row")
+
+    source.sort(key=lambda row: row.value, reverse=True)
+    assert_action_performed(table, "reset")
+    assert table.data[0].key == "fifth"
+
+
 def test_single_selection(table, on_select_handler):
     """The current selection can be retrieved."""
     # Selection is initially empty
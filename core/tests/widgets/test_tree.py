@@ -3,7 +3,7 @@ from unittest.mock import Mock
 import pytest
 
 import toga
-from toga.sources import TreeSource
+from toga.sources import LazyChildren, TreeSource
 from toga_dummy.utils import (
     assert_action_not_performed,
     assert_action_performed,
@@ -330,6 +330,26 @@ def test_expand_collapse(tree):
     assert_action_performed_with(tree, "collapse all")
 
 
+def test_expand_lazy(tree):
+    """Expanding a node loads any children that haven't been loaded."""
+    loader = Mock(return_value=[({"key": "loaded", "value": 1}, None)])
+    node = tree.data[0].append(
+        {"key": "lazy", "value": 0}, children=LazyChildren(loader)
+    )
+    assert not node.loaded
+
+    tree.expand(node)
+    assert_action_performed_with(tree, "expand node", node=node)
+    loader.assert_called_once_with(node)
+    assert_action_performed_with(tree, "insert node", parent=node, item=node[0])
+    assert_action_performed_with(tree, "change node", item=node)
+    assert node[0].key == "loaded"
+
+    # Expanding again doesn't reload the children.
+    tree.expand(node)
+    loader.assert_called_once_with(node)
+
+
 def test_activation(tree, on_activate_handler):
     """A row can be activated."""
 
@@ -5,6 +5,7 @@ import pytest
 
 import toga
 from toga.constants import WindowState
+from toga.images import PixelBuffer
 from toga_dummy.utils import (
     EventLog,
     assert_action_not_performed,
@@ -587,11 +588,19 @@ def test_close_rejected_handler(window, app):
 def test_as_image(window):
     """A window can be captured as an image."""
     image = window.as_image()
-    assert_action_performed(window, "get image data")
+    # The captured pixels are used directly, without an intermediate image encoding.
+    assert_action_performed(window, "get image pixels")
     # Don't need to check the raw data; just check it's the right size.
     assert image.size == (318, 346)
 
 
+def test_as_image_pixels(window):
+    """The raw pixels of a window can be captured."""
+    pixels = window.as_image(PixelBuffer)
+    assert isinstance(pixels, PixelBuffer)
+    assert pixels.size == (318, 346)
+
+
 def test_screen(window, app):
     """A window can be moved to a different screen."""
     # Cannot actually change window.screen, so just check
@@ -6,6 +6,9 @@ from typing import TYPE_CHECKING
 
 import PIL.Image
 
+from toga.images import PixelBuffer
+from toga.plugins.image_formats import RAW_MODES
+
 from .utils import LoggedObject
 
 if TYPE_CHECKING:
@@ -35,6 +38,7 @@ class Image(LoggedObject):
         path: Path = None,
         data: bytes = None,
         raw: BytesIO = None,
+        pixels: PixelBuffer = None,
     ):
         super().__init__()
         self.interface = interface
@@ -47,6 +51,19 @@ class Image(LoggedObject):
         elif data:
             self._action("load image data", data=data)
             self.native = DummyImage(PIL.Image.open(BytesIO(data)))
+        elif pixels:
+            self._action("load image pixels", pixels=pixels)
+            self.native = DummyImage(
+                PIL.Image.frombuffer(
+                    "RGBA",
+                    pixels.size,
+                    pixels.data,
+                    "raw",
+                    RAW_MODES[pixels.format],
+                    pixels.stride,
+                    1,
+                )
+            )
         else:
             self._action("load image from raw")
             self.native = raw
@@ -64,5 +81,12 @@ class Image(LoggedObject):
     def get_data(self):
         return self.native.data
 
+    def get_pixels(self):
+        if self.native.raw is None:
+            image = PIL.Image.new("RGBA", (60, 40))
+        else:
+            image = self.native.raw.convert("RGBA")
+        return PixelBuffer(image.tobytes(), *image.size)
+
     def save(self, path):
         self._action("save", path=path)
@@ -1,7 +1,10 @@
 from pathlib import Path
 
+import PIL.Image
+
 import toga_dummy
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE
+from toga.images import PixelBuffer
 
 from .base import Widget
 
@@ -9,11 +12,48 @@ from .base import Widget
 class Canvas(Widget):
     def create(self):
         self._action("create Canvas")
+        # The number of times the canvas has been invalidated.
+        self.redraw_count = 0
+        # Cached layers, keyed by context; each value is a tuple of the version and
+        # drawing arguments of the context, and the instructions that were rendered.
+        self._layers = {}
+        self._drawn_layers = {}
 
     def redraw(self):
+        # Like a native canvas, a redraw only invalidates the canvas; the content is
+        # rendered when the canvas is painted.
         self._action("redraw")
-        self.draw_instructions = []
-        self.interface.context._draw(self, draw_instructions=self.draw_instructions)
+        self.redraw_count += 1
+
+    def simulate_paint(self):
+        """Paint the canvas, returning the instructions that were drawn."""
+        draw_instructions = []
+        self._drawn_layers = {}
+        self.interface.context._draw(self, draw_instructions=draw_instructions)
+        # Discard any cached layer that is no longer part of the canvas.
+        self._layers = self._drawn_layers
+        return draw_instructions
+
+    @property
+    def draw_instructions(self):
+        """The instructions drawn when the canvas is painted in its current state."""
+        return self.simulate_paint()
+
+    # Cached layers
+    def draw_layer(self, layer, version, draw_instructions, **kwargs):
+        key = (version, kwargs)
+        try:
+            cached_key, instructions = self._layers[layer]
+        except KeyError:
+            cached_key = instructions = None
+
+        if cached_key != key:
+            self._action("render layer", layer=layer)
+            instructions = []
+            layer._draw_layer(self, draw_instructions=instructions, **kwargs)
+
+        self._drawn_layers[layer] = (key, instructions)
+        draw_instructions.extend(instructions)
 
     # Context management
     def push_context(self, draw_instructions, **kwargs):
@@ -159,6 +199,20 @@ class Canvas(Widget):
             )
         )
 
+    def polyline(self, points, closed, draw_instructions, **kwargs):
+        draw_instructions.append(
+            (
+                "polyline",
+                dict(
+                    **{
+                        "points": points,
+                        "closed": closed,
+                    },
+                    **kwargs,
+                ),
+            )
+        )
+
     # Drawing Paths
     def fill(self, color, fill_rule, draw_instructions, **kwargs):
         draw_instructions.append(
@@ -243,6 +297,10 @@ class Canvas(Widget):
 
         return width, height
 
+    def text_ascent(self, font):
+        # Assume the ascent is 3/4 of the height of a line.
+        return self.measure_text("", font)[1] * 0.75
+
     # Image
 
     def get_image_data(self):
@@ -251,6 +309,14 @@ class Canvas(Widget):
         path = Path(toga_dummy.__file__).parent / "resources/toga.png"
         return path.read_bytes()
 
+    def get_image_pixels(self):
+        """Return the pixels of the Toga logo as the rendered canvas."""
+        self._action("get image pixels")
+        path = Path(toga_dummy.__file__).parent / "resources/toga.png"
+        with PIL.Image.open(path) as image:
+            image = image.convert("RGBA")
+        return PixelBuffer(image.tobytes(), *image.size)
+
     # Resize handlers
 
     def simulate_resize(self):
@@ -12,6 +12,12 @@ class DetailedList(Widget):
     def insert(self, index, item):
         self._action("insert item", index=index, item=item)
 
+    def insert_range(self, index, items):
+        self._action("insert items", index=index, items=items)
+
+    def reset(self):
+        self._action("reset")
+
     def change(self, item):
         self._action("change item", item=item)
 
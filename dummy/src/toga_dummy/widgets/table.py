@@ -12,6 +12,12 @@ class Table(Widget):
     def insert(self, index, item):
         self._action("insert row", index=index, item=item)
 
+    def insert_range(self, index, items):
+        self._action("insert rows", index=index, items=items)
+
+    def reset(self):
+        self._action("reset")
+
     def change(self, item):
         self._action("change row", item=item)
 
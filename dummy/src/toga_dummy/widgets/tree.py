@@ -44,6 +44,8 @@ class Tree(Widget):
 
     def expand_node(self, node):
         self._action("expand node", node=node)
+        # Children that haven't been loaded are loaded when the node is expanded.
+        node.load_children()
 
     def expand_all(self):
         self._action("expand all")
@@ -1,8 +1,11 @@
 import asyncio
 from pathlib import Path
 
+import PIL.Image
+
 import toga_dummy
 from toga.constants import WindowState
+from toga.images import PixelBuffer
 from toga.types import Size
 from toga.window import _initial_position
 
@@ -42,6 +45,8 @@ class Container:
 
     def refreshed(self):
         if self.content:
+            # Record that the layout of the content has been recomputed.
+            self.content._action("layout refreshed")
             self.content.refresh()
 
 
@@ -151,6 +156,13 @@ class Window(LoggedObject):
         path = Path(toga_dummy.__file__).parent / "resources/screenshot.png"
         return path.read_bytes()
 
+    def get_image_pixels(self):
+        self._action("get image pixels")
+        path = Path(toga_dummy.__file__).parent / "resources/screenshot.png"
+        with PIL.Image.open(path) as image:
+            image = image.convert("RGBA")
+        return PixelBuffer(image.tobytes(), *image.size)
+
     ######################################################################
     # Simulation interface
     ######################################################################
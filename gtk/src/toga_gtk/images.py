@@ -1,12 +1,14 @@
 from pathlib import Path
 
-from toga_gtk.libs import GdkPixbuf, Gio, GLib
+from toga.constants import PixelFormat
+from toga.images import PixelBuffer
+from toga_gtk.libs import Gdk, GdkPixbuf, Gio, GLib, cairo
 
 
 class Image:
     RAW_TYPE = GdkPixbuf.Pixbuf
 
-    def __init__(self, interface, path=None, data=None, raw=None):
+    def __init__(self, interface, path=None, data=None, raw=None, pixels=None):
         self.interface = interface
 
         if path:
@@ -20,9 +22,43 @@ class Image:
                 self.native = GdkPixbuf.Pixbuf.new_from_stream(input_stream, None)
             except GLib.GError:
                 raise ValueError("Unable to load image from data")
+        elif pixels:
+            self.native = self._pixbuf_from_pixels(pixels)
         else:
             self.native = raw
 
+    @staticmethod
+    def _pixbuf_from_pixels(pixels):
+        width, height = pixels.size
+        if pixels.format == PixelFormat.ARGB32:
+            # Cairo's premultiplied format must be converted into the layout that
+            # GdkPixbuf uses; Gdk does this directly, without any image encoding.
+            # Cairo requires a writable buffer.
+            data = pixels.data
+            if data.readonly:
+                data = bytearray(data)
+            surface = cairo.ImageSurface.create_for_data(
+                data, cairo.FORMAT_ARGB32, width, height, pixels.stride
+            )
+            return Gdk.pixbuf_get_from_surface(surface, 0, 0, width, height)
+
+        # GdkPixbuf needs the data in GLib.Bytes, which makes its own copy of the
+        # data. If the pixels are already a bytes object, that is the only copy;
+        # otherwise, the pixels must first be copied into a bytes object.
+        data = pixels.data.obj
+        if not isinstance(data, bytes) or len(data) != pixels.data.nbytes:
+            data = pixels.data.tobytes()
+
+        return GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(data),
+            GdkPixbuf.Colorspace.RGB,
+            True,
+            8,
+            width,
+            height,
+            pixels.stride,
+        )
+
     def get_width(self):
         return self.native.get_width()
 
@@ -38,6 +74,17 @@ class Image:
             # in test conditions
             raise ValueError("Unable to get PNG data for image")
 
+    def get_pixels(self):
+        pixbuf = self.native
+        if not pixbuf.get_has_alpha():
+            pixbuf = pixbuf.add_alpha(False, 0, 0, 0)
+        return PixelBuffer(
+            pixbuf.read_pixel_bytes().get_data(),
+            pixbuf.get_width(),
+            pixbuf.get_height(),
+            pixbuf.get_rowstride(),
+        )
+
     def save(self, path):
         path = Path(path)
         try:
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from io import BytesIO
 from math import ceil
@@ -5,13 +6,19 @@ from math import ceil
 from travertino.size import at_least
 
 from toga import Font
-from toga.constants import Baseline, FillRule
+from toga.constants import Baseline, FillRule, PixelFormat
 from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE
+from toga.images import PixelBuffer
 from toga_gtk.colors import native_color
 from toga_gtk.libs import Gdk, Gtk, Pango, PangoCairo, cairo
 
 from .base import Widget
 
+# The maximum number of fonts for which a Pango context and metrics will be retained.
+FONT_CONTEXT_CACHE_SIZE = 32
+# The maximum number of laid out lines of text that will be retained.
+TEXT_LAYOUT_CACHE_SIZE = 1024
+
 
 class Canvas(Widget):
     def create(self):
@@ -23,7 +30,22 @@ class Canvas(Widget):
 
         self.native = Gtk.DrawingArea()
 
+        # Cached layers, keyed by context; each value is a tuple of the key describing
+        # the conditions under which the layer was rendered, and the rendered surface.
+        self._layers = {}
+        # Has a redraw been queued since the canvas was last drawn?
+        self._redraw_queued = False
+
+        # Pango contexts and font metrics, keyed by font; and laid out lines of text,
+        # keyed by font and text. Both are in least-recently-used order.
+        self._font_contexts = OrderedDict()
+        self._text_layouts = OrderedDict()
+
         self.native.connect("draw", self.gtk_draw_callback)
+        # Text is laid out using the font settings of the screen and style; if they
+        # change, any cached text layouts are out of date.
+        self.native.connect("screen-changed", self.gtk_on_text_settings_changed)
+        self.native.connect("style-updated", self.gtk_on_text_settings_changed)
         self.native.connect("size-allocate", self.gtk_on_size_allocate)
         self.native.connect("button-press-event", self.mouse_down)
         self.native.connect("button-release-event", self.mouse_up)
@@ -42,6 +64,7 @@ class Canvas(Widget):
         canvas and cairo_context function arguments. This method calls the draw method
         on the interface Canvas to draw the objects.
         """
+        self._redraw_queued = False
 
         # Explicitly render the background
         sc = self.native.get_style_context()
@@ -57,8 +80,28 @@ class Canvas(Widget):
         cairo_context.rectangle(0, 0, width, height)
         cairo_context.fill()
 
+        # If only part of the canvas has been exposed, objects that are entirely
+        # outside the exposed region don't need to be drawn.
+        left, top, right, bottom = cairo_context.clip_extents()
+        if left <= 0 and top <= 0 and right >= width and bottom >= height:
+            clip = None
+        else:
+            clip = (left, top, right, bottom)
+
         self.original_transform_matrix = cairo_context.get_matrix()
-        self.interface.context._draw(self, cairo_context=cairo_context)
+        self._drawn_layers = {}
+        self.interface.context._draw(self, clip=clip, cairo_context=cairo_context)
+        if clip is None:
+            # Discard any cached layer that is no longer part of the canvas.
+            self._layers = self._drawn_layers
+        else:
+            # Layers outside the exposed region weren't drawn, but are still part of
+            # the canvas.
+            self._layers.update(self._drawn_layers)
+
+    def gtk_on_text_settings_changed(self, widget, *args):
+        self._font_contexts.clear()
+        self._text_layouts.clear()
 
     def gtk_on_size_allocate(self, widget, allocation):
         """Called on widget resize, and calls the handler set on the interface, if
@@ -93,7 +136,61 @@ class Canvas(Widget):
             pass
 
     def redraw(self):
-        self.native.queue_draw()
+        # Any number of changes between frames only need to invalidate the widget
+        # once; the draw callback will render the current state of the canvas.
+        if not self._redraw_queued:
+            self._redraw_queued = True
+            self.native.queue_draw()
+
+    # Cached layers
+    def draw_layer(self, layer, version, cairo_context, **kwargs):
+        # Layers are rendered in the coordinate space of the widget, so the layer needs
+        # to be re-rendered if the transform that applies to the layer changes.
+        original_matrix = self.original_transform_matrix
+        inverse_matrix = cairo.Matrix(*original_matrix)
+        inverse_matrix.invert()
+        layer_matrix = cairo_context.get_matrix().multiply(inverse_matrix)
+
+        allocation = self.native.get_allocation()
+        scale = self.native.get_scale_factor()
+        key = (
+            version,
+            tuple(layer_matrix),
+            allocation.width,
+            allocation.height,
+            scale,
+            kwargs,
+        )
+        try:
+            cached_key, surface = self._layers[layer]
+        except KeyError:
+            cached_key = surface = None
+
+        if cached_key != key:
+            surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32,
+                allocation.width * scale,
+                allocation.height * scale,
+            )
+            surface.set_device_scale(scale, scale)
+            layer_context = cairo.Context(surface)
+            layer_context.set_matrix(layer_matrix)
+
+            # Inside the layer, resetting the transform returns to the coordinate space
+            # of the widget, which is the identity transform of the layer surface.
+            self.original_transform_matrix = cairo.Matrix()
+            try:
+                layer._draw_layer(self, cairo_context=layer_context, **kwargs)
+            finally:
+                self.original_transform_matrix = original_matrix
+
+        self._drawn_layers[layer] = (key, surface)
+
+        cairo_context.save()
+        cairo_context.set_matrix(original_matrix)
+        cairo_context.set_source_surface(surface, 0, 0)
+        cairo_context.paint()
+        cairo_context.restore()
 
     # Context management
     def push_context(self, cairo_context, **kwargs):
@@ -178,6 +275,16 @@ class Canvas(Widget):
     def rect(self, x, y, width, height, cairo_context, **kwargs):
         cairo_context.rectangle(x, y, width, height)
 
+    def polyline(self, points, closed, cairo_context, **kwargs):
+        if points:
+            coordinates = iter(points)
+            cairo_context.move_to(next(coordinates), next(coordinates))
+            line_to = cairo_context.line_to
+            for x, y in zip(coordinates, coordinates):
+                line_to(x, y)
+            if closed:
+                cairo_context.close_path()
+
     # Drawing Paths
 
     def fill(self, color, fill_rule, cairo_context, **kwargs):
@@ -222,8 +329,7 @@ class Canvas(Widget):
     # No need to check whether Pango or PangoCairo are None, because if they were, the
     # user would already have received an exception when trying to create a Font.
     def _text_path(self, text, x, y, font, baseline, cairo_context):
-        pango_context = self._pango_context(font)
-        metrics = self._font_metrics(pango_context)
+        metrics = self._font_context(font)[1]
         lines = text.splitlines()
         total_height = metrics.line_height * len(lines)
 
@@ -237,12 +343,52 @@ class Canvas(Widget):
             # Default to Baseline.ALPHABETIC
             top = y
 
-        layout = Pango.Layout(pango_context)
         for line_num, line in enumerate(lines):
-            layout.set_text(line)
+            layout = self._text_layout(font, line)[0]
             cairo_context.move_to(x, top + (metrics.line_height * line_num))
             PangoCairo.layout_line_path(cairo_context, layout.get_line(0))
 
+    def _font_context(self, font):
+        """Return the Pango context and metrics for a font.
+
+        The result is cached, so that repeatedly drawing or measuring text in the same
+        font doesn't require the font to be loaded again.
+        """
+        key = font.interface
+        try:
+            result = self._font_contexts[key]
+        except KeyError:
+            pango_context = self._pango_context(font)
+            result = (pango_context, self._font_metrics(pango_context))
+            self._font_contexts[key] = result
+            if len(self._font_contexts) > FONT_CONTEXT_CACHE_SIZE:
+                self._font_contexts.popitem(last=False)
+        else:
+            self._font_contexts.move_to_end(key)
+        return result
+
+    def _text_layout(self, font, line):
+        """Return a Pango layout for a single line of text, and the logical width of
+        that line.
+
+        The result is cached, so that text which is drawn on every frame (or measured,
+        then drawn) is only laid out once.
+        """
+        key = (font.interface, line)
+        try:
+            result = self._text_layouts[key]
+        except KeyError:
+            layout = Pango.Layout(self._font_context(font)[0])
+            layout.set_text(line)
+            ink, logical = layout.get_extents()
+            result = (layout, logical.width / Pango.SCALE)
+            self._text_layouts[key] = result
+            if len(self._text_layouts) > TEXT_LAYOUT_CACHE_SIZE:
+                self._text_layouts.popitem(last=False)
+        else:
+            self._text_layouts.move_to_end(key)
+        return result
+
     def _pango_context(self, font):
         # TODO: detect the actual default family and size (see tests_backend/fonts.py).
         if font.interface.size == SYSTEM_DEFAULT_FONT_SIZE:
@@ -270,21 +416,17 @@ class Canvas(Widget):
         return FontMetrics(ascent, descent, line_height)
 
     def measure_text(self, text, font):
-        pango_context = self._pango_context(font)
-        layout = Pango.Layout(pango_context)
-
-        widths = []
-        for line in text.splitlines():
-            layout.set_text(line)
-            ink, logical = layout.get_extents()
-            widths.append(logical.width / Pango.SCALE)
+        widths = [self._text_layout(font, line)[1] for line in text.splitlines()]
 
         return (
             ceil(max(width for width in widths)),
-            self._font_metrics(pango_context).line_height * len(widths),
+            self._font_context(font)[1].line_height * len(widths),
         )
 
-    def get_image_data(self):
+    def text_ascent(self, font):
+        return self._font_context(font)[1].ascent
+
+    def _render_surface(self):
         width = self.native.get_allocation().width
         height = self.native.get_allocation().height
 
@@ -292,11 +434,25 @@ class Canvas(Widget):
         context = cairo.Context(surface)
 
         self.native.draw(context)
+        surface.flush()
+        return surface
 
+    def get_image_data(self):
         data = BytesIO()
-        surface.write_to_png(data)
+        self._render_surface().write_to_png(data)
         return data.getbuffer()
 
+    def get_image_pixels(self):
+        # The pixel buffer wraps the memory of the surface, so no copy is made.
+        surface = self._render_surface()
+        return PixelBuffer(
+            surface.get_data(),
+            surface.get_width(),
+            surface.get_height(),
+            surface.get_stride(),
+            PixelFormat.ARGB32,
+        )
+
     # Rehint
     def rehint(self):
         # print(
@@ -217,6 +217,23 @@ class DetailedList(Widget):
         self.native_detailedlist.show_all()
         self.update_refresh_button()
 
+    def insert_range(self, index, items):
+        self.hide_actions()
+        # Splicing the rows in emits a single change notification for all of them.
+        self.store.splice(index, 0, [self.row_factory(item) for item in items])
+        self.native_detailedlist.show_all()
+        self.update_refresh_button()
+
+    def reset(self):
+        self.hide_actions()
+        self.store.splice(
+            0,
+            self.store.get_n_items(),
+            [self.row_factory(item) for item in self.interface.data],
+        )
+        self.native_detailedlist.show_all()
+        self.update_refresh_button()
+
     def change(self, item):
         item._impl.update(self.interface, item)
 
@@ -3,6 +3,7 @@ import warnings
 from travertino.size import at_least
 
 import toga
+from toga.sources import LazyListSource
 
 from ..libs import GdkPixbuf, GObject, Gtk
 from .base import Widget
@@ -40,6 +41,83 @@ class TogaRow(GObject.Object):
         return str(text)
 
 
+class LazyListModel(GObject.Object, Gtk.TreeModel):
+    """A tree model that retrieves the content of rows from a data source only when
+    GTK requests them.
+
+    This is used to display a :class:`~toga.sources.LazyListSource`; the content of a
+    cell is only computed when the row is displayed.
+    """
+
+    def __init__(self, table, types):
+        super().__init__()
+        self.table = table
+        self.types = types
+
+    def row(self, index):
+        return TogaRow(self.table.interface.data[index])
+
+    def do_get_flags(self):
+        return Gtk.TreeModelFlags.LIST_ONLY | Gtk.TreeModelFlags.ITERS_PERSIST
+
+    def do_get_n_columns(self):
+        return len(self.types)
+
+    def do_get_column_type(self, column):
+        return self.types[column]
+
+    def _iter(self, index):
+        if 0 <= index < len(self.table.interface.data):
+            iter = Gtk.TreeIter()
+            iter.user_data = index
+            return (True, iter)
+        return (False, None)
+
+    def do_get_iter(self, path):
+        indices = path.get_indices()
+        if len(indices) != 1:
+            return (False, None)
+        return self._iter(indices[0])
+
+    def do_get_path(self, iter):
+        return Gtk.TreePath(iter.user_data)
+
+    def do_get_value(self, iter, column):
+        row = self.row(iter.user_data)
+        if column == 0:
+            return row
+
+        accessor = self.table.interface.accessors[(column - 1) // 2]
+        if column % 2:
+            return row.icon(accessor)
+        return row.text(accessor, self.table.interface.missing_value)
+
+    def do_iter_next(self, iter):
+        return self._iter(iter.user_data + 1)
+
+    def do_iter_previous(self, iter):
+        return self._iter(iter.user_data - 1)
+
+    def do_iter_has_child(self, iter):
+        return False
+
+    def do_iter_n_children(self, iter):
+        if iter is None:
+            return len(self.table.interface.data)
+        return 0
+
+    def do_iter_nth_child(self, parent, n):
+        if parent is None:
+            return self._iter(n)
+        return (False, None)
+
+    def do_iter_children(self, parent):
+        return self.do_iter_nth_child(parent, 0)
+
+    def do_iter_parent(self, child):
+        return (False, None)
+
+
 class Table(Widget):
     def create(self):
         self.store = None
@@ -63,7 +141,7 @@ class Table(Widget):
         self.native.set_min_content_width(200)
         self.native.set_min_content_height(200)
 
-    def _create_columns(self):
+    def _create_columns(self, fixed_height=False):
         if self.interface.headings:
             headings = self.interface.headings
             self.native_table.set_headers_visible(True)
@@ -73,7 +151,11 @@ class Table(Widget):
 
         for i, heading in enumerate(headings):
             column = Gtk.TreeViewColumn(heading)
-            column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
+            if fixed_height:
+                # Autosized columns require GTK to measure every row in the model.
+                column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            else:
+                column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
             column.set_expand(True)
             column.set_resizable(True)
             column.set_min_width(16)
@@ -88,6 +170,10 @@ class Table(Widget):
 
             self.native_table.append_column(column)
 
+        # In fixed height mode, GTK assumes all rows are the same height as the first
+        # row, so only the rows that are visible need to be measured.
+        self.native_table.set_fixed_height_mode(fixed_height)
+
     def gtk_on_row_activated(self, widget, path, column):
         row = self.store[path][0].value
         self.interface.on_activate(row=row)
@@ -100,17 +186,22 @@ class Table(Widget):
         # updates by deferring row rendering until the update is complete.
         self.native_table.set_model(None)
 
+        lazy = isinstance(source, LazyListSource)
         for column in self.native_table.get_columns():
             self.native_table.remove_column(column)
-        self._create_columns()
+        self._create_columns(fixed_height=lazy)
 
         types = [TogaRow]
         for accessor in self.interface._accessors:
             types.extend([GdkPixbuf.Pixbuf, str])
-        self.store = Gtk.ListStore(*types)
 
-        for i, row in enumerate(self.interface.data):
-            self.insert(i, row)
+        if lazy:
+            # Rows are only retrieved from the source when they are displayed.
+            self.store = LazyListModel(self, types)
+        else:
+            self.store = Gtk.ListStore(*types)
+            for i, row in enumerate(self.interface.data):
+                self.insert(i, row)
 
         self.native_table.set_model(self.store)
         self.refresh()
@@ -128,8 +219,33 @@ class Table(Widget):
 
         self.store.insert(index, values)
 
+    def insert_range(self, index, items):
+        # The rows are inserted while the store is connected, as disconnecting it
+        # would lose the selection and scroll position. Property notifications from
+        # the table are deferred until every row has been inserted.
+        self.native_table.freeze_notify()
+        try:
+            for offset, item in enumerate(items):
+                self.insert(index + offset, item)
+        finally:
+            self.native_table.thaw_notify()
+
+    def reset(self):
+        self.native_table.set_model(None)
+        if not isinstance(self.store, LazyListModel):
+            self.store.clear()
+            for i, row in enumerate(self.interface.data):
+                self.insert(i, row)
+        self.native_table.set_model(self.store)
+
     def change(self, item):
         index = self.interface.data.index(item)
+        if isinstance(self.store, LazyListModel):
+            # The model will retrieve the new values when the row is redrawn.
+            path = Gtk.TreePath(index)
+            self.store.row_changed(path, self.store.get_iter(path))
+            return
+
         row = self.store[index]
         for i, accessor in enumerate(self.interface.accessors):
             row[i * 2 + 1] = row[0].icon(accessor)
@@ -143,13 +259,13 @@ class Table(Widget):
 
     def get_selection(self):
         if self.interface.multiple_select:
-            store, itrs = self.selection.get_selected_rows()
-            return [self.interface.data.index(store[itr][0].value) for itr in itrs]
+            store, paths = self.selection.get_selected_rows()
+            return [path.get_indices()[0] for path in paths]
         else:
             store, iter = self.selection.get_selected()
             if iter is None:
                 return None
-            return self.interface.data.index(store[iter][0].value)
+            return store.get_path(iter).get_indices()[0]
 
     def scroll_to_row(self, row):
         # Core API guarantees row exists, and there's > 1 row.
@@ -1,3 +1,6 @@
+import sys
+import traceback
+
 from travertino.size import at_least
 
 from ..libs import GdkPixbuf, Gtk
@@ -8,11 +11,18 @@ from .table import TogaRow
 class Tree(Widget):
     def create(self):
         self.store = None
+        # The placeholder rows for nodes whose children haven't been loaded.
+        self._placeholders = {}
+        # While rows are being expanded programmatically, the only node whose children
+        # can be loaded (if any). Expanding every row mustn't load the whole tree.
+        self._expanding = False
+        self._expand_target = None
 
         # Create a tree view, and put it in a scroll view.
         # The scroll view is the _impl, because it's the outer container.
         self.native_tree = Gtk.TreeView(model=self.store)
         self.native_tree.connect("row-activated", self.gtk_on_row_activated)
+        self.native_tree.connect("test-expand-row", self.gtk_on_test_expand_row)
 
         self.selection = self.native_tree.get_selection()
         if self.interface.multiple_select:
@@ -58,8 +68,39 @@ class Tree(Widget):
         self.interface.on_select()
 
     def gtk_on_row_activated(self, widget, path, column):
-        node = self.store[path][0].value
-        self.interface.on_activate(node=node)
+        row = self.store[path][0]
+        # Placeholder rows can't be activated
+        if row is not None:
+            self.interface.on_activate(node=row.value)
+
+    def gtk_on_test_expand_row(self, widget, iter, path):
+        # Load the node's children (if required) before it is expanded. When the
+        # children have been loaded, the placeholder row will be removed.
+        node = self.store[iter][0].value
+        if not getattr(node, "loaded", True):
+            if self._expanding and node is not self._expand_target:
+                # Don't expand the node, rather than showing its placeholder row.
+                return True
+
+            try:
+                task = node.load_children()
+            except Exception as e:
+                print("Error loading children:", e, file=sys.stderr)
+                traceback.print_exc()
+                return True
+
+            if task:
+                task.add_done_callback(lambda task: self._children_loaded(node))
+
+        # Allow the row to expand
+        return False
+
+    def _children_loaded(self, node):
+        # If the load failed (or was cancelled), the node is still unloaded. Collapse
+        # it, so that its placeholder row is hidden; expanding the node again will
+        # retry the load.
+        if not node.loaded and node._impl is not None:
+            self.native_tree.collapse_row(self.store.get_path(node._impl))
 
     def change_source(self, source):
         # Temporarily disconnecting the TreeStore improves performance for large
@@ -74,6 +115,7 @@ class Tree(Widget):
         for accessor in self.interface._accessors:
             types.extend([GdkPixbuf.Pixbuf, str])
         self.store = Gtk.TreeStore(*types)
+        self._placeholders = {}
 
         for i, row in enumerate(self.interface.data):
             self.insert(None, i, row)
@@ -102,36 +144,62 @@ class Tree(Widget):
         for i, child in enumerate(item):
             self.insert(item, i, child)
 
+        # Nodes from custom sources may not support lazy loading.
+        if not getattr(item, "loaded", True):
+            # Add a placeholder row so the node can be expanded. It is the last child,
+            # so the real children will be inserted before it as they are loaded.
+            placeholder = [None]
+            for accessor in self.interface.accessors:
+                placeholder.extend([None, self.interface.missing_value])
+            self._placeholders[item] = self.store.append(item._impl, placeholder)
+
     def change(self, item):
         row = self.store[item._impl]
         for i, accessor in enumerate(self.interface.accessors):
             row[i * 2 + 1] = row[0].icon(accessor)
             row[i * 2 + 2] = row[0].text(accessor, self.interface.missing_value)
 
+        if item in self._placeholders and item.loaded:
+            self.store.remove(self._placeholders.pop(item))
+
     def remove(self, item, index, parent):
         del self.store[item._impl]
         item._impl = None
+        self._placeholders.pop(item, None)
 
     def clear(self):
         self.store.clear()
+        self._placeholders = {}
 
     def get_selection(self):
         if self.interface.multiple_select:
             store, itrs = self.selection.get_selected_rows()
-            return [store[itr][0].value for itr in itrs]
+            # Placeholder rows aren't nodes
+            return [store[itr][0].value for itr in itrs if store[itr][0] is not None]
         else:
             store, iter = self.selection.get_selected()
-            if iter is None:
+            if iter is None or store[iter][0] is None:
                 return None
             return store[iter][0].value
 
     def expand_node(self, node):
-        self.native_tree.expand_row(
-            self.native_tree.get_model().get_path(node._impl), True
-        )
+        # The children of the node are loaded, but not those of its descendants.
+        self._expanding = True
+        self._expand_target = node
+        try:
+            self.native_tree.expand_row(
+                self.native_tree.get_model().get_path(node._impl), True
+            )
+        finally:
+            self._expanding = False
+            self._expand_target = None
 
     def expand_all(self):
-        self.native_tree.expand_all()
+        self._expanding = True
+        try:
+            self.native_tree.expand_all()
+        finally:
+            self._expanding = False
 
     def collapse_node(self, node):
         self.native_tree.collapse_row(self.native_tree.get_model().get_path(node._impl))
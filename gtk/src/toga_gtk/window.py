@@ -9,6 +9,7 @@ from toga.types import Position, Size
 from toga.window import _initial_position
 
 from .container import TogaContainer
+from .images import Image as ImageImpl
 from .libs import IS_WAYLAND, Gdk, GLib, Gtk
 from .screens import Screen as ScreenImpl
 
@@ -287,7 +288,7 @@ class Window:
     # Window capabilities
     ######################################################################
 
-    def get_image_data(self):
+    def _screenshot(self):
         display = self.native.get_display()
         display.flush()
 
@@ -301,7 +302,7 @@ class Window:
 
         screen = display.get_default_screen()
         root_window = screen.get_root_window()
-        screenshot = Gdk.pixbuf_get_from_window(
+        return Gdk.pixbuf_get_from_window(
             root_window,
             origin.x + allocation.x,
             origin.y + allocation.y,
@@ -309,7 +310,8 @@ class Window:
             allocation.height,
         )
 
-        success, buffer = screenshot.save_to_bufferv("png")
+    def get_image_data(self):
+        success, buffer = self._screenshot().save_to_bufferv("png")
         if success:
             return buffer
         else:  # pragma: nocover
@@ -317,6 +319,9 @@ class Window:
             # in test conditions
             raise ValueError(f"Unable to generate screenshot of {self}")
 
+    def get_image_pixels(self):
+        return ImageImpl(interface=None, raw=self._screenshot()).get_pixels()
+
 
 class MainWindow(Window):
     def create(self):
@@ -2,7 +2,7 @@ from io import BytesIO
 
 from PIL import Image
 
-from toga_gtk.libs import IS_WAYLAND, Gdk, Gtk
+from toga_gtk.libs import IS_WAYLAND, Gdk, Gtk, cairo
 
 from .base import SimpleProbe
 
@@ -24,6 +24,33 @@ class CanvasProbe(SimpleProbe):
     def get_image(self):
         return Image.open(BytesIO(self.impl.get_image_data()))
 
+    def get_clipped_image(self, x, y, width, height):
+        # Draw the canvas with a clip region, as GTK does when only part of the widget
+        # has been exposed.
+        allocation = self.native.get_allocation()
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, allocation.width, allocation.height
+        )
+        context = cairo.Context(surface)
+        context.rectangle(x, y, width, height)
+        context.clip()
+        self.native.draw(context)
+        surface.flush()
+
+        data = BytesIO()
+        surface.write_to_png(data)
+        return Image.open(data).crop((x, y, x + width, y + height))
+
+    @property
+    def cached_text_layouts(self):
+        return len(self.impl._text_layouts)
+
+    def cached_layer(self, context):
+        try:
+            return self.impl._layers[context][1]
+        except KeyError:
+            return None
+
     async def mouse_press(self, x, y):
         event = Gdk.Event.new(Gdk.EventType.BUTTON_PRESS)
         event.button = 1
@@ -9,6 +9,7 @@ class TableProbe(SimpleProbe):
     native_class = Gtk.ScrolledWindow
     supports_icons = 2  # All columns
     supports_keyboard_shortcuts = False
+    supports_lazy_rows = True
     supports_widgets = False
 
     def __init__(self, widget):
@@ -44,7 +45,7 @@ class TableProbe(SimpleProbe):
             pytest.skip("GTK doesn't support widgets in Tables")
         else:
             gtk_row = self.native_table.get_model()[row]
-            assert gtk_row[col * 2 + 2]
+            assert gtk_row[col * 2 + 2] == value
 
             if icon:
                 assert gtk_row[col * 2 + 1] == icon._impl.native(16)
@@ -182,6 +182,17 @@ class Canvas(Widget):
         rectangle = CGRectMake(x, y, width, height)
         core_graphics.CGContextAddRect(draw_context, rectangle)
 
+    def polyline(self, points, closed, draw_context, **kwargs):
+        if points:
+            coordinates = iter(points)
+            core_graphics.CGContextMoveToPoint(
+                draw_context, next(coordinates), next(coordinates)
+            )
+            for x, y in zip(coordinates, coordinates):
+                core_graphics.CGContextAddLineToPoint(draw_context, x, y)
+            if closed:
+                core_graphics.CGContextClosePath(draw_context)
+
     # Drawing Paths
     def fill(self, color, fill_rule, draw_context, **kwargs):
         if fill_rule == FillRule.EVENODD:
@@ -268,6 +279,9 @@ class Canvas(Widget):
             self._line_height(font) * len(sizes),
         )
 
+    def text_ascent(self, font):
+        return font.native.ascender
+
     def write_text(self, text, x, y, font, baseline, **kwargs):
         lines = text.splitlines()
         line_height = self._line_height(font)
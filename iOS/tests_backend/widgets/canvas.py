@@ -33,6 +33,16 @@ class CanvasProbe(SimpleProbe):
     def get_image(self):
         return Image.open(BytesIO(self.impl.get_image_data()))
 
+    def get_clipped_image(self, x, y, width, height):
+        pytest.skip("Partial redraws can't be captured on this backend")
+
+    # Text layouts aren't cached on this backend.
+    cached_text_layouts = None
+
+    def cached_layer(self, context):
+        # Cached contexts are drawn directly on this backend.
+        return None
+
     async def mouse_press(self, x, y):
         touch = MockTouch.alloc().init()
         touches = NSSet.setWithObject(touch)
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import pytest
+
+from toga.jobs import cancel_requested, report_progress
+
+# Jobs are run in a worker process on desktop platforms, and in a worker thread on
+# platforms that can't start a new process; so the functions run by these tests must
+# be defined at the top level of the module.
+
+
+def count(limit):
+    for value in range(limit):
+        report_progress(value)
+    return limit
+
+
+def fail():
+    raise ValueError("Job failed")
+
+
+def wait_for_cancel():
+    # Don't wait forever if the cancellation never arrives.
+    deadline = time.monotonic() + 10
+    while not cancel_requested() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return "finished"
+
+
+async def test_run_job(app):
+    """A job runs in the background, and reports its progress to the app"""
+    progress = []
+
+    def on_progress(job, value, **kwargs):
+        progress.append(value)
+
+    job = app.run_job(count, 5, on_progress=on_progress)
+    assert await job == 5
+    assert progress == [0, 1, 2, 3, 4]
+    assert job.done
+    assert not job.cancelled
+
+
+async def test_job_error(app):
+    """An exception raised by a job is raised when the job is awaited"""
+    job = app.run_job(fail)
+    with pytest.raises(ValueError, match=r"Job failed"):
+        await job
+
+
+async def test_cancel_job(app):
+    """A running job can be cancelled"""
+    job = app.run_job(wait_for_cancel)
+    assert job.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await job
+    assert job.cancelled
+
+    # Jobs can still be run after a job has been cancelled.
+    assert await app.run_job(count, 2) == 2
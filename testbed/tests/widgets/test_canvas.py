@@ -1,5 +1,7 @@
 import math
 import os
+from array import array
+from io import BytesIO
 from math import pi, radians
 from unittest.mock import Mock, call
 
@@ -19,6 +21,7 @@ from toga.colors import (
 )
 from toga.constants import Baseline, FillRule
 from toga.fonts import BOLD
+from toga.images import PixelBuffer
 from toga.style.pack import SYSTEM, Pack
 
 from .conftest import build_cleanup_test
@@ -243,6 +246,48 @@ async def test_image_data(canvas, probe):
     )
 
 
+async def test_image_pixels(canvas, probe):
+    "The canvas can be captured without encoding the image"
+    canvas.style.background_color = TRANSPARENT
+    with canvas.Fill(color=REBECCAPURPLE) as fill:
+        fill.rect(20, 20, 120, 120)
+    with canvas.Fill(color=rgba(0x33, 0x66, 0x99, 0.5)) as fill:
+        fill.rect(60, 60, 120, 120)
+    await probe.redraw("Test image has been drawn")
+
+    # The backend's encoded image is the reference for the capture.
+    reference = Image.open(BytesIO(canvas._impl.get_image_data())).convert("RGBA")
+
+    # Where the backend can provide raw pixels, they are used to create the image.
+    image = canvas.as_image(Image.Image)
+    assert image.mode == "RGBA"
+    assert image.size == reference.size
+    assert image_rmse(image, reference) == pytest.approx(0, abs=0.01)
+
+    if hasattr(canvas._impl, "get_image_pixels"):
+        pixels = canvas.as_image(PixelBuffer)
+        assert pixels.size == reference.size
+        assert image_rmse(toga.Image(pixels).as_format(Image.Image), reference) == (
+            pytest.approx(0, abs=0.01)
+        )
+
+
+def image_rmse(image, reference):
+    """Compute the RMS error between an image and a reference image of the same size,
+    over every pixel in 0-1 RGBA colorspace."""
+    total = 0.0
+    for y in range(0, reference.size[1]):
+        for x in range(0, reference.size[0]):
+            actual = image.getpixel((x, y))
+            expected = reference.getpixel((x, y))
+
+            for act, exp in zip(actual, expected):
+                err = (act / 255) - (exp / 255)
+                total += err * err
+
+    return math.sqrt(total / (reference.size[0] * reference.size[1]))
+
+
 def assert_reference(probe, reference, threshold=0.0):
     """Assert that the canvas currently matches a reference image, within an
     RMS threshold"""
@@ -264,19 +309,7 @@ def assert_reference(probe, reference, threshold=0.0):
     # If a reference image exists, scale the image to the same size as the reference,
     # and do an MSE comparison on every pixel in 0-1 RGBA colorspace.
     if path.exists():
-        reference_image = Image.open(path)
-
-        total = 0.0
-        for y in range(0, reference_image.size[1]):
-            for x in range(0, reference_image.size[0]):
-                actual = scaled_image.getpixel((x, y))
-                expected = reference_image.getpixel((x, y))
-
-                for act, exp in zip(actual, expected):
-                    err = (act / 255) - (exp / 255)
-                    total += err * err
-
-        rmse = math.sqrt(total / (reference_image.size[0] * reference_image.size[1]))
+        rmse = image_rmse(scaled_image, Image.open(path))
         # If the delta exceeds threshold, save the test image and fail the test.
         if rmse > threshold:
             save()
@@ -286,6 +319,92 @@ def assert_reference(probe, reference, threshold=0.0):
         pytest.fail(f"Couldn't find {reference_variant!r} reference image")
 
 
+async def assert_uncached_matches(canvas, probe, context, message):
+    """Assert that the canvas is drawn the same way when a context isn't cached."""
+    await probe.redraw(message)
+    cached_image = probe.get_image()
+
+    context.cached = False
+    canvas.redraw()
+    await probe.redraw(f"{message}, without caching")
+    assert image_rmse(probe.get_image(), cached_image) == pytest.approx(0, abs=0.01)
+
+    context.cached = True
+    canvas.redraw()
+
+
+async def test_cached_context(canvas, probe):
+    "A cached context is drawn the same as an uncached context"
+    with canvas.Context() as outer:
+        translate = outer.translate(0, 0)
+        with outer.Context(cached=True) as layer:
+            with layer.Fill(color=REBECCAPURPLE) as fill:
+                fill.rect(20, 20, 80, 80)
+            with layer.Stroke(color=GOLDENROD, line_width=4) as stroke:
+                stroke.ellipse(60, 60, 30, 20)
+    with canvas.Stroke(color=CORNFLOWERBLUE, line_width=4) as outside:
+        outside.move_to(10, 190)
+        outside.line_to(190, 120)
+
+    await assert_uncached_matches(canvas, probe, layer, "Cached context is drawn")
+
+    await probe.redraw("Cached context has been rendered")
+    probe.get_image()
+    rendered = probe.cached_layer(layer)
+
+    # Changing content outside the cached context doesn't render the context again.
+    outside.color = RED
+    canvas.redraw()
+    await probe.redraw("Content outside the cached context has changed")
+    probe.get_image()
+    assert probe.cached_layer(layer) is rendered
+
+    # Changing the content of the cached context renders the context again.
+    fill.color = CORNFLOWERBLUE
+    canvas.redraw()
+    await assert_uncached_matches(
+        canvas, probe, layer, "Content of the cached context has changed"
+    )
+    if rendered is not None:
+        probe.get_image()
+        assert probe.cached_layer(layer) is not rendered
+
+    # Changing the transform that applies to the cached context renders it again.
+    translate.tx = 60
+    canvas.redraw()
+    await assert_uncached_matches(canvas, probe, layer, "Cached context has been moved")
+
+
+async def test_objects_at(canvas, probe):
+    "Drawing objects can be found by their position, and redrawn in part"
+    font = Font(SYSTEM, 14)
+    with canvas.Fill(color=REBECCAPURPLE) as fill:
+        rect = fill.rect(20, 20, 60, 60)
+    with canvas.Stroke(color=CORNFLOWERBLUE, line_width=4) as stroke:
+        line = stroke.polyline([120, 20, 180, 80])
+    with canvas.Fill() as text_fill:
+        text = text_fill.write_text("Hello", 20, 150, font, Baseline.TOP)
+        descender = text_fill.write_text("gy", 120, 150, font)
+    await probe.redraw("Objects have been drawn")
+
+    assert canvas.objects_at(50, 50) == [rect, fill]
+    assert canvas.objects_at(150, 50) == [line, stroke]
+    # The extent of text is measured by the backend.
+    width, height = canvas.measure_text("Hello", font)
+    assert canvas.objects_at(20 + width / 2, 150 + height / 2) == [text, text_fill]
+    # Text on an alphabetic baseline includes its descenders.
+    assert canvas.objects_at(125, 152) == [descender, text_fill]
+    assert canvas.objects_at(190, 190) == []
+    assert canvas.objects_in(0, 0, 200, 100) == [line, stroke, rect, fill]
+
+    # Redrawing part of the canvas draws the same content in that part.
+    full_image = probe.get_image()
+    assert image_rmse(
+        probe.get_clipped_image(10, 10, 80, 80),
+        full_image.crop((10, 10, 90, 90)),
+    ) == pytest.approx(0, abs=0.01)
+
+
 async def test_transparency(canvas, probe):
     "Transparency is preserved in captured images"
     canvas.style.background_color = TRANSPARENT
@@ -344,6 +463,40 @@ async def test_paths(canvas, probe):
     assert_reference(probe, "paths", threshold=0.04)
 
 
+async def test_polyline(canvas, probe):
+    "A polyline is drawn the same as a sequence of lines"
+    zigzag = [(20 + 20 * i, 80 if i % 2 else 20) for i in range(9)]
+    triangle = array("d", [40, 120, 160, 120, 100, 180])
+
+    with canvas.Stroke(color=REBECCAPURPLE, line_width=4) as stroke:
+        stroke.polyline(zigzag)
+    with canvas.Fill(color=CORNFLOWERBLUE) as fill:
+        fill.polyline(triangle, closed=True)
+    with canvas.Stroke(color=GOLDENROD, line_width=2) as stroke:
+        stroke.polyline(triangle, closed=True)
+
+    await probe.redraw("Polylines have been drawn")
+    polyline_image = probe.get_image()
+
+    canvas.context.clear()
+    with canvas.Stroke(color=REBECCAPURPLE, line_width=4) as stroke:
+        stroke.move_to(*zigzag[0])
+        for point in zigzag[1:]:
+            stroke.line_to(*point)
+    for context in [
+        canvas.Fill(color=CORNFLOWERBLUE),
+        canvas.Stroke(color=GOLDENROD, line_width=2),
+    ]:
+        with context as path:
+            path.move_to(40, 120)
+            path.line_to(160, 120)
+            path.line_to(100, 180)
+            path.close_path()
+
+    await probe.redraw("Equivalent lines have been drawn")
+    assert image_rmse(probe.get_image(), polyline_image) == pytest.approx(0, abs=0.01)
+
+
 async def test_bezier_curve(canvas, probe):
     "A Bézier curve can be drawn"
 
@@ -699,6 +852,36 @@ async def test_write_text(canvas, probe):
     assert_reference(probe, "write_text", threshold=0.07)
 
 
+async def test_measure_text_repeatedly(canvas, probe):
+    "Text that is measured and drawn repeatedly is measured consistently"
+    font = Font(SYSTEM, 14)
+    size = canvas.measure_text("Hello", font)
+    assert canvas.measure_text("Hello", Font(SYSTEM, 14)) == size
+
+    bold_size = canvas.measure_text("Hello", Font(SYSTEM, 14, weight=BOLD))
+    assert bold_size[0] > size[0]
+    large_size = canvas.measure_text("Hello", Font(SYSTEM, 28))
+    assert large_size[0] > size[0]
+    assert large_size[1] > size[1]
+
+    for y in range(20, 200, 20):
+        canvas.context.write_text("Hello", 20, y, font)
+    await probe.redraw("Text has been drawn repeatedly")
+    layouts = probe.cached_text_layouts
+    assert canvas.measure_text("Hello", font) == size
+
+    # Drawing the same text again doesn't lay out the text again.
+    canvas.context.write_text("Hello", 100, 20, font)
+    await probe.redraw("Text has been drawn again")
+    probe.get_image()
+    assert probe.cached_text_layouts == layouts
+
+    # A style change may alter the font settings used to lay out text.
+    canvas.style.background_color = GOLDENROD
+    await probe.redraw("Canvas style has changed")
+    assert canvas.measure_text("Hello", font) == size
+
+
 @pytest.mark.xfail(
     condition=os.environ.get("RUNNING_IN_CI") != "true",
     reason="may fail outside of a GitHub runner environment",
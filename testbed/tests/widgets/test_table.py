@@ -4,7 +4,7 @@ from unittest.mock import Mock
 import pytest
 
 import toga
-from toga.sources import ListSource
+from toga.sources import LazyListSource, ListSource
 from toga.style.pack import Pack
 
 from ..conftest import skip_on_platforms
@@ -239,6 +239,61 @@ async def test_select(widget, probe, source, on_select_handler):
         assert widget.selection == source[2]
 
 
+async def test_insert_many(widget, probe, source):
+    """Inserting a range of rows retains the selection and scroll position"""
+    await probe.select_row(1)
+    await probe.redraw("Second row is selected")
+    selected = source[1]
+
+    widget.scroll_to_row(50)
+    await probe.wait_for_scroll_completion()
+    await probe.redraw("Table scrolled to mid row")
+
+    source.insert_many(0, [{"a": f"New{i}"} for i in range(10)])
+    await probe.redraw("Rows have been inserted at the start of the table")
+    assert len(source) == 110
+    probe.assert_cell_content(0, 0, "New0")
+    assert widget.selection == selected
+    assert probe.scroll_position > 0
+
+
+async def test_lazy_source(widget, probe, on_select_handler):
+    """A table can display a large source whose rows are retrieved on demand"""
+    if not probe.supports_lazy_rows:
+        pytest.skip("This backend retrieves every row of the source")
+
+    fetched = []
+
+    def fetch(start, stop):
+        fetched.append((start, stop))
+        return [{"a": f"A{i}", "b": f"B{i}", "c": f"C{i}"} for i in range(start, stop)]
+
+    source = LazyListSource(accessors=["a", "b", "c"], length=1_000_000, fetch=fetch)
+    widget.data = source
+    await probe.redraw("Table is displaying a lazy source")
+    assert probe.row_count == 1_000_000
+    probe.assert_cell_content(0, 0, "A0")
+    probe.assert_cell_content(0, 2, "C0")
+
+    widget.scroll_to_row(500_000)
+    await probe.wait_for_scroll_completion()
+    await probe.redraw("Table has been scrolled to the middle of the source")
+    probe.assert_cell_content(500_000, 1, "B500000")
+
+    await probe.select_row(500_000)
+    await probe.redraw("Middle row is selected")
+    assert widget.selection == source[500_000]
+    on_select_handler.assert_called_with(widget)
+
+    # Only the rows near the start and the middle of the source have been retrieved.
+    assert len(fetched) < 10
+
+    # A change to a row is displayed.
+    source[500_000].a = "Changed"
+    await probe.redraw("Middle row has been changed")
+    probe.assert_cell_content(500_000, 0, "Changed")
+
+
 async def test_activate(
     widget,
     probe,
@@ -1,10 +1,11 @@
+import asyncio
 import contextlib
 from unittest.mock import Mock
 
 import pytest
 
 import toga
-from toga.sources import TreeSource
+from toga.sources import LazyChildren, TreeSource
 from toga.style.pack import Pack
 
 from ..conftest import skip_on_platforms
@@ -219,6 +220,49 @@ async def test_select(widget, probe, source, on_select_handler):
         assert widget.selection == source[1][2][0]
 
 
+async def test_lazy_children(widget, probe, source):
+    """Children can be loaded when a node is expanded"""
+    loads = []
+
+    def loader(node):
+        loads.append(node.a)
+        return [({"a": f"{node.a} child"}, LazyChildren(loader))]
+
+    async def failing_loader(node):
+        loads.append(node.a)
+        raise OSError("Can't load children")
+
+    lazy = source.append({"a": "Lazy"}, children=LazyChildren(loader))
+    failing = source.append({"a": "Failing"}, children=LazyChildren(failing_loader))
+    await probe.redraw("Lazy nodes have been added")
+
+    # Expanding the whole tree doesn't load any children.
+    widget.expand()
+    await probe.redraw("Tree has been expanded")
+    assert loads == []
+    assert not probe.is_expanded(lazy)
+    assert probe.is_expanded(source[0])
+
+    # Expanding a node loads its children, but not those of its descendants.
+    widget.expand(lazy)
+    await probe.redraw("Lazy node has been expanded")
+    assert loads == ["Lazy"]
+    assert probe.is_expanded(lazy)
+    assert [child.a for child in lazy] == ["Lazy child"]
+    # The child is displayed in the tree.
+    assert probe.child_count((10,)) == 1
+    probe.assert_cell_content((10, 0), 0, "Lazy child")
+    assert not lazy[0].loaded
+
+    # If a load fails, the node is collapsed, and can be expanded again.
+    widget.expand(failing)
+    await probe.redraw("Failing node has been expanded")
+    await asyncio.sleep(0.1)
+    assert loads == ["Lazy", "Failing"]
+    assert not failing.loaded
+    assert not probe.is_expanded(failing)
+
+
 async def test_expand_collapse(widget, probe, source):
     """Nodes can be expanded and collapsed"""
 
@@ -4,6 +4,7 @@ import weakref
 from importlib import import_module
 from unittest.mock import Mock
 
+import PIL.Image
 import pytest
 
 import toga
@@ -969,3 +970,15 @@ async def test_as_image(main_window, main_window_probe):
         main_window_probe.content_size,
         screen=main_window.screen,
     )
+
+
+async def test_as_image_format(main_window, main_window_probe):
+    """The window can be captured as a screenshot in another image format"""
+
+    screenshot = main_window.as_image(PIL.Image.Image)
+    assert isinstance(screenshot, PIL.Image.Image)
+    main_window_probe.assert_image_size(
+        screenshot.size,
+        main_window_probe.content_size,
+        screen=main_window.screen,
+    )
@@ -258,6 +258,19 @@ class Canvas(Box):
         draw_context.current_path.AddRectangle(rect)
         draw_context.add_path()
 
+    def polyline(self, points, closed, draw_context, **kwargs):
+        if points:
+            self.move_to(points[0], points[1], draw_context)
+            if len(points) > 2:
+                coordinates = iter(points)
+                draw_context.current_path.AddLines(
+                    Array[PointF](
+                        [PointF(x, y) for x, y in zip(coordinates, coordinates)]
+                    )
+                )
+            if closed:
+                self.close_path(draw_context)
+
     # Drawing Paths
 
     def fill(self, color, fill_rule, draw_context, **kwargs):
@@ -339,6 +352,9 @@ class Canvas(Box):
             font.metric("LineSpacing") * len(sizes),
         )
 
+    def text_ascent(self, font):
+        return font.metric("CellAscent")
+
     def get_image_data(self):
         width, height = (self.native.Width, self.native.Height)
         bitmap = Bitmap(width, height)
@@ -182,6 +182,9 @@ class Window(Container, Scalable):
         for widget in self.interface.widgets:
             widget._impl.scale_font()
             widget._impl.refresh()
+            # The layout is in DPI-independent units, so the bounds of the widget may
+            # not change; but they must be re-applied at the new scale.
+            widget.applicator._bounds = None
 
         # Then do a single layout pass.
         if self.interface.content is not None:
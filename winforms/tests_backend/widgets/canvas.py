@@ -1,5 +1,6 @@
 from io import BytesIO
 
+import pytest
 from PIL import Image
 from System.Windows.Forms import MouseButtons, Panel
 
@@ -17,6 +18,16 @@ class CanvasProbe(SimpleProbe):
     def get_image(self):
         return Image.open(BytesIO(self.impl.get_image_data()))
 
+    def get_clipped_image(self, x, y, width, height):
+        pytest.skip("Partial redraws can't be captured on this backend")
+
+    # Text layouts aren't cached on this backend.
+    cached_text_layouts = None
+
+    def cached_layer(self, context):
+        # Cached contexts are drawn directly on this backend.
+        return None
+
     async def mouse_press(self, x, y, **kwargs):
         self.native.OnMouseDown(self.mouse_event(x, y, **kwargs))
         self.native.OnMouseUp(self.mouse_event(x, y, **kwargs))
@@ -16,6 +16,7 @@ class TableProbe(SimpleProbe):
     supports_icons = 1  # First column only
     supports_keyboard_shortcuts = False
     supports_keyboard_boundary_shortcuts = True
+    supports_lazy_rows = True
     supports_widgets = False
 
     @property